@@ -1,15 +1,18 @@
 import boa
 from moccasin.moccasin_account import MoccasinAccount
 from moccasin.boa_tools import VyperContract
-from moccasin.config import get_config
 from script import deploy_fund_me
-from src.mocks import mock_zk_token
 import time
+from utils.artifacts import load_contract
+from utils.async_rpc import RpcCall, transaction_call
 from utils.constants import (
     ANVIL_DICT_ADDRESSES,
     FUNDER_INITIAL_BALANCE_WEI,
     MINIMUM_FUNDING_AMOUNT_WEI,
 )
+from utils.tx_pipeline import SentTransaction, TransactionPipeline, network_pipeline
+
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
 
 # Define public addresses from the configuration
 ANVIL_OWNER_ADDRESS = ANVIL_DICT_ADDRESSES["owner"]["public"]
@@ -19,10 +22,10 @@ ANVIL_FUNDER_ALL_ADDRESS = ANVIL_DICT_ADDRESSES["funder_all"]["public"]
 ANVIL_FUNDER_NEW_ADDRESS = ANVIL_DICT_ADDRESSES["funder_new"]["public"]
 
 
-def deploy_contracts():
+def deploy_contracts(pipeline: TransactionPipeline):
     """Deploys FundMe and gets the ZK token contract."""
     with boa.env.prank(ANVIL_OWNER_ADDRESS):
-        fund_me_contract: VyperContract = deploy_fund_me.deploy()
+        fund_me_contract: VyperContract = deploy_fund_me.deploy(pipeline)
     zk_token_contract: VyperContract = mock_zk_token.at(
         fund_me_contract.get_zk_token_address()
     )
@@ -32,66 +35,165 @@ def deploy_contracts():
     return fund_me_contract, zk_token_contract
 
 
-def mint_zk_tokens(zk_token_contract: VyperContract):
+def mint_zk_tokens(zk_token_contract: VyperContract) -> list[RpcCall]:
     """Mints ZK tokens to predefined addresses."""
-    for address_conf in ANVIL_DICT_ADDRESSES.values():
-        # Add the address to the environment
-        boa.env.add_account(
-            MoccasinAccount(address_conf["private"]), FUNDER_INITIAL_BALANCE_WEI
-        )
-        # Mint ZK tokens to the address
-        zk_token_contract.mint(address_conf["public"], FUNDER_INITIAL_BALANCE_WEI)
-        print(
-            f"Minted {FUNDER_INITIAL_BALANCE_WEI} ZK tokens to {address_conf['public']}"
+    return [
+        transaction_call(
+            zk_token_contract,
+            "mint",
+            address_conf["public"],
+            FUNDER_INITIAL_BALANCE_WEI,
+            sender=ANVIL_OWNER_ADDRESS,
         )
+        for address_conf in ANVIL_DICT_ADDRESSES.values()
+    ]
 
 
-def fund_with_eth(fund_me_contract: VyperContract):
+def fund_with_eth(fund_me_contract: VyperContract) -> list[RpcCall]:
     """Funds the FundMe contract with ETH."""
-    with boa.env.prank(ANVIL_FUNDER_ETH_ADDRESS):
-        fund_me_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
-        print(
-            f"Funded {ANVIL_FUNDER_ETH_ADDRESS} with {MINIMUM_FUNDING_AMOUNT_WEI} wei (ETH) in the FundMe contract\n"
+    return [
+        transaction_call(
+            fund_me_contract,
+            "fund_eth",
+            sender=ANVIL_FUNDER_ETH_ADDRESS,
+            value=MINIMUM_FUNDING_AMOUNT_WEI,
         )
+    ]
 
 
 def fund_with_zk_tokens(
     fund_me_contract: VyperContract, zk_token_contract: VyperContract
-):
+) -> list[RpcCall]:
     """Funds the FundMe contract with ZK tokens."""
-    with boa.env.prank(ANVIL_FUNDER_ZK_ADDRESS):
-        zk_token_contract.approve(
+    return [
+        transaction_call(
+            zk_token_contract,
+            "approve",
             fund_me_contract.address,
             MINIMUM_FUNDING_AMOUNT_WEI,
-        )
-        fund_me_contract.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
-        print(
-            f"Funded {ANVIL_FUNDER_ZK_ADDRESS} with {MINIMUM_FUNDING_AMOUNT_WEI} ZK tokens in the FundMe contract"
-        )
+            sender=ANVIL_FUNDER_ZK_ADDRESS,
+        ),
+        transaction_call(
+            fund_me_contract,
+            "fund_zk_token",
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=ANVIL_FUNDER_ZK_ADDRESS,
+        ),
+    ]
 
 
 def fund_with_eth_and_zk_tokens(
     fund_me_contract: VyperContract, zk_token_contract: VyperContract
-):
+) -> list[RpcCall]:
     """Funds the FundMe contract with both ETH and ZK tokens."""
-    with boa.env.prank(ANVIL_FUNDER_ALL_ADDRESS):
-        zk_token_contract.approve(
+    return [
+        transaction_call(
+            zk_token_contract,
+            "approve",
             fund_me_contract.address,
             MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=ANVIL_FUNDER_ALL_ADDRESS,
+        ),
+        transaction_call(
+            fund_me_contract,
+            "fund",
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=ANVIL_FUNDER_ALL_ADDRESS,
+            value=MINIMUM_FUNDING_AMOUNT_WEI,
+        ),
+    ]
+
+
+def seed_funders(
+    fund_me_contract: VyperContract,
+    zk_token_contract: VyperContract,
+    funders: list[str],
+) -> tuple[list[RpcCall], list[RpcCall]]:
+    """Mints ZK tokens to each funder, which approves and funds with ETH and ZK.
+
+    Each funder's approve comes before its `fund`, but the fundings spend ZK
+    tokens minted by another sender, so they are sent once the mints are mined.
+    Funders must have ETH and be impersonated on anvil.
+
+    :returns: tuple: The mints, then the approves and fundings.
+    """
+    mints, fundings = [], []
+    for funder in funders:
+        mints.append(
+            transaction_call(
+                zk_token_contract,
+                "mint",
+                funder,
+                FUNDER_INITIAL_BALANCE_WEI,
+                sender=ANVIL_OWNER_ADDRESS,
+            )
         )
-        fund_me_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
-        fund_me_contract.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
-        print(
-            f"Funded {ANVIL_FUNDER_ALL_ADDRESS} with {MINIMUM_FUNDING_AMOUNT_WEI} wei (ETH) and ZK tokens in the FundMe contract"
-        )
+        fundings += [
+            transaction_call(
+                zk_token_contract,
+                "approve",
+                fund_me_contract.address,
+                MINIMUM_FUNDING_AMOUNT_WEI,
+                sender=funder,
+            ),
+            transaction_call(
+                fund_me_contract,
+                "fund",
+                MINIMUM_FUNDING_AMOUNT_WEI,
+                sender=funder,
+                value=MINIMUM_FUNDING_AMOUNT_WEI,
+            ),
+        ]
+    return mints, fundings
+
+
+def send_seeding(
+    pipeline: TransactionPipeline, calls: list[RpcCall]
+) -> list[SentTransaction]:
+    """Sends seeding transactions at once through the pipeline, none reverting."""
+    sent = pipeline.send_all(calls)
+    reverted = [transaction.tx_hash for transaction in sent if not transaction.succeeded]
+    assert not reverted, f"Seeding transactions reverted: {reverted}"
+    return sent
+
+
+def deploy_and_seed(fund: bool = True) -> tuple[VyperContract, VyperContract]:
+    """Deploys the contracts and mints ZK tokens to the predefined addresses.
+
+    :param fund: Whether FundMe is also funded, as by `moccasin_main`.
+    :returns: tuple: The FundMe and ZK token contracts.
+    """
+    pipeline = network_pipeline(
+        [MoccasinAccount(conf["private"]) for conf in ANVIL_DICT_ADDRESSES.values()]
+    )
+    try:
+        fund_me_contract, zk_token_contract = deploy_contracts(pipeline)
+        send_seeding(pipeline, mint_zk_tokens(zk_token_contract))
+        if fund:
+            send_seeding(
+                pipeline,
+                fund_with_eth(fund_me_contract)
+                + fund_with_zk_tokens(fund_me_contract, zk_token_contract)
+                + fund_with_eth_and_zk_tokens(fund_me_contract, zk_token_contract),
+            )
+    finally:
+        pipeline.close()
+    return fund_me_contract, zk_token_contract
 
 
 def moccasin_main():
-    """Main function to deploy contracts and fund them."""
-    fund_me_contract, zk_token_contract = deploy_contracts()
-    mint_zk_tokens(zk_token_contract)
-    fund_with_eth(fund_me_contract)
-    fund_with_zk_tokens(fund_me_contract, zk_token_contract)
-    fund_with_eth_and_zk_tokens(fund_me_contract, zk_token_contract)
-
-    return
+    """Main function to deploy contracts and fund them, see `deploy_and_seed`.
+
+    The mints, then the fundings, are sent at once through the transaction
+    pipeline, with their nonces pre-assigned per account.
+    """
+    start = time.perf_counter()
+    deploy_and_seed()
+    seconds = time.perf_counter() - start
+
+    print(
+        f"Minted {FUNDER_INITIAL_BALANCE_WEI} ZK tokens to {len(ANVIL_DICT_ADDRESSES)} addresses "
+        f"and funded the FundMe contract from {ANVIL_FUNDER_ETH_ADDRESS} (ETH), "
+        f"{ANVIL_FUNDER_ZK_ADDRESS} (ZK) and {ANVIL_FUNDER_ALL_ADDRESS} (ETH and ZK)"
+    )
+    print(f"Deployed and seeded in {seconds:.2f}s")
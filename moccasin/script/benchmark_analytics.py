@@ -0,0 +1,174 @@
+import boa
+import numpy as np
+import os
+import time
+
+from moccasin.boa_tools import VyperContract
+from script import deploy_fund_me
+from script.generate_state_dump import (
+    generate_funders,
+    plan_fundings,
+    prepare_funders,
+    send_funding,
+)
+from script.index_events import InMemoryLogSource, connect, index_events
+from typing import Callable
+from utils.analytics import (
+    EventColumns,
+    funder_totals,
+    join_amounts,
+    load_events,
+    period_split,
+    top_k,
+)
+from utils.artifacts import load_contract
+from utils.constants import (
+    ANALYTICS_BENCHMARK_EVENTS,
+    ANALYTICS_BLOCKS_PER_PERIOD,
+    ANALYTICS_SEED_FUNDINGS,
+    ANALYTICS_TOP_K,
+    INDEXED_EVENTS,
+    LOAD_TEST_FUNDERS,
+    LOAD_TEST_SEED,
+)
+
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+################################################################
+#                            DATASET                           #
+################################################################
+def seed_events(fund_me_contract: VyperContract, funding_count: int) -> EventColumns:
+    """Sends fundings through FundMe and loads the events they emitted.
+
+    A block is mined every 100 fundings so the events span many blocks.
+    """
+    zk_token_contract = mock_zk_token.at(fund_me_contract.get_zk_token_address())
+    funders = generate_funders(min(LOAD_TEST_FUNDERS, funding_count), LOAD_TEST_SEED)
+    prepare_funders(fund_me_contract, zk_token_contract, funders, boa.env.eoa)
+    source = InMemoryLogSource()
+    fundings = plan_fundings(funders, funding_count, LOAD_TEST_SEED)
+    with source.record():
+        for i, funding in enumerate(fundings):
+            send_funding(fund_me_contract, funding)
+            if i % 100 == 99:
+                boa.env.time_travel(blocks=1)
+        boa.env.time_travel(blocks=1)
+
+    connection = connect(":memory:")
+    try:
+        index_events(connection, fund_me_contract, source)
+        return load_events(connection, str(fund_me_contract.address))
+    finally:
+        connection.close()
+
+
+def tile_events(columns: EventColumns, event_count: int) -> EventColumns:
+    """Repeats the seeded events until there are `event_count` of them.
+
+    Each copy follows the previous one in block numbers and comes from its own
+    funders, so copies add funders instead of growing the seeded ones.
+    """
+    copies = -(-event_count // len(columns.event))
+    copy = np.repeat(np.arange(copies, dtype=np.uint64), len(columns.event))
+    block_span = int(columns.block_number.max()) + 1
+    accounts = [
+        f"{account}/{i}" if i else account
+        for i in range(copies)
+        for account in columns.accounts
+    ]
+    return EventColumns(
+        block_number=(np.tile(columns.block_number, copies) + copy * block_span)[
+            :event_count
+        ],
+        log_index=np.tile(columns.log_index, copies)[:event_count],
+        event=np.tile(columns.event, copies)[:event_count],
+        account=(
+            np.tile(columns.account, copies)
+            + (copy * len(columns.accounts)).astype(np.uint32)
+        )[:event_count],
+        amount=np.tile(columns.amount, (copies, 1))[:event_count],
+        accounts=accounts,
+    )
+
+
+################################################################
+#                        PYTHON LOOPS                          #
+################################################################
+def python_rows(columns: EventColumns) -> list[tuple[int, str, str, int]]:
+    """Converts the columns to `(block_number, event, account, amount)` rows."""
+    return [
+        (block_number, INDEXED_EVENTS[event], columns.accounts[account], amount)
+        for block_number, event, account, amount in zip(
+            columns.block_number.tolist(),
+            columns.event.tolist(),
+            columns.account.tolist(),
+            join_amounts(columns.amount),
+        )
+    ]
+
+
+def python_top_funders(rows: list[tuple[int, str, str, int]], k: int) -> list:
+    """Top `k` ETH funders with a dict and a sort, the reference of `top_k`."""
+    totals: dict[str, int] = {}
+    for _, event, account, amount in rows:
+        if event == "FundedETH":
+            totals[account] = totals.get(account, 0) + amount
+    return sorted(totals.items(), key=lambda item: -item[1])[:k]
+
+
+def python_period_split(rows: list[tuple[int, str, str, int]]) -> dict:
+    """Per-period totals of every event kind, the reference of `period_split`."""
+    totals: dict[tuple[str, int], int] = {}
+    for block_number, event, _, amount in rows:
+        key = (event, block_number // ANALYTICS_BLOCKS_PER_PERIOD)
+        totals[key] = totals.get(key, 0) + amount
+    return totals
+
+
+def timed(function: Callable[[], object]) -> float:
+    """Returns the wall time of a call, in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def moccasin_main() -> dict:
+    """Benchmarks the vectorized analytics against Python loops.
+
+    Run `mox run benchmark_analytics`. Fundings are sent through a fresh FundMe
+    on the in-memory pyevm env, indexed, then repeated up to a large dataset.
+    `ANALYTICS_BENCHMARK_EVENTS` and `ANALYTICS_SEED_FUNDINGS` override the
+    defaults.
+
+    :returns: dict: The seconds taken by each query, vectorized and in Python.
+    """
+    event_count = int(
+        os.environ.get("ANALYTICS_BENCHMARK_EVENTS", ANALYTICS_BENCHMARK_EVENTS)
+    )
+    funding_count = int(
+        os.environ.get("ANALYTICS_SEED_FUNDINGS", ANALYTICS_SEED_FUNDINGS)
+    )
+
+    fund_me_contract: VyperContract = deploy_fund_me.deploy()
+    columns = tile_events(seed_events(fund_me_contract, funding_count), event_count)
+    rows = python_rows(columns)
+
+    summary = {
+        "top_funders/numpy": timed(
+            lambda: top_k(funder_totals(columns), ANALYTICS_TOP_K)
+        ),
+        "top_funders/python": timed(lambda: python_top_funders(rows, ANALYTICS_TOP_K)),
+        "period_split/numpy": timed(
+            lambda: period_split(columns, ANALYTICS_BLOCKS_PER_PERIOD)
+        ),
+        "period_split/python": timed(lambda: python_period_split(rows)),
+    }
+
+    print(
+        f"{len(columns.event)} events from {len(columns.accounts)} accounts, "
+        f"seeded with {funding_count} fundings:"
+    )
+    for name, seconds in summary.items():
+        print(f"  {name}: {seconds * 1_000:.1f} ms")
+    return summary
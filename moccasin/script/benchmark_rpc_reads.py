@@ -0,0 +1,48 @@
+import time
+
+from moccasin.config import get_active_network
+from script.anvil_dump_state import deploy_and_seed
+from utils.async_rpc import AsyncRpcReader, view_call
+from utils.constants import ANVIL_DICT_ADDRESSES, RPC_BENCHMARK_READS
+
+
+def moccasin_main() -> dict[str, float]:
+    """Seeds a FundMe contract on anvil and times sequential and batched reads.
+
+    Run `anvil` first, then `mox run benchmark_rpc_reads --network anvil`.
+    Each strategy reads `get_funder_eth_amount` `RPC_BENCHMARK_READS` times,
+    cycling through the seeded funders.
+
+    :returns: dict[str, float]: The wall time of each strategy, in seconds.
+    """
+    fund_me_contract, _ = deploy_and_seed()
+
+    funders = [address_conf["public"] for address_conf in ANVIL_DICT_ADDRESSES.values()]
+    read_funders = [funders[i % len(funders)] for i in range(RPC_BENCHMARK_READS)]
+
+    wall_times = {}
+    start = time.perf_counter()
+    sequential = [
+        fund_me_contract.get_funder_eth_amount(funder) for funder in read_funders
+    ]
+    wall_times["sequential"] = time.perf_counter() - start
+
+    reader = AsyncRpcReader(get_active_network().url)
+    try:
+        start = time.perf_counter()
+        batched = reader.read_all(
+            [
+                view_call(fund_me_contract, "get_funder_eth_amount", funder)
+                for funder in read_funders
+            ]
+        )
+        wall_times["batched"] = time.perf_counter() - start
+    finally:
+        reader.close()
+    assert sequential == batched, "Batched reads do not match the sequential reads"
+
+    print(f"{RPC_BENCHMARK_READS} reads of get_funder_eth_amount, wall time:")
+    for name, seconds in wall_times.items():
+        print(f"  {name}: {seconds:.3f}s")
+    print(f"  speedup: {wall_times['sequential'] / wall_times['batched']:.1f}x")
+    return wall_times
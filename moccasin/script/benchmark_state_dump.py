@@ -0,0 +1,119 @@
+import json
+import os
+import random
+import resource
+import time
+
+from boa.util.abi import Address
+from eth_utils import keccak
+from script.generate_state_dump import generate_state
+from utils.constants import (
+    ANVIL_FUND_ME_ADDRESS,
+    STATE_DUMP_BENCHMARK_BYTES,
+    STATE_DUMP_BENCHMARK_PATH,
+    STATE_DUMP_FILLER_SLOTS,
+)
+from utils.state_dump import (
+    StateDumpReader,
+    decode_fund_me_storage,
+    fund_me_storage_slots,
+)
+
+
+def filler_account(index: int, code: str) -> tuple[str, dict]:
+    """Derives a contract account with `STATE_DUMP_FILLER_SLOTS` random slots."""
+    rng = random.Random(index)
+    address = str(Address(keccak(f"filler-{index}".encode())[-20:])).lower()
+    storage = {
+        f"0x{rng.getrandbits(256):064x}": f"0x{rng.getrandbits(256):064x}"
+        for _ in range(STATE_DUMP_FILLER_SLOTS)
+    }
+    return address, {"nonce": 1, "balance": "0x0", "code": code, "storage": storage}
+
+
+def write_large_dump(path: str, state: dict, size: int) -> int:
+    """Writes `state` padded with filler contracts up to about `size` bytes.
+
+    The dump is written account by account, never held in memory. Filler
+    contracts come first so FundMe is near the end, the worst case for a scan.
+
+    :returns: int: The number of filler contracts written.
+    """
+    code = state["accounts"][ANVIL_FUND_ME_ADDRESS.lower()]["code"]
+    fillers = 0
+    with open(path, "w") as f:
+        f.write(f'{{"block": {json.dumps(state["block"])}, "accounts": {{')
+        while f.tell() < size:
+            address, account = filler_account(fillers, code)
+            f.write(f"{json.dumps(address)}: {json.dumps(account)},\n")
+            fillers += 1
+        f.write(
+            ",\n".join(
+                f"{json.dumps(address)}: {json.dumps(account)}"
+                for address, account in state["accounts"].items()
+            )
+        )
+        rest = {
+            key: value
+            for key, value in state.items()
+            if key not in ("block", "accounts")
+        }
+        f.write("}, " + json.dumps(rest)[1:])
+    return fillers
+
+
+def peak_rss_bytes() -> int:
+    """Returns the peak resident memory of the process so far, in bytes."""
+    # @dev Linux reports `ru_maxrss` in KiB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def moccasin_main() -> dict:
+    """Benchmarks reading FundMe out of a large dump, streamed against `json.load`.
+
+    Run `mox run benchmark_state_dump`. A generated FundMe state is padded with
+    filler contracts up to `STATE_DUMP_BENCHMARK_BYTES` (500 MB by default)
+    and written to `STATE_DUMP_BENCHMARK_PATH`. The peak RSS only grows, so the
+    streaming reader is measured first.
+
+    :returns: dict: The time and peak RSS growth of both readers.
+    """
+    path = os.environ.get("STATE_DUMP_BENCHMARK_PATH", STATE_DUMP_BENCHMARK_PATH)
+    size = int(
+        os.environ.get("STATE_DUMP_BENCHMARK_BYTES", STATE_DUMP_BENCHMARK_BYTES)
+    )
+    state = generate_state()
+    fillers = write_large_dump(path, state, size)
+    slots = fund_me_storage_slots()
+
+    baseline_rss = peak_rss_bytes()
+    start = time.perf_counter()
+    with StateDumpReader(path) as reader:
+        streamed = decode_fund_me_storage(
+            reader.read_account(ANVIL_FUND_ME_ADDRESS)["storage"], slots
+        )
+    streamed_seconds = time.perf_counter() - start
+    streamed_rss = peak_rss_bytes()
+
+    start = time.perf_counter()
+    with open(path) as f:
+        loaded = decode_fund_me_storage(
+            json.load(f)["accounts"][ANVIL_FUND_ME_ADDRESS.lower()]["storage"], slots
+        )
+    loaded_seconds = time.perf_counter() - start
+    loaded_rss = peak_rss_bytes()
+
+    assert streamed == loaded, "The streamed FundMe state differs from json.load"
+    summary = {
+        "dump_mb": os.path.getsize(path) / 2**20,
+        "funders": streamed.funder_count,
+        "stream/seconds": streamed_seconds,
+        "stream/peak_rss_growth_mb": (streamed_rss - baseline_rss) / 2**20,
+        "json_load/seconds": loaded_seconds,
+        "json_load/peak_rss_growth_mb": (loaded_rss - streamed_rss) / 2**20,
+    }
+    print(f"FundMe read out of {path}, {fillers} filler contracts:")
+    for name, value in summary.items():
+        shown = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"  {name}: {shown}")
+    return summary
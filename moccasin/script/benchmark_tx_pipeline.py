@@ -0,0 +1,84 @@
+import boa
+import os
+import time
+
+from boa.network import NetworkEnv
+from moccasin.config import get_active_network
+from script import deploy_fund_me
+from script.anvil_dump_state import seed_funders
+from script.generate_state_dump import generate_funders
+from utils.artifacts import load_contract
+from utils.async_rpc import AsyncRpcReader, rpc_call
+from utils.constants import (
+    FUNDER_INITIAL_BALANCE_WEI,
+    LOAD_TEST_SEED,
+    TX_PIPELINE_BENCHMARK_FUNDERS,
+)
+from utils.tx_pipeline import network_pipeline
+
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+def moccasin_main() -> dict:
+    """Times seeding funders one transaction at a time against the pipeline.
+
+    Run `mox run benchmark_tx_pipeline --network anvil` against a running anvil.
+    Each funder gets ZK tokens minted by the owner, then approves and funds
+    FundMe: `TX_PIPELINE_BENCHMARK_FUNDERS` funders (1,000 by default) waiting
+    for each receipt before sending the next transaction, and as many others
+    sent through the pipeline, all the mints at once and then all the fundings.
+
+    :returns: dict: The seconds and transactions per second of both runs.
+    """
+    assert isinstance(boa.env, NetworkEnv), "Run with --network anvil"
+    funder_count = int(
+        os.environ.get("TX_PIPELINE_BENCHMARK_FUNDERS", TX_PIPELINE_BENCHMARK_FUNDERS)
+    )
+    funders = generate_funders(2 * funder_count, LOAD_TEST_SEED)
+    reader = AsyncRpcReader(get_active_network().url)
+    pipeline = network_pipeline()
+    try:
+        fund_me_contract = deploy_fund_me.deploy(pipeline)
+        zk_token_contract = mock_zk_token.at(fund_me_contract.get_zk_token_address())
+        balance = hex(FUNDER_INITIAL_BALANCE_WEI)
+        reader.read_all(
+            [rpc_call("anvil_setBalance", funder, balance) for funder in funders]
+            + [rpc_call("anvil_impersonateAccount", funder) for funder in funders]
+        )
+
+        mints, fundings = seed_funders(
+            fund_me_contract, zk_token_contract, funders[:funder_count]
+        )
+        sequential_calls = mints + fundings
+        start = time.perf_counter()
+        sent = [pipeline.send_all([call])[0] for call in sequential_calls]
+        sequential_seconds = time.perf_counter() - start
+
+        mints, fundings = seed_funders(
+            fund_me_contract, zk_token_contract, funders[funder_count:]
+        )
+        pipelined_calls = mints + fundings
+        start = time.perf_counter()
+        sent += pipeline.send_all(mints) + pipeline.send_all(fundings)
+        pipelined_seconds = time.perf_counter() - start
+    finally:
+        pipeline.close()
+        reader.close()
+    # The seeding went out over raw RPC, past boa's local fork
+    boa.env._reset_fork()
+
+    assert all(transaction.succeeded for transaction in sent), "Seeding reverted"
+    assert fund_me_contract.funder_count() == 2 * funder_count
+    summary = {
+        "transactions": len(pipelined_calls),
+        "sequential/seconds": sequential_seconds,
+        "sequential/tx_per_second": len(sequential_calls) / sequential_seconds,
+        "pipelined/seconds": pipelined_seconds,
+        "pipelined/tx_per_second": len(pipelined_calls) / pipelined_seconds,
+        "speedup": sequential_seconds / pipelined_seconds,
+    }
+    print(f"{funder_count} funders seeded (mint, approve and fund each):")
+    for name, value in summary.items():
+        shown = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"  {name}: {shown}")
+    return summary
@@ -1,16 +1,35 @@
+import boa
+
 from moccasin.boa_tools import VyperContract
 from moccasin.config import get_active_network
-from src import fund_me
+from typing import Optional
+from utils.artifacts import load_contract
+from utils.async_rpc import deploy_call
+from utils.tx_pipeline import TransactionPipeline
+
+fund_me = load_contract("src/fund_me.vy")
 
 
-def deploy() -> VyperContract:
+def deploy(pipeline: Optional[TransactionPipeline] = None) -> VyperContract:
     """Deploys the FundMe contract.
 
+    :param pipeline: The transaction pipeline sending the deployment from the
+        active account, e.g. to share its nonces with the transactions that
+        follow on a local anvil. It sends EVM init code and the deployment is
+        not recorded in the deployments database, so it is not meant for ZKsync
+        or live networks. Deployed by boa when not given.
     :returns: VyperContract: The deployed FundMe contract instance.
     """
     active_network = get_active_network()
     zksync_token: VyperContract = active_network.manifest_named("zktoken")
-    fund_me_contract: VyperContract = fund_me.deploy(zksync_token.address)
+    if pipeline is None:
+        fund_me_contract: VyperContract = fund_me.deploy(zksync_token.address)
+    else:
+        (sent,) = pipeline.send_all(
+            [deploy_call(fund_me, zksync_token.address, sender=boa.env.eoa)]
+        )
+        assert sent.succeeded, f"FundMe deployment {sent.tx_hash} reverted"
+        fund_me_contract = fund_me.at(sent.receipt["contractAddress"])
     if (
         active_network.has_explorer()
         and not active_network.is_local_or_forked_network()
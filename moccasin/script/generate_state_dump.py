@@ -0,0 +1,242 @@
+import boa
+import json
+import os
+import random
+
+from boa.util.abi import Address
+from eth_utils import keccak
+from moccasin.boa_tools import VyperContract
+from script.mocks import deploy_mock_zk_token
+from typing import NamedTuple
+from utils.artifacts import load_contract
+from utils.constants import (
+    ANVIL_ACCOUNT_BALANCE_WEI,
+    ANVIL_BASE_FEE_WEI,
+    ANVIL_CHAIN_ID,
+    ANVIL_DICT_ADDRESSES,
+    ANVIL_GAS_LIMIT,
+    FUNDER_INITIAL_BALANCE_WEI,
+    MINIMUM_FUNDING_AMOUNT_WEI,
+    STATE_DUMP_FUNDERS,
+    STATE_DUMP_FUNDING_RATIOS,
+    STATE_DUMP_FUNDINGS,
+    STATE_DUMP_MAX_FUNDING_MULTIPLIER,
+    STATE_DUMP_PATH,
+    STATE_DUMP_SEED,
+    STATE_DUMP_TIMESTAMP,
+)
+
+fund_me = load_contract("src/fund_me.vy")
+
+ANVIL_OWNER_ADDRESS = ANVIL_DICT_ADDRESSES["owner"]["public"]
+
+
+class Funding(NamedTuple):
+    """A funding of the generated state, `fund()` when both amounts are set."""
+
+    funder: str
+    eth_amount: int
+    zk_token_amount: int
+
+
+################################################################
+#                           FUNDINGS                           #
+################################################################
+def generate_funders(funder_count: int, seed: int) -> list[str]:
+    """Derives `funder_count` funder addresses from the seed.
+
+    The funders have no known private key, they only hold the generated state.
+    """
+    return [
+        str(Address(keccak(f"fund-me-funder-{seed}-{i}".encode())[-20:]))
+        for i in range(funder_count)
+    ]
+
+
+def plan_fundings(
+    funders: list[str],
+    funding_count: int,
+    seed: int,
+    ratios: tuple[int, int, int] = STATE_DUMP_FUNDING_RATIOS,
+) -> list[Funding]:
+    """Draws the fundings of the generated state from the seed.
+
+    Every funder funds once before funders are drawn at random, so all of them
+    are listed when `funding_count >= len(funders)`. Each funding is ETH, ZK
+    tokens or both, drawn with the weights of `ratios`, of a random multiple of
+    the minimum funding amount.
+    """
+    rng = random.Random(seed)
+    fundings = []
+    for i in range(funding_count):
+        funder = funders[i] if i < len(funders) else rng.choice(funders)
+        (kind,) = rng.choices(range(3), weights=ratios)
+        eth_amount = MINIMUM_FUNDING_AMOUNT_WEI * rng.randint(
+            1, STATE_DUMP_MAX_FUNDING_MULTIPLIER
+        )
+        zk_token_amount = MINIMUM_FUNDING_AMOUNT_WEI * rng.randint(
+            1, STATE_DUMP_MAX_FUNDING_MULTIPLIER
+        )
+        fundings.append(
+            Funding(
+                funder,
+                eth_amount if kind != 1 else 0,
+                zk_token_amount if kind != 0 else 0,
+            )
+        )
+    return fundings
+
+
+def prepare_funders(
+    fund_me_contract: VyperContract,
+    zk_token_contract: VyperContract,
+    funders: list[str],
+    minter: str = ANVIL_OWNER_ADDRESS,
+):
+    """Gives the funders ETH and ZK tokens, approved for FundMe."""
+    for funder in funders:
+        boa.env.set_balance(funder, FUNDER_INITIAL_BALANCE_WEI)
+        with boa.env.prank(minter):
+            zk_token_contract.mint(funder, FUNDER_INITIAL_BALANCE_WEI)
+        with boa.env.prank(funder):
+            zk_token_contract.approve(fund_me_contract.address, 2**256 - 1)
+
+
+def send_funding(fund_me_contract: VyperContract, funding: Funding):
+    """Sends a funding with `fund_eth`, `fund_zk_token` or `fund`."""
+    with boa.env.prank(funding.funder):
+        if funding.zk_token_amount == 0:
+            fund_me_contract.fund_eth(value=funding.eth_amount)
+        elif funding.eth_amount == 0:
+            fund_me_contract.fund_zk_token(funding.zk_token_amount)
+        else:
+            fund_me_contract.fund(funding.zk_token_amount, value=funding.eth_amount)
+
+
+################################################################
+#                          STATE DUMP                          #
+################################################################
+def dump_accounts(addresses: list[str]) -> dict:
+    """Dumps the accounts of the active pyevm env in anvil's dump format.
+
+    Storage slots are the ones boa traced as written, zero slots are left out.
+    """
+    accounts = {}
+    for address in sorted({str(Address(a)).lower() for a in addresses}):
+        canonical_address = Address(address).canonical_address
+        slots = sorted(boa.env.sstore_trace.get(Address(address), set()))
+        storage = {}
+        for slot in slots:
+            value = boa.env.get_storage(address, slot)
+            if value != 0:
+                storage[f"0x{slot:064x}"] = f"0x{value:064x}"
+        accounts[address] = {
+            "nonce": boa.env.evm.vm.state.get_nonce(canonical_address),
+            "balance": hex(boa.env.get_balance(address)),
+            "code": "0x" + boa.env.get_code(address).hex(),
+            "storage": storage,
+        }
+    return accounts
+
+
+def generate_state(
+    funder_count: int = STATE_DUMP_FUNDERS,
+    funding_count: int = STATE_DUMP_FUNDINGS,
+    seed: int = STATE_DUMP_SEED,
+) -> dict:
+    """Builds a FundMe state in a fresh in-memory env, in anvil's dump format.
+
+    The owner deploys the mock ZK token and FundMe at the same addresses as
+    `anvil_dump_state.py` on a fresh anvil and mints ZK tokens to the same
+    predefined accounts. The state is loaded at genesis, so the dump has no
+    blocks or transactions, and it only depends on the arguments.
+
+    :returns: dict: The state, to be loaded with `anvil --load-state`.
+    """
+    with boa.swap_env(boa.Env()):
+        boa.env.enable_fast_mode()
+        boa.env.evm.patch.chain_id = ANVIL_CHAIN_ID
+        boa.env.evm.patch.timestamp = STATE_DUMP_TIMESTAMP
+        boa.env.set_balance(ANVIL_OWNER_ADDRESS, ANVIL_ACCOUNT_BALANCE_WEI)
+
+        with boa.env.prank(ANVIL_OWNER_ADDRESS):
+            zk_token_contract: VyperContract = deploy_mock_zk_token.deploy()
+            fund_me_contract: VyperContract = fund_me.deploy(zk_token_contract.address)
+
+        # @dev like `anvil_dump_state.py`, the predefined anvil accounts hold ZK tokens
+        with boa.env.prank(ANVIL_OWNER_ADDRESS):
+            for address_conf in ANVIL_DICT_ADDRESSES.values():
+                zk_token_contract.mint(
+                    address_conf["public"], FUNDER_INITIAL_BALANCE_WEI
+                )
+
+        funders = generate_funders(funder_count, seed)
+        fundings = plan_fundings(funders, funding_count, seed)
+        prepare_funders(fund_me_contract, zk_token_contract, funders)
+        for funding in fundings:
+            send_funding(fund_me_contract, funding)
+
+        accounts = dump_accounts(
+            [
+                ANVIL_OWNER_ADDRESS,
+                zk_token_contract.address,
+                fund_me_contract.address,
+                *funders,
+            ]
+        )
+
+    return {
+        "block": {
+            "number": "0x0",
+            "coinbase": "0x0000000000000000000000000000000000000000",
+            "timestamp": hex(STATE_DUMP_TIMESTAMP),
+            "gas_limit": hex(ANVIL_GAS_LIMIT),
+            "basefee": hex(ANVIL_BASE_FEE_WEI),
+            "difficulty": "0x0",
+            "prevrandao": "0x" + "00" * 32,
+            "blob_excess_gas_and_price": {"excess_blob_gas": 0, "blob_gasprice": 1},
+        },
+        "accounts": accounts,
+        "best_block_number": "0x0",
+        "blocks": [],
+        "transactions": [],
+        "historical_states": None,
+    }
+
+
+def serialize_state(state: dict) -> str:
+    """Serializes a state like anvil does, the output only depends on the state."""
+    return json.dumps(state, indent=2) + "\n"
+
+
+def load_state(state: dict):
+    """Loads a state dump into the active pyevm env, standing in for anvil."""
+    for address, account in state["accounts"].items():
+        boa.env.evm.vm.state.set_nonce(
+            Address(address).canonical_address, account["nonce"]
+        )
+        boa.env.set_balance(address, int(account["balance"], 16))
+        boa.env.set_code(address, bytes.fromhex(account["code"][2:]))
+        for slot, value in account["storage"].items():
+            boa.env.set_storage(address, int(slot, 16), int(value, 16))
+
+
+def moccasin_main() -> str:
+    """Writes a generated FundMe state dump.
+
+    Run `mox run generate_state_dump`, then `anvil --load-state <path>`. The
+    `STATE_DUMP_FUNDERS`, `STATE_DUMP_FUNDINGS`, `STATE_DUMP_SEED` and
+    `STATE_DUMP_PATH` environment variables override the defaults.
+
+    :returns: str: The path of the written dump.
+    """
+    path = os.environ.get("STATE_DUMP_PATH", STATE_DUMP_PATH)
+    state = generate_state(
+        int(os.environ.get("STATE_DUMP_FUNDERS", STATE_DUMP_FUNDERS)),
+        int(os.environ.get("STATE_DUMP_FUNDINGS", STATE_DUMP_FUNDINGS)),
+        int(os.environ.get("STATE_DUMP_SEED", STATE_DUMP_SEED)),
+    )
+    with open(path, "w") as f:
+        f.write(serialize_state(state))
+    print(f"Wrote the state of {len(state['accounts'])} accounts to {path}")
+    return path
@@ -0,0 +1,397 @@
+import os
+import sqlite3
+
+import boa
+
+from contextlib import contextmanager
+from typing import Generator, Iterable, Iterator, NamedTuple, Optional
+
+from boa.contracts.event_decoder import RawLogEntry
+from boa.network import NetworkEnv
+from boa.rpc import RPCError, to_bytes, to_hex, to_int
+from boa.util.abi import Address
+from moccasin.boa_tools import VyperContract
+from script import deploy_fund_me
+from script.generate_state_dump import (
+    generate_funders,
+    plan_fundings,
+    prepare_funders,
+    send_funding,
+)
+from utils.artifacts import load_contract
+from utils.constants import (
+    ANVIL_FUND_ME_ADDRESS,
+    INDEXED_EVENTS,
+    INDEXER_DB_PATH,
+    INDEXER_INITIAL_CHUNK_BLOCKS,
+    INDEXER_MAX_CHUNK_BLOCKS,
+    INDEXER_TARGET_LOGS_PER_CHUNK,
+    STATE_DUMP_FUNDERS,
+    STATE_DUMP_FUNDINGS,
+    STATE_DUMP_SEED,
+)
+
+fund_me = load_contract("src/fund_me.vy")
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+################################################################
+#                          LOG SOURCES                         #
+################################################################
+class RawLog(NamedTuple):
+    """A log as returned by a log source, before decoding."""
+
+    block_number: int
+    log_index: int
+    tx_hash: Optional[str]
+    address: bytes  # canonical address
+    topics: list[int]
+    data: bytes
+
+
+class RpcLogSource:
+    """Log source reading `eth_getLogs` from a node (e.g. anvil)."""
+
+    def __init__(self, rpc):
+        self._rpc = rpc
+
+    def latest_block(self) -> int:
+        """Returns the latest mined block number."""
+        return to_int(self._rpc.fetch("eth_blockNumber", []))
+
+    def get_logs(
+        self, address: str, topics: list[int], from_block: int, to_block: int
+    ) -> list[RawLog]:
+        """Returns the logs of `address` matching any of `topics` in a block range.
+
+        :raises RPCError: If the node refuses the range, e.g. too many results.
+        """
+        logs = self._rpc.fetch(
+            "eth_getLogs",
+            [
+                {
+                    "address": str(address),
+                    "topics": [[to_hex(topic.to_bytes(32, "big")) for topic in topics]],
+                    "fromBlock": to_hex(from_block),
+                    "toBlock": to_hex(to_block),
+                }
+            ],
+        )
+        return [
+            RawLog(
+                block_number=to_int(log["blockNumber"]),
+                log_index=to_int(log["logIndex"]),
+                tx_hash=log["transactionHash"],
+                address=to_bytes(log["address"]),
+                topics=[to_int(topic) for topic in log["topics"]],
+                data=to_bytes(log["data"]),
+            )
+            for log in logs
+        ]
+
+
+class InMemoryLogSource:
+    """Log source recording the logs emitted on the in-memory boa environment.
+
+    The pyevm environment keeps no log history, so logs are recorded while
+    `record()` is open. The current block is still open to new transactions,
+    hence only the blocks before it are reported as mined.
+    """
+
+    def __init__(self):
+        self._logs: list[RawLog] = []
+        self._next_log_index: dict[int, int] = {}
+
+    @contextmanager
+    def record(self) -> Generator["InMemoryLogSource", None, None]:
+        """Records the logs of every successful transaction within the context."""
+        env = boa.env
+        execute_code = env.execute_code
+
+        def recording_execute_code(*args, **kwargs):
+            computation = execute_code(*args, **kwargs)
+            block_number = env.evm.patch.block_number
+            for _, address, topics, data in computation.get_raw_log_entries():
+                log_index = self._next_log_index.get(block_number, 0)
+                self._next_log_index[block_number] = log_index + 1
+                self._logs.append(
+                    RawLog(block_number, log_index, None, address, list(topics), data)
+                )
+            return computation
+
+        env.execute_code = recording_execute_code
+        try:
+            yield self
+        finally:
+            # @dev drop the instance attribute so the class method is used again
+            del env.execute_code
+
+    def latest_block(self) -> int:
+        """Returns the last block that can no longer receive logs."""
+        return boa.env.evm.patch.block_number - 1
+
+    def get_logs(
+        self, address: str, topics: list[int], from_block: int, to_block: int
+    ) -> list[RawLog]:
+        """Returns the recorded logs of `address` matching any of `topics`."""
+        canonical_address = Address(address).canonical_address
+        wanted_topics = set(topics)
+        return [
+            log
+            for log in self._logs
+            if from_block <= log.block_number <= to_block
+            and log.address == canonical_address
+            and log.topics[0] in wanted_topics
+        ]
+
+
+################################################################
+#                           PIPELINE                           #
+################################################################
+class IndexedEvent(NamedTuple):
+    """A decoded FundMe event, as stored in the database."""
+
+    block_number: int
+    log_index: int
+    tx_hash: Optional[str]
+    event: str
+    account: str  # funder for fundings, recipient for withdrawals
+    amount: int
+
+
+def fetch_log_chunks(
+    source,
+    address: str,
+    topics: list[int],
+    from_block: int,
+    to_block: int,
+    chunk_blocks: int = INDEXER_INITIAL_CHUNK_BLOCKS,
+    max_chunk_blocks: int = INDEXER_MAX_CHUNK_BLOCKS,
+    target_logs: int = INDEXER_TARGET_LOGS_PER_CHUNK,
+) -> Iterator[tuple[int, list[RawLog]]]:
+    """Yields the logs of a block range in adaptively sized chunks.
+
+    The chunk is halved when the source refuses it (too many results or range
+    too large) and doubled while chunks return less than half `target_logs`.
+
+    :returns: Iterator[tuple[int, list[RawLog]]]: The last block of each chunk
+        with its logs.
+    """
+    start = from_block
+    while start <= to_block:
+        end = min(start + chunk_blocks - 1, to_block)
+        try:
+            logs = source.get_logs(address, topics, start, end)
+        except RPCError:
+            if chunk_blocks == 1:
+                raise
+            chunk_blocks = max(chunk_blocks // 2, 1)
+            continue
+
+        yield end, logs
+
+        start = end + 1
+        if len(logs) > target_logs:
+            chunk_blocks = max(chunk_blocks // 2, 1)
+        elif len(logs) < target_logs // 2:
+            chunk_blocks = min(chunk_blocks * 2, max_chunk_blocks)
+
+
+def decode_log_chunks(
+    contract: VyperContract, chunks: Iterable[tuple[int, list[RawLog]]]
+) -> Iterator[tuple[int, list[IndexedEvent]]]:
+    """Decodes each chunk of raw logs with the ABI of the compiled contract."""
+    for end, logs in chunks:
+        events = []
+        for log in logs:
+            decoded = contract.decode_log(
+                RawLogEntry(log.log_index, log.address, log.topics, log.data)
+            )
+            _, account, amount = decoded
+            events.append(
+                IndexedEvent(
+                    block_number=log.block_number,
+                    log_index=log.log_index,
+                    tx_hash=log.tx_hash,
+                    event=type(decoded).__name__,
+                    account=str(account),
+                    amount=amount,
+                )
+            )
+        yield end, events
+
+
+################################################################
+#                            STORAGE                           #
+################################################################
+def connect(db_path: str = INDEXER_DB_PATH) -> sqlite3.Connection:
+    """Opens the event database, creating its tables and indexes if needed.
+
+    Amounts are stored as decimal text since SQLite integers are 64-bit.
+    The primary key doubles as the block index.
+    """
+    connection = sqlite3.connect(db_path)
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            contract TEXT NOT NULL,
+            block_number INTEGER NOT NULL,
+            log_index INTEGER NOT NULL,
+            tx_hash TEXT,
+            event TEXT NOT NULL,
+            account TEXT NOT NULL,
+            amount TEXT NOT NULL,
+            PRIMARY KEY (contract, block_number, log_index)
+        );
+        CREATE INDEX IF NOT EXISTS events_account ON events (contract, account);
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            contract TEXT PRIMARY KEY,
+            last_block INTEGER NOT NULL
+        );
+        """
+    )
+    return connection
+
+
+def get_checkpoint(connection: sqlite3.Connection, contract: str) -> Optional[int]:
+    """Returns the last block indexed for a contract, if any."""
+    row = connection.execute(
+        "SELECT last_block FROM checkpoints WHERE contract = ?", (contract,)
+    ).fetchone()
+    return None if row is None else row[0]
+
+
+def store_event_chunks(
+    connection: sqlite3.Connection,
+    contract: str,
+    chunks: Iterable[tuple[int, list[IndexedEvent]]],
+) -> int:
+    """Stores each chunk of events with its checkpoint in a single transaction.
+
+    A rerun after an interruption restarts from the last committed chunk.
+
+    :returns: int: The number of events stored.
+    """
+    stored = 0
+    for end, events in chunks:
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        contract,
+                        event.block_number,
+                        event.log_index,
+                        event.tx_hash,
+                        event.event,
+                        event.account,
+                        str(event.amount),
+                    )
+                    for event in events
+                ],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)", (contract, end)
+            )
+        stored += len(events)
+    return stored
+
+
+def funder_totals(
+    connection: sqlite3.Connection, contract: str
+) -> dict[str, tuple[int, int]]:
+    """Returns the ETH and ZK tokens funded by each funder from the indexed events."""
+    totals: dict[str, tuple[int, int]] = {}
+    rows = connection.execute(
+        "SELECT account, event, amount FROM events "
+        "WHERE contract = ? AND event IN ('FundedETH', 'FundedZKToken')",
+        (contract,),
+    )
+    for account, event, amount in rows:
+        eth_amount, zk_amount = totals.get(account, (0, 0))
+        if event == "FundedETH":
+            eth_amount += int(amount)
+        else:
+            zk_amount += int(amount)
+        totals[account] = (eth_amount, zk_amount)
+    return totals
+
+
+################################################################
+#                           INDEXER                            #
+################################################################
+def index_events(
+    connection: sqlite3.Connection,
+    fund_me_contract: VyperContract,
+    source,
+    start_block: int = 0,
+) -> int:
+    """Indexes the FundMe events from the last checkpoint up to the latest block.
+
+    :returns: int: The number of events indexed by this run.
+    """
+    contract = str(fund_me_contract.address)
+    checkpoint = get_checkpoint(connection, contract)
+    from_block = start_block if checkpoint is None else checkpoint + 1
+    to_block = source.latest_block()
+    if from_block > to_block:
+        return 0
+
+    topics = [
+        event_id
+        for event_id, event_abi in fund_me_contract.event_abi_for.items()
+        if event_abi["name"] in INDEXED_EVENTS
+    ]
+    chunks = fetch_log_chunks(source, contract, topics, from_block, to_block)
+    return store_event_chunks(
+        connection, contract, decode_log_chunks(fund_me_contract, chunks)
+    )
+
+
+def seed_in_memory() -> tuple[VyperContract, InMemoryLogSource]:
+    """Deploys and funds a FundMe on the in-memory env, recording its logs.
+
+    The funders and fundings are the ones of the state dump, then a block is
+    mined so the log source reports them.
+
+    :returns: tuple[VyperContract, InMemoryLogSource]: The contract and its logs.
+    """
+    source = InMemoryLogSource()
+    with source.record():
+        fund_me_contract: VyperContract = deploy_fund_me.deploy()
+        zk_token_contract = mock_zk_token.at(fund_me_contract.get_zk_token_address())
+        funders = generate_funders(STATE_DUMP_FUNDERS, STATE_DUMP_SEED)
+        prepare_funders(fund_me_contract, zk_token_contract, funders)
+        for funding in plan_fundings(funders, STATE_DUMP_FUNDINGS, STATE_DUMP_SEED):
+            send_funding(fund_me_contract, funding)
+        boa.env.time_travel(blocks=1)
+    return fund_me_contract, source
+
+
+def moccasin_main() -> int:
+    """Indexes the FundMe events of a node into the SQLite database.
+
+    Run `mox run index_events --network anvil`. The contract address is read
+    from `FUNDME_ADDRESS` (anvil state dump address by default) and the
+    database path from `INDEXER_DB_PATH`. Without a network, a FundMe seeded
+    by `seed_in_memory` on the in-memory env is indexed instead.
+
+    :returns: int: The number of events indexed by this run.
+    """
+    if isinstance(boa.env, NetworkEnv):
+        fund_me_contract = fund_me.at(
+            os.environ.get("FUNDME_ADDRESS", ANVIL_FUND_ME_ADDRESS)
+        )
+        source = RpcLogSource(boa.env._rpc)
+    else:
+        fund_me_contract, source = seed_in_memory()
+    connection = connect(os.environ.get("INDEXER_DB_PATH", INDEXER_DB_PATH))
+    try:
+        indexed = index_events(connection, fund_me_contract, source)
+        print(
+            f"Indexed {indexed} events of {fund_me_contract.address} up to block "
+            f"{get_checkpoint(connection, str(fund_me_contract.address))}"
+        )
+    finally:
+        connection.close()
+    return indexed
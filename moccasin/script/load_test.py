@@ -0,0 +1,297 @@
+import asyncio
+import boa
+import math
+import os
+import statistics
+import time
+
+from boa.network import NetworkEnv
+from boa.rpc import to_int
+from moccasin.boa_tools import VyperContract
+from moccasin.config import get_active_network
+from script import deploy_fund_me
+from script.generate_state_dump import (
+    Funding,
+    generate_funders,
+    plan_fundings,
+    prepare_funders,
+    send_funding,
+)
+from typing import NamedTuple, Sequence
+from utils.artifacts import load_contract
+from utils.async_rpc import AsyncRpcReader, RpcCall, rpc_call, transaction_call
+from utils.constants import (
+    FUNDER_INITIAL_BALANCE_WEI,
+    LOAD_TEST_FUNDERS,
+    LOAD_TEST_FUNDINGS,
+    LOAD_TEST_POLL_SECONDS,
+    LOAD_TEST_RATIOS,
+    LOAD_TEST_SEED,
+    MAX_FUNDERS_BATCH_SIZE,
+    RPC_BATCH_SIZE,
+    RPC_MAX_CONNECTIONS,
+    TX_INTRINSIC_GAS,
+)
+
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+class LoadTestRun(NamedTuple):
+    """Measures of the transactions sent by a load test run."""
+
+    seconds: float  # from the first transaction sent to the last one confirmed
+    gas: list[int]
+    latencies: list[float]  # from sending to confirmation, in seconds
+    failed: int
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile, e.g. `fraction=0.99` for p99."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+################################################################
+#                          IN MEMORY                           #
+################################################################
+def run_in_memory(
+    fund_me_contract: VyperContract, fundings: list[Funding]
+) -> LoadTestRun:
+    """Sends the fundings one after the other on the in-memory pyevm env.
+
+    A transaction is confirmed when its call returns, so the latency is the
+    execution time of the call. The gas is read from boa's gas tracker, so
+    accounts and slots warmed by earlier fundings stay warm.
+    """
+    gas, latencies = [], []
+    start = time.perf_counter()
+    for funding in fundings:
+        gas_before = boa.env.get_gas_used()
+        sent = time.perf_counter()
+        send_funding(fund_me_contract, funding)
+        latencies.append(time.perf_counter() - sent)
+        gas.append(TX_INTRINSIC_GAS + boa.env.get_gas_used() - gas_before)
+    return LoadTestRun(time.perf_counter() - start, gas, latencies, 0)
+
+
+################################################################
+#                            ANVIL                             #
+################################################################
+def funding_transaction(fund_me_contract: VyperContract, funding: Funding) -> RpcCall:
+    """Builds the `eth_sendTransaction` of a funding, see `send_funding`."""
+    if funding.zk_token_amount == 0:
+        return transaction_call(
+            fund_me_contract,
+            "fund_eth",
+            sender=funding.funder,
+            value=funding.eth_amount,
+        )
+    if funding.eth_amount == 0:
+        return transaction_call(
+            fund_me_contract,
+            "fund_zk_token",
+            funding.zk_token_amount,
+            sender=funding.funder,
+        )
+    return transaction_call(
+        fund_me_contract,
+        "fund",
+        funding.zk_token_amount,
+        sender=funding.funder,
+        value=funding.eth_amount,
+    )
+
+
+async def send_and_confirm(reader: AsyncRpcReader, calls: list[RpcCall]) -> LoadTestRun:
+    """Sends transactions while polling their receipts concurrently.
+
+    Transactions are sent in rounds of `RPC_MAX_CONNECTIONS` batches, so that
+    many of them are in flight while earlier ones get mined.
+    """
+    round_size = RPC_BATCH_SIZE * RPC_MAX_CONNECTIONS
+    sent_at: dict[str, float] = {}
+    receipts: dict[str, tuple[float, dict]] = {}
+    sending = True
+
+    async def send():
+        nonlocal sending
+        for i in range(0, len(calls), round_size):
+            sent = time.perf_counter()
+            for tx_hash in await reader.read(calls[i : i + round_size]):
+                sent_at[tx_hash] = sent
+        sending = False
+
+    async def confirm():
+        while sending or len(receipts) < len(sent_at):
+            pending = [tx_hash for tx_hash in sent_at if tx_hash not in receipts]
+            if pending:
+                results = await reader.read(
+                    [rpc_call("eth_getTransactionReceipt", h) for h in pending]
+                )
+                confirmed = time.perf_counter()
+                for tx_hash, receipt in zip(pending, results):
+                    if receipt is not None:
+                        receipts[tx_hash] = (confirmed, receipt)
+            await asyncio.sleep(LOAD_TEST_POLL_SECONDS)
+
+    start = time.perf_counter()
+    await asyncio.gather(send(), confirm())
+    return LoadTestRun(
+        max(confirmed for confirmed, _ in receipts.values()) - start,
+        [to_int(receipt["gasUsed"]) for _, receipt in receipts.values()],
+        [confirmed - sent_at[h] for h, (confirmed, _) in receipts.items()],
+        sum(receipt["status"] != "0x1" for _, receipt in receipts.values()),
+    )
+
+
+def prepare_funders_on_anvil(
+    reader: AsyncRpcReader,
+    fund_me_contract: VyperContract,
+    zk_token_contract: VyperContract,
+    funders: list[str],
+    minter: str,
+):
+    """Gives the funders ETH and ZK tokens, approved for FundMe, on anvil.
+
+    The funders are impersonated so that anvil signs their transactions.
+    """
+    balance = hex(FUNDER_INITIAL_BALANCE_WEI)
+    reader.read_all(
+        [rpc_call("anvil_setBalance", funder, balance) for funder in funders]
+        + [rpc_call("anvil_impersonateAccount", funder) for funder in funders]
+    )
+    setup = asyncio.run(
+        send_and_confirm(
+            reader,
+            [
+                transaction_call(
+                    zk_token_contract,
+                    "mint",
+                    funder,
+                    FUNDER_INITIAL_BALANCE_WEI,
+                    sender=minter,
+                )
+                for funder in funders
+            ]
+            + [
+                transaction_call(
+                    zk_token_contract,
+                    "approve",
+                    fund_me_contract.address,
+                    2**256 - 1,
+                    sender=funder,
+                )
+                for funder in funders
+            ],
+        )
+    )
+    assert setup.failed == 0, f"{setup.failed} setup transactions failed"
+
+
+################################################################
+#                         CONSISTENCY                          #
+################################################################
+def check_consistency(
+    fund_me_contract: VyperContract, fundings: list[Funding]
+) -> list[str]:
+    """Compares the contract views with the fundings sent to a fresh contract.
+
+    :returns: list[str]: A message per mismatch, empty when consistent.
+    """
+    expected: dict[str, list[int]] = {}
+    for funding in fundings:
+        amounts = expected.setdefault(funding.funder, [0, 0])
+        amounts[0] += funding.eth_amount
+        amounts[1] += funding.zk_token_amount
+
+    listed: dict[str, list[int]] = {}
+    for offset in range(0, fund_me_contract.funder_count(), MAX_FUNDERS_BATCH_SIZE):
+        for amounts in fund_me_contract.get_funders(offset, MAX_FUNDERS_BATCH_SIZE):
+            listed[amounts.funder] = [amounts.eth_amount, amounts.zk_token_amount]
+
+    errors = []
+    if len(listed) != len(expected):
+        errors.append(f"{len(listed)} funders listed, {len(expected)} expected")
+    errors += [
+        f"{funder}: funded {listed.get(funder)}, expected {amounts}"
+        for funder, amounts in expected.items()
+        if listed.get(funder) != amounts
+    ]
+    eth_total = sum(eth_amount for eth_amount, _ in expected.values())
+    zk_token_total = sum(zk_token_amount for _, zk_token_amount in expected.values())
+    balance_of_eth = fund_me_contract.balance_of_eth()
+    if balance_of_eth != eth_total:
+        errors.append(f"balance_of_eth {balance_of_eth} != {eth_total}")
+    balance_of_zk_token = fund_me_contract.balance_of_zk_token()
+    if balance_of_zk_token != zk_token_total:
+        errors.append(f"balance_of_zk_token {balance_of_zk_token} != {zk_token_total}")
+    if boa.env.get_balance(fund_me_contract.address) != eth_total:
+        errors.append("Contract ETH balance does not match the fundings")
+    return errors
+
+
+def moccasin_main() -> dict:
+    """Simulates a burst of donations against a fresh FundMe contract.
+
+    Run `mox run load_test` for the in-memory pyevm env, or with
+    `--network anvil` against a running anvil, with many transactions in flight.
+    `LOAD_TEST_FUNDERS`, `LOAD_TEST_FUNDINGS`, `LOAD_TEST_RATIOS` (weights of ETH,
+    ZK token and combined fundings, e.g. `2:1:1`) and `LOAD_TEST_SEED` override
+    the defaults.
+
+    :returns: dict: The throughput, gas and latency figures of the run.
+    """
+    funder_count = int(os.environ.get("LOAD_TEST_FUNDERS", LOAD_TEST_FUNDERS))
+    funding_count = int(os.environ.get("LOAD_TEST_FUNDINGS", LOAD_TEST_FUNDINGS))
+    ratios = tuple(
+        int(ratio)
+        for ratio in os.environ.get("LOAD_TEST_RATIOS", LOAD_TEST_RATIOS).split(":")
+    )
+    seed = int(os.environ.get("LOAD_TEST_SEED", LOAD_TEST_SEED))
+
+    fund_me_contract: VyperContract = deploy_fund_me.deploy()
+    zk_token_contract = mock_zk_token.at(fund_me_contract.get_zk_token_address())
+    funders = generate_funders(funder_count, seed)
+    fundings = plan_fundings(funders, funding_count, seed, ratios)
+
+    if isinstance(boa.env, NetworkEnv):
+        reader = AsyncRpcReader(get_active_network().url)
+        try:
+            prepare_funders_on_anvil(
+                reader, fund_me_contract, zk_token_contract, funders, boa.env.eoa
+            )
+            calls = [funding_transaction(fund_me_contract, f) for f in fundings]
+            run = asyncio.run(send_and_confirm(reader, calls))
+        finally:
+            reader.close()
+        # The burst went out over raw RPC, so boa's local fork is still at the
+        # block it was taken at; refork before reading balances back.
+        boa.env._reset_fork()
+    else:
+        prepare_funders(fund_me_contract, zk_token_contract, funders, boa.env.eoa)
+        run = run_in_memory(fund_me_contract, fundings)
+
+    errors = check_consistency(fund_me_contract, fundings)
+    summary = {
+        "transactions": len(run.gas),
+        "failed": run.failed,
+        "seconds": run.seconds,
+        "tx_per_second": len(run.gas) / run.seconds,
+        "gas_mean": int(statistics.mean(run.gas)),
+        "gas_p50": percentile(run.gas, 0.5),
+        "gas_p99": percentile(run.gas, 0.99),
+        "gas_max": max(run.gas),
+        "latency_p50_ms": percentile(run.latencies, 0.5) * 1_000,
+        "latency_p99_ms": percentile(run.latencies, 0.99) * 1_000,
+        "consistent": not errors,
+    }
+
+    print(f"{funding_count} fundings from {funder_count} funders (ratios {ratios}):")
+    for name, value in summary.items():
+        shown = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"  {name}: {shown}")
+    for error in errors[:20]:
+        print(f"  inconsistent: {error}")
+    assert not errors, "Final state does not match the fundings"
+    assert run.failed == 0, f"{run.failed} fundings failed"
+    return summary
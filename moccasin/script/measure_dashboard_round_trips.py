@@ -0,0 +1,108 @@
+from moccasin.boa_tools import VyperContract
+from script.anvil_dump_state import deploy_and_seed
+from utils.constants import ANVIL_DICT_ADDRESSES
+from utils.rpc import count_round_trips
+from utils.view_cache import CachedContract
+
+
+def load_dashboard_per_value(fund_me_contract: VyperContract, funder: str) -> tuple:
+    """Loads the dashboard with one view call per displayed value."""
+    return (
+        fund_me_contract.balance_of_eth(),
+        fund_me_contract.balance_of_zk_token(),
+        fund_me_contract.funder_count(),
+        fund_me_contract.get_funder_eth_amount(funder),
+        fund_me_contract.get_funder_zk_token_amount(funder),
+        fund_me_contract.owner(),
+    )
+
+
+def load_dashboards_per_value(
+    fund_me_contract: VyperContract | CachedContract, funders: list[str]
+) -> list[tuple]:
+    """Loads the dashboard of each funder with one view call per value."""
+    return [load_dashboard_per_value(fund_me_contract, funder) for funder in funders]
+
+
+def load_dashboard_aggregated(fund_me_contract: VyperContract, funder: str) -> tuple:
+    """Loads the dashboard with the aggregated `get_dashboard` view."""
+    return tuple(fund_me_contract.get_dashboard(funder))
+
+
+def load_leaderboard_per_funder(
+    fund_me_contract: VyperContract, funders: list[str]
+) -> list[tuple]:
+    """Loads the leaderboard with two view calls per funder."""
+    return [
+        (
+            funder,
+            fund_me_contract.get_funder_eth_amount(funder),
+            fund_me_contract.get_funder_zk_token_amount(funder),
+        )
+        for funder in funders
+    ]
+
+
+def load_leaderboard_batched(
+    fund_me_contract: VyperContract, funders: list[str]
+) -> list[tuple]:
+    """Loads the leaderboard with the batched `get_funders_amounts` view."""
+    return [tuple(amounts) for amounts in fund_me_contract.get_funders_amounts(funders)]
+
+
+def measure(loader, *args) -> tuple[int, object]:
+    """Runs a loader and returns the RPC round trips it took with its result."""
+    with count_round_trips() as counter:
+        result = loader(*args)
+    return counter.round_trips, result
+
+
+def moccasin_main() -> dict[str, int]:
+    """Seeds a FundMe contract on anvil and compares dashboard round trips.
+
+    Run `anvil` first, then `mox run measure_dashboard_round_trips --network anvil`.
+
+    :returns: dict[str, int]: The round trips of each loading strategy.
+    """
+    fund_me_contract, _ = deploy_and_seed()
+
+    funders = [address_conf["public"] for address_conf in ANVIL_DICT_ADDRESSES.values()]
+    dashboard_funder = ANVIL_DICT_ADDRESSES["funder_all"]["public"]
+
+    round_trips = {}
+    round_trips["dashboard_per_value"], per_value = measure(
+        load_dashboard_per_value, fund_me_contract, dashboard_funder
+    )
+    round_trips["dashboard_aggregated"], aggregated = measure(
+        load_dashboard_aggregated, fund_me_contract, dashboard_funder
+    )
+    assert per_value == aggregated, "Aggregated dashboard does not match the views"
+
+    round_trips["leaderboard_per_funder"], per_funder = measure(
+        load_leaderboard_per_funder, fund_me_contract, funders
+    )
+    round_trips["leaderboard_batched"], batched = measure(
+        load_leaderboard_batched, fund_me_contract, funders
+    )
+    assert per_funder == batched, "Batched leaderboard does not match the views"
+
+    # @dev the balances, funder count and owner are shared by the dashboards
+    views = CachedContract(fund_me_contract)
+    round_trips["dashboards_per_value"], dashboards = measure(
+        load_dashboards_per_value, fund_me_contract, funders
+    )
+    round_trips["dashboards_cached"], cached_dashboards = measure(
+        load_dashboards_per_value, views, funders
+    )
+    assert dashboards == cached_dashboards, "Cached dashboards do not match the views"
+
+    print(f"Dashboard and leaderboard of {len(funders)} funders, RPC round trips:")
+    for name, count in round_trips.items():
+        print(f"  {name}: {count}")
+    print("Cached dashboard views:")
+    for name, row in views.stats.summary().items():
+        print(
+            f"  {name}: {row['hits']} hits, {row['misses']} misses, "
+            f"{row['hit_rate']:.2%} hit rate, {row['round_trips']} round trips"
+        )
+    return round_trips
@@ -0,0 +1,81 @@
+import boa
+import statistics
+import time
+
+from moccasin.boa_tools import VyperContract
+from moccasin.moccasin_account import MoccasinAccount
+from script.anvil_dump_state import deploy_and_seed
+from utils.constants import (
+    ANVIL_DICT_ADDRESSES,
+    MINIMUM_FUNDING_AMOUNT_WEI,
+    PERMIT_DEADLINE_SECONDS,
+    PERMIT_LATENCY_ROUNDS,
+)
+from utils.permit import sign_permit
+from utils.rpc import count_transactions
+
+
+def fund_with_approve(
+    fund_me_contract: VyperContract, zk_token_contract: VyperContract, funder: str
+):
+    """Funds ZK tokens with an `approve` then `fund_zk_token`."""
+    with boa.env.prank(funder):
+        zk_token_contract.approve(fund_me_contract.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me_contract.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+
+
+def fund_with_permit(
+    fund_me_contract: VyperContract,
+    zk_token_contract: VyperContract,
+    funder: MoccasinAccount,
+):
+    """Funds ZK tokens with a permit signed off-chain and `fund_zk_token_with_permit`."""
+    deadline = int(time.time()) + PERMIT_DEADLINE_SECONDS
+    signature = sign_permit(
+        zk_token_contract,
+        funder,
+        fund_me_contract.address,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        deadline,
+    )
+    with boa.env.prank(funder.address):
+        fund_me_contract.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI, deadline, *signature
+        )
+
+
+def moccasin_main() -> dict[str, float]:
+    """Compares the latency of a ZK token funding with `approve` and with a permit.
+
+    Run `anvil --block-time 1` first, then
+    `mox run measure_permit_latency --network anvil`: every transaction waits
+    for its confirmation, so the approve path waits for two blocks per funding
+    and the permit path for one.
+
+    :returns: dict[str, float]: The transactions and mean seconds of each path.
+    """
+    fund_me_contract, zk_token_contract = deploy_and_seed(fund=False)
+    approve_funder = ANVIL_DICT_ADDRESSES["funder_zk"]["public"]
+    permit_funder = MoccasinAccount(ANVIL_DICT_ADDRESSES["funder_new"]["private"])
+
+    results = {}
+    for name, fund, funder in (
+        ("approve", fund_with_approve, approve_funder),
+        ("permit", fund_with_permit, permit_funder),
+    ):
+        latencies = []
+        for _ in range(PERMIT_LATENCY_ROUNDS):
+            start = time.perf_counter()
+            with count_transactions() as counter:
+                fund(fund_me_contract, zk_token_contract, funder)
+            latencies.append(time.perf_counter() - start)
+        results[f"{name}_transactions"] = counter.transactions
+        results[f"{name}_seconds"] = statistics.mean(latencies)
+
+    print(f"ZK token funding, mean of {PERMIT_LATENCY_ROUNDS} rounds:")
+    for name in ("approve", "permit"):
+        print(
+            f"  {name}: {results[f'{name}_transactions']} transaction(s), "
+            f"{results[f'{name}_seconds']:.3f}s"
+        )
+    return results
@@ -1,8 +1,9 @@
-from src.mocks import mock_zk_token
-
+from utils.artifacts import load_contract
 from utils.constants import ZK_NAME, ZK_SYMBOL, ZK_DECIMALS, ZK_INITIAL_SUPPLY
 from moccasin.boa_tools import VyperContract
 
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
 
 def deploy() -> VyperContract:
     """Deploys the ZKsync token contract with predefined parameters.
@@ -0,0 +1,135 @@
+import boa
+import time
+
+from boa.network import NetworkEnv
+from eth_utils import keccak
+from moccasin.boa_tools import VyperContract
+from moccasin.moccasin_account import MoccasinAccount
+from script import deploy_fund_me
+from typing import NamedTuple, Optional
+from utils.artifacts import load_contract
+from utils.constants import (
+    FUNDER_INITIAL_BALANCE_WEI,
+    MAX_FUNDING_INTENTS_BATCH_SIZE,
+    MINIMUM_FUNDING_AMOUNT_WEI,
+    PERMIT_DEADLINE_SECONDS,
+    RELAY_BATCH_SIZES,
+    RELAY_INTENTS,
+    RELAY_SEED,
+    TX_INTRINSIC_GAS,
+)
+from utils.permit import sign_permit
+
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+class FundingIntent(NamedTuple):
+    """A ZK token funding signed by a donor, as the `FundingIntent` struct of FundMe."""
+
+    funder: str
+    amount: int
+    deadline: int
+    v: int
+    r: bytes
+    s: bytes
+
+
+class RelayRun(NamedTuple):
+    """Measures of the batches sent by a relayer run."""
+
+    seconds: float
+    batches: int
+    funded: int
+    gas: Optional[int]  # total, only measured on the in-memory pyevm env
+
+
+def generate_donors(donor_count: int, seed: int) -> list[MoccasinAccount]:
+    """Derives `donor_count` donor accounts, with private keys, from the seed."""
+    return [
+        MoccasinAccount("0x" + keccak(f"fund-me-donor-{seed}-{i}".encode()).hex())
+        for i in range(donor_count)
+    ]
+
+
+def sign_funding_intent(
+    zk_token_contract: VyperContract,
+    donor: MoccasinAccount,
+    fund_me_contract: VyperContract,
+    amount: int,
+    deadline: int,
+) -> FundingIntent:
+    """Signs the permit letting FundMe pull `amount` of the donor's ZK tokens.
+
+    The donor only signs, the relayer submits the intent and pays the gas.
+    """
+    signature = sign_permit(
+        zk_token_contract, donor, fund_me_contract.address, amount, deadline
+    )
+    return FundingIntent(donor.address, amount, deadline, *signature)
+
+
+def submit_intents(
+    fund_me_contract: VyperContract,
+    intents: list[FundingIntent],
+    batch_size: int = MAX_FUNDING_INTENTS_BATCH_SIZE,
+) -> RelayRun:
+    """Submits the intents in batches of `batch_size` from the active account.
+
+    Each batch is a single `fund_zk_token_for_many` transaction, which skips the
+    intents it cannot fund instead of reverting.
+    """
+    in_memory = not isinstance(boa.env, NetworkEnv)
+    funded, gas = 0, 0
+    start = time.perf_counter()
+    for i in range(0, len(intents), batch_size):
+        batch = intents[i : i + batch_size]
+        gas_before = boa.env.get_gas_used()
+        funded += fund_me_contract.fund_zk_token_for_many(batch)
+        gas += TX_INTRINSIC_GAS + boa.env.get_gas_used() - gas_before
+    return RelayRun(
+        time.perf_counter() - start,
+        -(-len(intents) // batch_size),
+        funded,
+        gas if in_memory else None,
+    )
+
+
+def moccasin_main() -> dict:
+    """Compares the throughput of relayed ZK token fundings by batch size.
+
+    Run `mox run relay_fundings`: donors without ETH sign funding intents and
+    the active account relays them to a fresh FundMe, `RELAY_INTENTS` intents
+    for each of `RELAY_BATCH_SIZES`.
+
+    :returns: dict: The intents per second and gas per intent of each batch size.
+    """
+    fund_me_contract: VyperContract = deploy_fund_me.deploy()
+    zk_token_contract = mock_zk_token.at(fund_me_contract.get_zk_token_address())
+    donors = generate_donors(RELAY_INTENTS * len(RELAY_BATCH_SIZES), RELAY_SEED)
+    for donor in donors:
+        zk_token_contract.mint(donor.address, FUNDER_INITIAL_BALANCE_WEI)
+
+    summary = {}
+    deadline = int(time.time()) + PERMIT_DEADLINE_SECONDS
+    for i, batch_size in enumerate(RELAY_BATCH_SIZES):
+        intents = [
+            sign_funding_intent(
+                zk_token_contract,
+                donor,
+                fund_me_contract,
+                MINIMUM_FUNDING_AMOUNT_WEI,
+                deadline,
+            )
+            for donor in donors[i * RELAY_INTENTS : (i + 1) * RELAY_INTENTS]
+        ]
+        run = submit_intents(fund_me_contract, intents, batch_size)
+        assert run.funded == len(intents), f"{len(intents) - run.funded} not funded"
+        summary[f"batch_{batch_size}/intents_per_second"] = run.funded / run.seconds
+        if run.gas is not None:
+            summary[f"batch_{batch_size}/gas_per_intent"] = run.gas // run.funded
+
+    print(f"{RELAY_INTENTS} relayed ZK token fundings per batch size:")
+    for name, value in summary.items():
+        shown = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"  {name}: {shown}")
+    return summary
@@ -0,0 +1,64 @@
+import math
+import os
+import subprocess
+import time
+
+from utils.constants import INVARIANT_MAX_EXAMPLES
+
+INVARIANT_TEST_PATH = "tests/fuzzing/test_invariant_fund_me.py"
+
+
+def start_shard(shard_count: int, shard_seed: int | None) -> subprocess.Popen:
+    """Starts a `mox test` process running one shard of the invariant examples.
+
+    Every shard is its own process, hence its own boa environment. The shards
+    share the Hypothesis example database in `.hypothesis/`.
+    """
+    env = {**os.environ, "INVARIANT_SHARD_COUNT": str(shard_count)}
+    if shard_seed is not None:
+        env["INVARIANT_SHARD_SEED"] = str(shard_seed)
+    return subprocess.Popen(
+        ["mox", "test", INVARIANT_TEST_PATH, "--no-install"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+
+def moccasin_main() -> float:
+    """Runs the invariant examples sharded across processes and reports throughput.
+
+    Run `mox run run_invariant_shards`. `INVARIANT_SHARDS` sets the number of
+    shards (CPU count by default). Without seed, every shard draws its own
+    random seed and failures are saved to and replayed from the example
+    database. `INVARIANT_SEED` makes the run reproducible, shard `i` being
+    seeded with `INVARIANT_SEED + i`.
+
+    :returns: float: The invariant examples run per second.
+    """
+    shard_count = int(os.environ.get("INVARIANT_SHARDS", os.cpu_count()))
+    base_seed = os.environ.get("INVARIANT_SEED")
+
+    start = time.perf_counter()
+    shards = [
+        start_shard(shard_count, None if base_seed is None else int(base_seed) + i)
+        for i in range(shard_count)
+    ]
+    outputs = [shard.communicate()[0] for shard in shards]
+    wall_time = time.perf_counter() - start
+
+    failed = False
+    for i, (shard, output) in enumerate(zip(shards, outputs)):
+        if shard.returncode != 0:
+            failed = True
+            print(f"--- Shard {i} failed:\n{output}")
+
+    examples = shard_count * math.ceil(INVARIANT_MAX_EXAMPLES / shard_count)
+    throughput = examples / wall_time
+    print(
+        f"{examples} invariant examples over {shard_count} shards in "
+        f"{wall_time:.1f}s: {throughput:.2f} examples/s"
+    )
+    assert not failed, "Invariant shards failed"
+    return throughput
@@ -0,0 +1,92 @@
+import json
+import os
+
+from moccasin.boa_tools import VyperContract
+from moccasin.config import get_active_network
+from utils.artifacts import load_contract
+from utils.async_rpc import AsyncRpcReader, balance_call, rpc_call, view_call
+from utils.constants import ANVIL_FUND_ME_ADDRESS, MAX_FUNDERS_BATCH_SIZE
+
+fund_me = load_contract("src/fund_me.vy")
+
+
+def snapshot(reader: AsyncRpcReader, fund_me_contract: VyperContract) -> dict:
+    """Reads the whole FundMe state with batched concurrent RPC calls.
+
+    The latest block number is read first, and every call reads at that block,
+    so the snapshot stays consistent while new blocks are mined. The contract
+    totals are read next, then every page of funders with their amounts.
+
+    :returns: dict: The contract state, amounts as decimal strings for JSON.
+    """
+    (block,) = reader.read_all([rpc_call("eth_blockNumber")])
+    (
+        owner,
+        zk_token_address,
+        funder_count,
+        balance_of_eth,
+        balance_of_zk_token,
+        eth_balance,
+    ) = reader.read_all(
+        [
+            view_call(fund_me_contract, "owner", block=block),
+            view_call(fund_me_contract, "get_zk_token_address", block=block),
+            view_call(fund_me_contract, "funder_count", block=block),
+            view_call(fund_me_contract, "balance_of_eth", block=block),
+            view_call(fund_me_contract, "balance_of_zk_token", block=block),
+            balance_call(fund_me_contract.address, block),
+        ]
+    )
+
+    pages = reader.read_all(
+        [
+            view_call(
+                fund_me_contract,
+                "get_funders",
+                offset,
+                MAX_FUNDERS_BATCH_SIZE,
+                block=block,
+            )
+            for offset in range(0, funder_count, MAX_FUNDERS_BATCH_SIZE)
+        ]
+    )
+
+    return {
+        "address": str(fund_me_contract.address),
+        "block_number": int(block, 16),
+        "owner": str(owner),
+        "zk_token": str(zk_token_address),
+        "funder_count": funder_count,
+        "balance_of_eth": str(balance_of_eth),
+        "balance_of_zk_token": str(balance_of_zk_token),
+        "eth_balance": str(eth_balance),
+        "funders": [
+            {
+                "funder": str(amounts.funder),
+                "eth_amount": str(amounts.eth_amount),
+                "zk_token_amount": str(amounts.zk_token_amount),
+            }
+            for page in pages
+            for amounts in page
+        ],
+    }
+
+
+def moccasin_main() -> dict:
+    """Prints a JSON snapshot of a deployed FundMe contract.
+
+    Run `mox run snapshot_state --network anvil`. The contract address is read
+    from `FUNDME_ADDRESS` (anvil state dump address by default).
+
+    :returns: dict: The contract state.
+    """
+    fund_me_contract = fund_me.at(
+        os.environ.get("FUNDME_ADDRESS", ANVIL_FUND_ME_ADDRESS)
+    )
+    reader = AsyncRpcReader(get_active_network().url)
+    try:
+        state = snapshot(reader, fund_me_contract)
+    finally:
+        reader.close()
+    print(json.dumps(state, indent=2))
+    return state
@@ -0,0 +1,955 @@
+# pragma version 0.4.1
+"""
+@license MIT
+@title Mock Fund Me With Two Maps
+@notice FundMe with the funder totals in two HashMaps, as before they were packed.
+@dev This contract is only used to compare the gas of funding with `fund_me.vy`.
+    It is `fund_me.vy` with `funder_to_funded` split into `funder_to_eth_funded`
+    and `funder_to_zk_funded`, and must follow its changes.
+@author s3bc40
+"""
+################################################################
+#                           IMPORTS                            #
+################################################################
+# @dev Import the ownable module for ownership functionality.
+from snekmate.auth import ownable
+
+initializes: ownable
+exports: ownable.owner
+
+# @dev Import interfaces for ERC20 tokens.
+from ethereum.ercs import IERC20
+
+################################################################
+#                            ERRORS                            #
+################################################################
+# @dev Zero address error message.
+ZERO_ADDRESS_ERROR: public(
+    constant(String[64])
+) = "fund_me: zero address not allowed"
+
+# @dev Insufficient amount error message.
+INSUFFICIENT_AMOUNT_ERROR: public(
+    constant(String[64])
+) = "fund_me: insufficient amount sent"
+
+# @dev Funding transfer failed error message.
+FUNDING_TRANSFER_FAILED_ERROR: public(
+    constant(String[64])
+) = "fund_me: funding transfer failed"
+
+# @dev Direct ETH transfer error message.
+DIRECT_TRANSFER_ERROR: public(
+    constant(String[64])
+) = "fund_me: direct transfers not allowed"
+
+# @dev Withdrawal amount exceeds balance error message.
+WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR: public(
+    constant(String[64])
+) = "fund_me: withdrawal amount exceeds balance"
+
+# @dev Expired permit deadline error message.
+PERMIT_EXPIRED_ERROR: public(
+    constant(String[64])
+) = "fund_me: permit expired"
+
+# @dev Permit neither accepted nor covered by an allowance error message.
+PERMIT_FAILED_ERROR: public(
+    constant(String[64])
+) = "fund_me: permit failed"
+
+# @dev Period no longer kept in the period buckets error message.
+PERIOD_OUT_OF_RANGE_ERROR: public(
+    constant(String[64])
+) = "fund_me: period out of range"
+
+# @dev Funder total no longer fits in its packed record error message.
+FUNDED_AMOUNT_OVERFLOW_ERROR: public(
+    constant(String[64])
+) = "fund_me: funded amount overflow"
+
+# @dev Period total no longer fits in its period bucket error message.
+PERIOD_AMOUNT_OVERFLOW_ERROR: public(
+    constant(String[64])
+) = "fund_me: period amount overflow"
+
+
+################################################################
+#                            EVENTS                            #
+################################################################
+# @dev Events to log funding ETH.
+event FundedETH:
+    funder: indexed(address)
+    amount: uint256
+
+
+# @dev Events to log funding ZK tokens.
+event FundedZKToken:
+    funder: indexed(address)
+    amount: uint256
+
+
+# @dev Events to log withdrawals of ETH.
+event WithdrawEth:
+    to: indexed(address)
+    amount: uint256
+
+
+# @dev Events to log withdrawals of ZK tokens.
+event WithdrawZK:
+    to: indexed(address)
+    amount: uint256
+
+
+################################################################
+#                           STRUCTS                            #
+################################################################
+# @dev Amounts funded by a single funder, as returned by batched views.
+struct FunderAmounts:
+    funder: address
+    eth_amount: uint256
+    zk_token_amount: uint256
+
+
+# @dev Donations of a single period, as returned by `get_period_totals`.
+struct PeriodTotals:
+    period: uint256
+    eth_amount: uint256
+    zk_token_amount: uint256
+    funding_count: uint256
+    new_funder_count: uint256
+
+
+# @dev A ZK token funding signed by a funder for a relayer to submit, see
+#    `fund_zk_token_for_many`. The signature is the funder's EIP-2612 permit.
+struct FundingIntent:
+    funder: address
+    amount: uint256
+    deadline: uint256
+    v: uint8
+    r: bytes32
+    s: bytes32
+
+
+################################################################
+#                    CONSTANTS & IMMUTABLES                    #
+################################################################
+# @dev The minimum funding amount in wei (0.0001 ETH).
+MINIMUM_FUNDING_AMOUNT_WEI: constant(uint256) = 1 * 10**14
+
+# @dev Bit offset of the ETH total and mask of the ZK token total in a packed funder record.
+#    The mask is also the maximum total that fits in either half.
+FUNDED_ETH_SHIFT: constant(uint256) = 128
+FUNDED_ZK_MASK: constant(uint256) = 2**128 - 1
+
+# @dev The maximum number of funders that can be read in a single batched view call.
+MAX_FUNDERS_BATCH_SIZE: constant(uint256) = 256
+
+# @dev The maximum number of funding intents a relayer can submit in a single call.
+MAX_FUNDING_INTENTS_BATCH_SIZE: constant(uint256) = 100
+
+# @dev The length of a period of the donation totals (one day), and the number of
+#    periods kept in the ring of period buckets, the older ones being overwritten.
+PERIOD_SECONDS: constant(uint256) = 86_400
+PERIOD_BUCKET_COUNT: constant(uint256) = 128
+
+# @dev Layout of the packed period buckets, the same for the ETH and the ZK bucket.
+#    A bucket holds its period in the lower 64 bits, a funding count from bit 64,
+#    a new funder count from bit 96 and the total of its asset from bit 128.
+#    `PERIOD_AMOUNT_MAX` is the largest total of an asset a bucket can hold.
+PERIOD_MASK: constant(uint256) = 2**64 - 1
+PERIOD_COUNT_MASK: constant(uint256) = 2**32 - 1
+PERIOD_FUNDING_COUNT_SHIFT: constant(uint256) = 64
+PERIOD_NEW_FUNDER_COUNT_SHIFT: constant(uint256) = 96
+PERIOD_AMOUNT_SHIFT: constant(uint256) = 128
+PERIOD_AMOUNT_MAX: constant(uint256) = 2**128 - 1
+
+################################################################
+#                       STATE VARIABLES                        #
+################################################################
+# @dev Total amount of ETH in the contract in wei available for withdrawal.
+# @notice The ZK tokens available for withdrawal are read from the token,
+#    see `balance_of_zk_token`.
+balance_of_eth: public(uint256)
+
+# @dev Total amount of funder in the contract.
+#     Allows to track the number of funders.
+funder_count: public(uint256)
+
+# @dev ETH and ZK tokens funded by each funder, packed in a single storage slot.
+#    The upper 128 bits hold the ETH total and the lower 128 bits the ZK token total,
+#    so checking and updating a funder costs one SLOAD and one SSTORE.
+#    Allows to track the amount funded by each address and display it.
+# @notice It is meant as an historical record of contributions, not transfers.
+#    Vyper does not pack struct members, hence the manual packing.
+funder_to_eth_funded: HashMap[address, uint256]
+funder_to_zk_funded: HashMap[address, uint256]
+
+# @dev Funders in order of their first funding, indexed from 0 to `funder_count - 1`.
+#    Allows clients to page through funders without replaying the funding events.
+funder_at_index: HashMap[uint256, address]
+
+# @dev Donation totals of the last `PERIOD_BUCKET_COUNT` periods, indexed by
+#    `period % PERIOD_BUCKET_COUNT`, see the layout above. A bucket holding another
+#    period than the one read is stale and counts as empty.
+#    Allows to answer "how much was donated this week" without scanning the events.
+# @notice A funding only writes the buckets of the assets it funds. It is counted in
+#    the ETH bucket when it funds ETH, in the ZK bucket otherwise.
+period_eth_bucket: HashMap[uint256, uint256]
+period_zk_bucket: HashMap[uint256, uint256]
+
+# @dev The address of the ZK token contract.
+zk_token_address: address
+
+################################################################
+#                    CONSTRUCTOR & FALLBACK                    #
+################################################################
+@deploy
+def __init__(_zk_token_address: address):
+    """
+    @dev Initializes the contract with the owner (msg.sender) and sets the ZK token address.
+    @param zk_token_address The address of the ZK token contract.
+    """
+    assert _zk_token_address != empty(address), ZERO_ADDRESS_ERROR
+    ownable.__init__()
+    self.balance_of_eth = 0
+    self.funder_count = 0
+    self.zk_token_address = _zk_token_address
+
+
+@payable
+@external
+def __default__():
+    """
+    @dev Fallback function to handle direct ETH transfers.
+    """
+    raise DIRECT_TRANSFER_ERROR
+
+
+################################################################
+#                      EXTERNAL FUNCTIONS                      #
+################################################################
+@nonreentrant
+@payable
+@external
+def fund_eth():
+    """
+    @dev Function to fund the contract with ETH (in wei).
+    @notice This function allows users to send ETH to the contract.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The function is marked as `payable` to allow ETH transfers.
+    """
+    assert msg.sender != empty(address), ZERO_ADDRESS_ERROR
+    assert msg.value >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+    amount: uint256 = msg.value
+
+    self._record_funding(msg.sender, amount, 0)
+    self.balance_of_eth += amount
+
+    # Log the funding event.
+    log FundedETH(funder=msg.sender, amount=amount)
+
+
+@nonreentrant
+@external
+def fund_zk_token(_amount: uint256):
+    """
+    @dev Function to fund the contract with ZK tokens (in wei).
+    @param _amount The amount of ZK tokens to be funded.
+    @notice This function allows users to send ZK tokens to the contract.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The sender must have approved the contract to spend the specified amount of ZK tokens.
+    """
+    assert msg.sender != empty(address), ZERO_ADDRESS_ERROR
+    assert _amount >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+
+    self._record_funding(msg.sender, 0, _amount)
+
+    # Transfer the ZK tokens from the sender to the contract.
+    # @dev `default_return_value` accepts tokens whose transfers return nothing.
+    success: bool = extcall IERC20(self.zk_token_address).transferFrom(
+        msg.sender, self, _amount, default_return_value=True
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the funding event.
+    log FundedZKToken(funder=msg.sender, amount=_amount)
+
+
+@nonreentrant
+@external
+def fund_zk_token_with_permit(
+    _amount: uint256, _deadline: uint256, _v: uint8, _r: bytes32, _s: bytes32
+):
+    """
+    @dev Function to fund the contract with ZK tokens (in wei) approved by an EIP-2612 permit.
+    @param _amount The amount of ZK tokens to be funded.
+    @param _deadline The timestamp until which the permit is valid.
+    @param _v The `v` parameter of the funder's permit signature.
+    @param _r The `r` parameter of the funder's permit signature.
+    @param _s The `s` parameter of the funder's permit signature.
+    @notice This function allows users to send ZK tokens without a prior `approve`,
+        so a ZK token funding takes one transaction instead of two.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The permit must be signed by the sender for this contract and `_amount`.
+        Anyone can submit a permit seen in the mempool first, in which case the
+        funding goes on as long as the allowance covers `_amount`.
+    """
+    assert msg.sender != empty(address), ZERO_ADDRESS_ERROR
+    assert _amount >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+    assert block.timestamp <= _deadline, PERMIT_EXPIRED_ERROR
+
+    # Approve the contract with the permit, a failed permit falls back on the allowance.
+    zk_token_address: address = self.zk_token_address
+    if not self._permit(
+        zk_token_address, msg.sender, _amount, _deadline, _v, _r, _s
+    ):
+        assert (
+            staticcall IERC20(zk_token_address).allowance(msg.sender, self) >= _amount
+        ), PERMIT_FAILED_ERROR
+
+    self._record_funding(msg.sender, 0, _amount)
+
+    # Transfer the ZK tokens from the sender to the contract.
+    success: bool = extcall IERC20(zk_token_address).transferFrom(
+        msg.sender, self, _amount, default_return_value=True
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the funding event.
+    log FundedZKToken(funder=msg.sender, amount=_amount)
+
+
+@nonreentrant
+@external
+def fund_zk_token_for(
+    _funder: address,
+    _amount: uint256,
+    _deadline: uint256,
+    _v: uint8,
+    _r: bytes32,
+    _s: bytes32,
+):
+    """
+    @dev Function to fund the contract with ZK tokens (in wei) on behalf of a funder.
+    @param _funder The address of the funder, who signed the permit.
+    @param _amount The amount of ZK tokens to be funded.
+    @param _deadline The timestamp until which the permit is valid.
+    @param _v The `v` parameter of the funder's permit signature.
+    @param _r The `r` parameter of the funder's permit signature.
+    @param _s The `s` parameter of the funder's permit signature.
+    @notice This function allows a relayer to pay the gas of a funder without ETH.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The EIP-2612 permit signed by `_funder` for this contract and `_amount` is
+        the funder's consent, so unlike `fund_zk_token_with_permit` an allowance
+        alone is not enough: anyone could spend it on the funder's behalf otherwise.
+    """
+    assert _funder != empty(address), ZERO_ADDRESS_ERROR
+    assert _amount >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+    assert block.timestamp <= _deadline, PERMIT_EXPIRED_ERROR
+
+    zk_token_address: address = self.zk_token_address
+    assert self._permit(
+        zk_token_address, _funder, _amount, _deadline, _v, _r, _s
+    ), PERMIT_FAILED_ERROR
+
+    self._record_funding(_funder, 0, _amount)
+
+    # Transfer the ZK tokens from the funder to the contract.
+    success: bool = extcall IERC20(zk_token_address).transferFrom(
+        _funder, self, _amount, default_return_value=True
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the funding event.
+    log FundedZKToken(funder=_funder, amount=_amount)
+
+
+@nonreentrant
+@external
+def fund_zk_token_for_many(
+    _intents: DynArray[FundingIntent, MAX_FUNDING_INTENTS_BATCH_SIZE]
+) -> uint256:
+    """
+    @dev Function to fund the contract with the ZK tokens of many funders at once.
+    @param _intents The fundings signed by the funders, see `fund_zk_token_for`.
+    @return The number of intents funded.
+    @notice This function allows a relayer to submit many funders' fundings in a
+        single transaction, paying the transaction overhead once for the batch.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        Intents that cannot be funded (below the minimum, expired, with a used or
+        invalid permit, or from a funder short of tokens) are skipped instead of
+        reverting, so a single stale intent does not fail the whole batch.
+    """
+    zk_token_address: address = self.zk_token_address
+    funded: uint256 = 0
+
+    for intent: FundingIntent in _intents:
+        if (
+            intent.funder == empty(address)
+            or intent.amount < MINIMUM_FUNDING_AMOUNT_WEI
+            or block.timestamp > intent.deadline
+        ):
+            continue
+        # @dev checked first, a failing transfer would revert the whole batch
+        if (
+            staticcall IERC20(zk_token_address).balanceOf(intent.funder)
+            < intent.amount
+        ):
+            continue
+        if not self._permit(
+            zk_token_address,
+            intent.funder,
+            intent.amount,
+            intent.deadline,
+            intent.v,
+            intent.r,
+            intent.s,
+        ):
+            continue
+
+        self._record_funding(intent.funder, 0, intent.amount)
+
+        # Transfer the ZK tokens from the funder to the contract.
+        success: bool = extcall IERC20(zk_token_address).transferFrom(
+            intent.funder, self, intent.amount, default_return_value=True
+        )
+        assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+        # Log the funding event.
+        log FundedZKToken(funder=intent.funder, amount=intent.amount)
+        funded += 1
+
+    return funded
+
+
+@nonreentrant
+@payable
+@external
+def fund(_zk_amount: uint256):
+    """
+    @dev Function to fund the contract with both ETH and ZK tokens (in wei) in a single call.
+    @param _zk_amount The amount of ZK tokens to be funded alongside `msg.value`.
+    @notice This function allows users to send ETH and ZK tokens to the contract at once.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The function is marked as `payable` to allow ETH transfers.
+        The sender must have approved the contract to spend the specified amount of ZK tokens.
+        Each storage slot is touched once, which is cheaper than calling
+        `fund_eth` and `fund_zk_token` in two separate transactions.
+    """
+    assert msg.sender != empty(address), ZERO_ADDRESS_ERROR
+    assert msg.value >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+    assert _zk_amount >= MINIMUM_FUNDING_AMOUNT_WEI, INSUFFICIENT_AMOUNT_ERROR
+    eth_amount: uint256 = msg.value
+
+    self._record_funding(msg.sender, eth_amount, _zk_amount)
+    self.balance_of_eth += eth_amount
+
+    # Transfer the ZK tokens from the sender to the contract.
+    success: bool = extcall IERC20(self.zk_token_address).transferFrom(
+        msg.sender, self, _zk_amount, default_return_value=True
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the funding events.
+    log FundedETH(funder=msg.sender, amount=eth_amount)
+    log FundedZKToken(funder=msg.sender, amount=_zk_amount)
+
+
+@nonreentrant
+@external
+def withdraw_eth(_amount: uint256):
+    """
+    @dev Function to withdraw ETH from the contract.
+    @param _amount The amount of ETH to withdraw (in wei).
+    @notice This function allows the owner to withdraw ETH from the contract.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+    """
+    ownable._check_owner()
+    assert (
+        _amount <= self.balance_of_eth
+    ), WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR
+    assert _amount > 0, INSUFFICIENT_AMOUNT_ERROR
+
+    # Update the balance before transferring to prevent reentrancy issues.
+    self.balance_of_eth -= _amount
+
+    # Transfer the specified amount of ETH to the owner.
+    success: bool = raw_call(
+        ownable.owner, b"", value=_amount, revert_on_failure=False
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the withdrawal event.
+    log WithdrawEth(to=ownable.owner, amount=_amount)
+
+
+@nonreentrant
+@external
+def withdraw_zk_token(_amount: uint256):
+    """
+    @dev Function to withdraw ZK tokens from the contract.
+    @param _amount The amount of ZK tokens to withdraw (in wei).
+    @notice This function allows the owner to withdraw ZK tokens from the contract.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+    """
+    ownable._check_owner()
+    assert (
+        _amount <= self._zk_token_balance()
+    ), WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR
+    assert _amount > 0, INSUFFICIENT_AMOUNT_ERROR
+
+    # Transfer the specified amount of ZK tokens to the owner.
+    success: bool = extcall IERC20(self.zk_token_address).transfer(
+        ownable.owner, _amount, default_return_value=True
+    )
+    assert success, FUNDING_TRANSFER_FAILED_ERROR
+
+    # Log the withdrawal event.
+    log WithdrawZK(to=ownable.owner, amount=_amount)
+
+
+@nonreentrant
+@external
+def withdraw(_eth_amount: uint256, _zk_amount: uint256):
+    """
+    @dev Function to withdraw ETH and ZK tokens from the contract in a single call.
+    @param _eth_amount The amount of ETH to withdraw (in wei), zero to leave ETH untouched.
+    @param _zk_amount The amount of ZK tokens to withdraw (in wei), zero to leave them untouched.
+    @notice This function allows the owner to withdraw both assets at once.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+        The owner is checked and the lock taken once, which is cheaper than calling
+        `withdraw_eth` and `withdraw_zk_token` in two separate transactions.
+    """
+    ownable._check_owner()
+    assert (
+        _eth_amount <= self.balance_of_eth
+    ), WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR
+    assert (
+        _zk_amount <= self._zk_token_balance()
+    ), WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR
+    assert _eth_amount > 0 or _zk_amount > 0, INSUFFICIENT_AMOUNT_ERROR
+
+    self._send_withdrawals(_eth_amount, _zk_amount)
+
+
+@nonreentrant
+@external
+def withdraw_all():
+    """
+    @dev Function to withdraw all the ETH and ZK tokens from the contract.
+    @notice This function allows the owner to sweep both assets without reading
+        the balances first.
+        The function is marked as `nonreentrant` to prevent reentrancy attacks.
+    """
+    ownable._check_owner()
+    eth_amount: uint256 = self.balance_of_eth
+    zk_amount: uint256 = self._zk_token_balance()
+    assert eth_amount > 0 or zk_amount > 0, INSUFFICIENT_AMOUNT_ERROR
+
+    self._send_withdrawals(eth_amount, zk_amount)
+
+
+@external
+def set_zk_token_address(_zk_token_address: address):
+    """
+    @dev Function to set the ZK token address.
+    @param _zk_token_address The new address of the ZK token contract.
+    @notice This function allows the owner to update the ZK token address.
+    """
+    ownable._check_owner()
+    assert _zk_token_address != empty(address), ZERO_ADDRESS_ERROR
+    self.zk_token_address = _zk_token_address
+
+
+################################################################
+#                      INTERNAL FUNCTIONS                      #
+################################################################
+@internal
+def _record_funding(funder: address, eth_amount: uint256, zk_amount: uint256):
+    """
+    @dev Adds a funding to the packed record of a funder and to the current period.
+    @param funder The address of the funder.
+    @param eth_amount The amount of ETH funded (in wei).
+    @param zk_amount The amount of ZK tokens funded (in wei).
+    @notice The record and the period buckets are read and written once each, with
+        the packing done inline since internal calls are not free on the funding hot path.
+    """
+    eth_funded: uint256 = self.funder_to_eth_funded[funder]
+    zk_funded: uint256 = 0
+    if eth_funded == 0 or zk_amount > 0:
+        zk_funded = self.funder_to_zk_funded[funder]
+    record: uint256 = eth_funded | zk_funded
+
+    # Append the funder to the list if this is the first funding from the address.
+    if record == 0:
+        funder_index: uint256 = self.funder_count
+        self.funder_at_index[funder_index] = funder
+        self.funder_count = funder_index + 1
+
+    # @dev The ETH total cannot exceed 128 bits since the whole ETH supply is far below,
+    #   hence the unchecked addition. A ZK token total overflowing would corrupt the
+    #   ETH half, so it is checked.
+    if eth_amount > 0:
+        self.funder_to_eth_funded[funder] = eth_funded + eth_amount
+    if zk_amount > 0:
+        self.funder_to_zk_funded[funder] = zk_funded + zk_amount
+
+    # Add the funding to the buckets of the current period, restarting the buckets
+    # still holding the period `PERIOD_BUCKET_COUNT` periods ago (or an older one).
+    # Only the buckets of the funded assets are touched.
+    # @dev Within a period, the counters cannot exceed 32 bits, hence the unchecked
+    #   addition. The totals sit in the upper bits, so both are checked against
+    #   `PERIOD_AMOUNT_MAX` first, the ETH total like the ZK token total.
+    period: uint256 = block.timestamp // PERIOD_SECONDS
+    bucket_index: uint256 = period % PERIOD_BUCKET_COUNT
+    counts: uint256 = (
+        convert(record == 0, uint256) << PERIOD_NEW_FUNDER_COUNT_SHIFT
+    ) | (1 << PERIOD_FUNDING_COUNT_SHIFT)
+    if eth_amount > 0:
+        eth_bucket: uint256 = self.period_eth_bucket[bucket_index]
+        if eth_bucket & PERIOD_MASK != period:
+            eth_bucket = period
+        assert (
+            eth_bucket >> PERIOD_AMOUNT_SHIFT
+        ) + eth_amount <= PERIOD_AMOUNT_MAX, PERIOD_AMOUNT_OVERFLOW_ERROR
+        self.period_eth_bucket[bucket_index] = unsafe_add(
+            eth_bucket, (eth_amount << PERIOD_AMOUNT_SHIFT) | counts
+        )
+        counts = 0
+    if zk_amount > 0:
+        zk_bucket: uint256 = self.period_zk_bucket[bucket_index]
+        if zk_bucket & PERIOD_MASK != period:
+            zk_bucket = period
+        assert (
+            zk_bucket >> PERIOD_AMOUNT_SHIFT
+        ) + zk_amount <= PERIOD_AMOUNT_MAX, PERIOD_AMOUNT_OVERFLOW_ERROR
+        self.period_zk_bucket[bucket_index] = unsafe_add(
+            zk_bucket, (zk_amount << PERIOD_AMOUNT_SHIFT) | counts
+        )
+
+
+@internal
+def _permit(
+    zk_token_address: address,
+    funder: address,
+    amount: uint256,
+    deadline: uint256,
+    v: uint8,
+    r: bytes32,
+    s: bytes32,
+) -> bool:
+    """
+    @dev Submits a funder's EIP-2612 permit approving this contract for an amount.
+    @param zk_token_address The address of the ZK token contract.
+    @param funder The address of the funder, who signed the permit.
+    @param amount The amount of ZK tokens approved.
+    @param deadline The timestamp until which the permit is valid.
+    @param v The `v` parameter of the permit signature.
+    @param r The `r` parameter of the permit signature.
+    @param s The `s` parameter of the permit signature.
+    @return Whether the token accepted the permit.
+    @notice A call that does not revert is not enough: a token without `permit` but
+        with a fallback function accepts any call. The permit only counts once the
+        allowance of this contract covers `amount` after the call.
+    """
+    success: bool = raw_call(
+        zk_token_address,
+        abi_encode(
+            funder,
+            self,
+            amount,
+            deadline,
+            v,
+            r,
+            s,
+            method_id=method_id(
+                "permit(address,address,uint256,uint256,uint8,bytes32,bytes32)"
+            ),
+        ),
+        revert_on_failure=False,
+    )
+    return (
+        success
+        and staticcall IERC20(zk_token_address).allowance(funder, self) >= amount
+    )
+
+
+@internal
+@view
+def _two_map_record(funder: address) -> uint256:
+    """
+    @dev Reads the two totals of a funder into a packed funder record.
+    @param funder The address of the funder.
+    @return The packed funder record, as `funder_to_funded` holds it in FundMe.
+    """
+    return (
+        self.funder_to_eth_funded[funder] << FUNDED_ETH_SHIFT
+    ) | self.funder_to_zk_funded[funder]
+
+
+@internal
+@pure
+def _unpack_eth_funded(record: uint256) -> uint256:
+    """
+    @dev Extracts the ETH total from a packed funder record.
+    @param record The packed funder record.
+    @return The total amount of ETH funded (in wei).
+    """
+    return record >> FUNDED_ETH_SHIFT
+
+
+@internal
+@pure
+def _unpack_zk_funded(record: uint256) -> uint256:
+    """
+    @dev Extracts the ZK token total from a packed funder record.
+    @param record The packed funder record.
+    @return The total amount of ZK tokens funded (in wei).
+    """
+    return record & FUNDED_ZK_MASK
+
+
+@internal
+def _send_withdrawals(eth_amount: uint256, zk_amount: uint256):
+    """
+    @dev Sends checked amounts of ETH and ZK tokens to the owner and logs the withdrawals.
+    @param eth_amount The amount of ETH to withdraw (in wei).
+    @param zk_amount The amount of ZK tokens to withdraw (in wei).
+    @notice A zero amount is skipped, without a transfer or an event.
+    """
+    to: address = ownable.owner
+
+    if eth_amount > 0:
+        # Update the balance before transferring to prevent reentrancy issues.
+        self.balance_of_eth -= eth_amount
+        eth_sent: bool = raw_call(to, b"", value=eth_amount, revert_on_failure=False)
+        assert eth_sent, FUNDING_TRANSFER_FAILED_ERROR
+        log WithdrawEth(to=to, amount=eth_amount)
+
+    if zk_amount > 0:
+        zk_sent: bool = extcall IERC20(self.zk_token_address).transfer(
+            to, zk_amount, default_return_value=True
+        )
+        assert zk_sent, FUNDING_TRANSFER_FAILED_ERROR
+        log WithdrawZK(to=to, amount=zk_amount)
+
+
+@internal
+@view
+def _zk_token_balance() -> uint256:
+    """
+    @dev Reads the ZK token balance of the contract from the token.
+    @return The amount of ZK tokens held by the contract (in wei).
+    """
+    return staticcall IERC20(self.zk_token_address).balanceOf(self)
+
+
+################################################################
+#                        VIEW FUNCTIONS                        #
+################################################################
+@view
+@external
+def balance_of_zk_token() -> uint256:
+    """
+    @dev Returns the amount of ZK tokens in the contract available for withdrawal.
+    @return The ZK token balance of the contract (in wei).
+    @notice The balance is read from the token rather than mirrored in storage,
+        which saves an SLOAD and an SSTORE on every deposit and withdrawal.
+        ZK tokens transferred to the contract without funding are withdrawable too.
+    """
+    return self._zk_token_balance()
+
+
+@view
+@external
+def get_funder_eth_amount(funder: address) -> uint256:
+    """
+    @dev Returns the amount of ETH funded by a specific address.
+    @param funder The address of the funder.
+    @return The amount of ETH funded by the specified address.
+    """
+    return self._unpack_eth_funded(self._two_map_record(funder))
+
+
+@view
+@external
+def get_funder_zk_token_amount(funder: address) -> uint256:
+    """
+    @dev Returns the amount of ZK tokens funded by a specific address.
+    @param funder The address of the funder.
+    @return The amount of ZK tokens funded by the specified address.
+    """
+    return self._unpack_zk_funded(self._two_map_record(funder))
+
+
+@view
+@external
+def get_minimal_funding_amount() -> uint256:
+    """
+    @dev Returns the minimum funding amount in wei.
+    @return The minimum funding amount in wei.
+    """
+    return MINIMUM_FUNDING_AMOUNT_WEI
+
+
+@view
+@external
+def get_max_funders_batch_size() -> uint256:
+    """
+    @dev Returns the maximum number of funders that can be read in a single batched call.
+    @return The maximum number of funders per batch.
+    """
+    return MAX_FUNDERS_BATCH_SIZE
+
+
+@view
+@external
+def get_max_funding_intents_batch_size() -> uint256:
+    """
+    @dev Returns the maximum number of funding intents a relayer can submit in a single call.
+    @return The maximum number of funding intents per batch.
+    """
+    return MAX_FUNDING_INTENTS_BATCH_SIZE
+
+
+@view
+@external
+def get_current_period() -> uint256:
+    """
+    @dev Returns the current period of the donation totals.
+    @return The current period, i.e. `block.timestamp // PERIOD_SECONDS`.
+    """
+    return block.timestamp // PERIOD_SECONDS
+
+
+@view
+@external
+def get_zk_token_address() -> address:
+    """
+    @dev Returns the address of the ZK token contract.
+    @return The address of the ZK token contract.
+    """
+    return self.zk_token_address
+
+
+@view
+@external
+def get_dashboard(
+    funder: address,
+) -> (uint256, uint256, uint256, uint256, uint256, address):
+    """
+    @dev Returns everything the donation dashboard displays in a single call.
+    @param funder The address of the connected funder.
+    @return A tuple of the ETH balance, the ZK token balance, the funder count,
+        the ETH and ZK tokens funded by `funder` (in wei) and the owner address.
+    @notice Saves a client five RPC round trips compared to reading each value.
+    """
+    record: uint256 = self._two_map_record(funder)
+    return (
+        self.balance_of_eth,
+        self._zk_token_balance(),
+        self.funder_count,
+        self._unpack_eth_funded(record),
+        self._unpack_zk_funded(record),
+        ownable.owner,
+    )
+
+
+@view
+@external
+def get_funders_amounts(
+    funders: DynArray[address, MAX_FUNDERS_BATCH_SIZE],
+) -> DynArray[FunderAmounts, MAX_FUNDERS_BATCH_SIZE]:
+    """
+    @dev Returns the amounts funded by a batch of addresses in a single call.
+    @param funders The addresses of the funders, at most `MAX_FUNDERS_BATCH_SIZE`.
+    @return The ETH and ZK tokens funded by each address (in wei), in the same order.
+    @notice Lets a leaderboard of N funders cost one RPC call instead of 2N.
+    """
+    funders_amounts: DynArray[FunderAmounts, MAX_FUNDERS_BATCH_SIZE] = []
+    for funder: address in funders:
+        record: uint256 = self._two_map_record(funder)
+        funders_amounts.append(
+            FunderAmounts(
+                funder=funder,
+                eth_amount=self._unpack_eth_funded(record),
+                zk_token_amount=self._unpack_zk_funded(record),
+            )
+        )
+    return funders_amounts
+
+
+@view
+@external
+def get_funders(
+    offset: uint256, limit: uint256
+) -> DynArray[FunderAmounts, MAX_FUNDERS_BATCH_SIZE]:
+    """
+    @dev Returns a page of funders with their amounts, in order of first funding.
+    @param offset The index of the first funder of the page.
+    @param limit The maximum number of funders to return, capped at `MAX_FUNDERS_BATCH_SIZE`.
+    @return The funders of the page with the ETH and ZK tokens they funded (in wei).
+        The page is empty once `offset` reaches `funder_count`.
+    """
+    funders_amounts: DynArray[FunderAmounts, MAX_FUNDERS_BATCH_SIZE] = []
+    total_funders: uint256 = self.funder_count
+    if offset >= total_funders:
+        return funders_amounts
+
+    end: uint256 = offset + min(
+        min(limit, MAX_FUNDERS_BATCH_SIZE), total_funders - offset
+    )
+    for index: uint256 in range(offset, end, bound=MAX_FUNDERS_BATCH_SIZE):
+        funder: address = self.funder_at_index[index]
+        record: uint256 = self._two_map_record(funder)
+        funders_amounts.append(
+            FunderAmounts(
+                funder=funder,
+                eth_amount=self._unpack_eth_funded(record),
+                zk_token_amount=self._unpack_zk_funded(record),
+            )
+        )
+    return funders_amounts
+
+
+@view
+@external
+def get_period_totals(
+    start_period: uint256, count: uint256
+) -> DynArray[PeriodTotals, PERIOD_BUCKET_COUNT]:
+    """
+    @dev Returns the donation totals of consecutive periods, e.g. the last 7 days.
+    @param start_period The first period, see `get_current_period`.
+    @param count The number of periods to return, capped at `PERIOD_BUCKET_COUNT`.
+    @return The totals of each period from `start_period`, zero for periods
+        without fundings, including the periods to come.
+    @notice Only the last `PERIOD_BUCKET_COUNT` periods are kept, reading an older
+        one reverts.
+    """
+    current_period: uint256 = block.timestamp // PERIOD_SECONDS
+    assert start_period + PERIOD_BUCKET_COUNT > current_period, PERIOD_OUT_OF_RANGE_ERROR
+
+    periods_totals: DynArray[PeriodTotals, PERIOD_BUCKET_COUNT] = []
+    end: uint256 = start_period + min(count, PERIOD_BUCKET_COUNT)
+    for period: uint256 in range(start_period, end, bound=PERIOD_BUCKET_COUNT):
+        bucket_index: uint256 = period % PERIOD_BUCKET_COUNT
+        totals: PeriodTotals = empty(PeriodTotals)
+        totals.period = period
+        # @dev A bucket of another period is stale and replaced by an empty one.
+        eth_bucket: uint256 = self.period_eth_bucket[bucket_index]
+        if eth_bucket & PERIOD_MASK != period:
+            eth_bucket = 0
+        zk_bucket: uint256 = self.period_zk_bucket[bucket_index]
+        if zk_bucket & PERIOD_MASK != period:
+            zk_bucket = 0
+        totals.eth_amount = eth_bucket >> PERIOD_AMOUNT_SHIFT
+        totals.zk_token_amount = zk_bucket >> PERIOD_AMOUNT_SHIFT
+        totals.funding_count = (
+            (eth_bucket >> PERIOD_FUNDING_COUNT_SHIFT) & PERIOD_COUNT_MASK
+        ) + ((zk_bucket >> PERIOD_FUNDING_COUNT_SHIFT) & PERIOD_COUNT_MASK)
+        totals.new_funder_count = (
+            (eth_bucket >> PERIOD_NEW_FUNDER_COUNT_SHIFT) & PERIOD_COUNT_MASK
+        ) + ((zk_bucket >> PERIOD_NEW_FUNDER_COUNT_SHIFT) & PERIOD_COUNT_MASK)
+        periods_totals.append(totals)
+    return periods_totals
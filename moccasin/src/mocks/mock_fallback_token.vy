@@ -0,0 +1,69 @@
+# pragma version 0.4.1
+"""
+@license MIT
+@title Mock Fallback Token
+@notice A mock ERC20 token without `permit`, whose fallback function accepts any call.
+@dev This contract is only used to test that FundMe does not take a call reaching
+    the fallback function for an accepted permit.
+@author s3bc40
+"""
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+totalSupply: public(uint256)
+
+
+@external
+def mint(_to: address, _amount: uint256):
+    """
+    @notice Mint tokens to a specified address (Mocking).
+    @param _to The address to mint tokens to.
+    @param _amount The amount of tokens to mint.
+    """
+    self.balanceOf[_to] += _amount
+    self.totalSupply += _amount
+
+
+@external
+def approve(_spender: address, _amount: uint256) -> bool:
+    """
+    @notice Allow `_spender` to transfer `_amount` tokens of the sender.
+    @param _spender The address allowed to spend the tokens.
+    @param _amount The amount of tokens allowed.
+    """
+    self.allowance[msg.sender][_spender] = _amount
+    return True
+
+
+@external
+def transfer(_to: address, _amount: uint256) -> bool:
+    """
+    @notice Transfer tokens of the sender.
+    @param _to The address receiving the tokens.
+    @param _amount The amount of tokens to transfer.
+    """
+    self.balanceOf[msg.sender] -= _amount
+    self.balanceOf[_to] += _amount
+    return True
+
+
+@external
+def transferFrom(_from: address, _to: address, _amount: uint256) -> bool:
+    """
+    @notice Transfer approved tokens of `_from`.
+    @param _from The address sending the tokens.
+    @param _to The address receiving the tokens.
+    @param _amount The amount of tokens to transfer.
+    """
+    self.allowance[_from][msg.sender] -= _amount
+    self.balanceOf[_from] -= _amount
+    self.balanceOf[_to] += _amount
+    return True
+
+
+@external
+@payable
+def __default__():
+    """
+    @notice Accept any call to a missing function, `permit` included, doing nothing.
+    """
+    pass
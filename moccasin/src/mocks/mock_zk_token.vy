@@ -4,6 +4,7 @@
 @title Mock ZKsync Token
 @notice A mock implementation of the ZKsync token interface for testing purposes.
 @dev This contract implements snekmate's ZKsync token interface with ownable functionality.
+    It exports EIP-2612 `permit`, as the ZKsync token does.
 @author s3bc40
 """
 from snekmate.auth import ownable
@@ -17,6 +18,10 @@ exports: (
     erc20.totalSupply,
     erc20.transfer,
     erc20.transferFrom,
+    erc20.allowance,
+    erc20.permit,
+    erc20.nonces,
+    erc20.DOMAIN_SEPARATOR,
 )
 
 
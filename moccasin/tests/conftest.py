@@ -1,30 +1,58 @@
-# @dev you need to run `anvil --block-time 1` if you run on `anvil-staging` network
-#    you might have to run a few time to let it mine some blocks
+# @dev on the `anvil-staging` network, an empty anvil is launched once for the
+#    session, unless a node already runs, the staging fixtures deploy the contracts
+#    and the chain is reverted to a snapshot after each staging test
 import boa
+import math
+import os
 import pytest
+import statistics
 
-from hypothesis import settings
+from hypothesis import HealthCheck, settings
 from moccasin.boa_tools import VyperContract
 from moccasin.config import get_active_network
+from moccasin.moccasin_account import MoccasinAccount
+from pathlib import Path
 from script import deploy_fund_me
-from src.mocks import mock_zk_token
+from script.mocks import deploy_mock_zk_token
+from utils.anvil import AnvilNode
+from utils.artifacts import load_contract
+from utils.async_rpc import AsyncRpcReader
 from utils.constants import (
+    ANVIL_DICT_ADDRESSES,
     FUNDER_COUNT,
     FUNDER_INITIAL_BALANCE_WEI,
+    FUNDER_POOL_DIR,
+    FUNDER_POOL_SEED,
+    FUNDER_POOL_SIZE,
+    INVARIANT_MAX_EXAMPLES,
+    INVARIANT_STEP_COUNT,
+    STAGING_BLOCK_TIME_SECONDS,
 )
+from utils.funder_pool import fund_pool, generate_pool_funders, load_funder_pool
+from utils.view_cache import CachedContract, ViewCacheStats
 
 
 ################################################################
 #                           SETTINGS                           #
 ################################################################
 active_network = get_active_network()
+fund_me_contract = load_contract("src/fund_me.vy")
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+fund_me_two_maps_contract = load_contract("src/mocks/fund_me_two_maps.vy")
+fund_me_mirror_contract = load_contract("src/mocks/fund_me_zk_balance_mirror.vy")
 
 # Hypothesis settings
 # @dev see https://hypothesis.readthedocs.io/en/latest/reference/api.html#hypothesis.settings
+# @dev `script/run_invariant_shards.py` sets INVARIANT_SHARD_COUNT so that each shard
+#    runs its share of the invariant examples
+# @dev every step of an invariant example calls the contracts, which Hypothesis
+#    counts as slow data generation
+invariant_shard_count = int(os.environ.get("INVARIANT_SHARD_COUNT", 1))
 settings.register_profile(
     "invariant",
-    max_examples=256,
-    stateful_step_count=50,
+    max_examples=math.ceil(INVARIANT_MAX_EXAMPLES / invariant_shard_count),
+    stateful_step_count=INVARIANT_STEP_COUNT,
+    suppress_health_check=[HealthCheck.too_slow],
 )
 # @dev set examples to 1 with eravm since not supported with boa-zksync
 settings.register_profile(
@@ -34,6 +62,13 @@ settings.register_profile(
 )
 settings.register_profile("zksync_invariant", max_examples=1, stateful_step_count=1)
 
+# @dev the anvil node shared by the staging session, see `pytest_configure`
+staging_node: AnvilNode | None = None
+# @dev setup and teardown seconds per test, see `pytest_runtest_logreport`
+test_overheads: dict[str, float] = {}
+# @dev view calls of the staging session, see `staging_views`
+staging_view_stats = ViewCacheStats()
+
 
 # Pytest hook to configure Hypothesis settings based on the active network
 def pytest_configure(config):
@@ -51,6 +86,65 @@ def pytest_configure(config):
         settings.load_profile("default")  # 'default' is a built-in Hypothesis profile
         print("\n[Hypothesis] Loaded profile: 'default'")
 
+    config.addinivalue_line(
+        "markers", "block_time: mine staging blocks at a fixed interval, not instantly"
+    )
+    if active_network.name == "anvil-staging":
+        global staging_node
+        # @dev started empty, the staging fixtures deploy the contracts they test
+        staging_node = AnvilNode(active_network.url)
+        if staging_node.start():
+            print(f"\n[Anvil] Started at {active_network.url}")
+
+
+def pytest_unconfigure(config):
+    """
+    Called before the test process exits, stops the anvil started for staging.
+    """
+    if staging_node is not None:
+        staging_node.stop()
+
+
+def pytest_runtest_logreport(report):
+    """
+    Called after the setup, the call and the teardown of each test. With
+    TEST_OVERHEAD_REPORT set, sums the setup and teardown durations per test.
+    """
+    if os.environ.get("TEST_OVERHEAD_REPORT") and report.when != "call":
+        test_overheads[report.nodeid] = (
+            test_overheads.get(report.nodeid, 0.0) + report.duration
+        )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Called at the end of the run, reports the overheads summed by
+    `pytest_runtest_logreport`, session fixtures being paid by the first test
+    requesting them. With VIEW_CACHE_REPORT set, reports the view calls of
+    `staging_views` served by its cache and the RPC round trips of the others.
+    """
+    if os.environ.get("VIEW_CACHE_REPORT") and staging_view_stats.misses:
+        terminalreporter.write_sep("=", "staging view cache")
+        for name, row in staging_view_stats.summary().items():
+            terminalreporter.write_line(
+                f"{name}: {row['hits']} hits, {row['misses']} misses, "
+                f"{row['hit_rate']:.2%} hit rate, {row['round_trips']} round trips"
+            )
+    if not test_overheads:
+        return
+    overheads = list(test_overheads.values())
+    slowest = max(test_overheads, key=test_overheads.get)
+    terminalreporter.write_sep("=", "per-test overhead (setup and teardown)")
+    terminalreporter.write_line(f"tests: {len(overheads)}")
+    terminalreporter.write_line(f"total: {sum(overheads):.3f}s")
+    terminalreporter.write_line(f"mean: {statistics.mean(overheads) * 1000:.2f}ms")
+    terminalreporter.write_line(
+        f"median: {statistics.median(overheads) * 1000:.2f}ms"
+    )
+    terminalreporter.write_line(
+        f"max: {test_overheads[slowest] * 1000:.2f}ms ({slowest})"
+    )
+
 
 ################################################################
 #                        UNIT FIXTURES                         #
@@ -96,6 +190,114 @@ def funders(mock_zktoken) -> list[str]:
     return funders
 
 
+@pytest.fixture(scope="session")
+def funder_pool(mock_zktoken, pytestconfig) -> list[str]:
+    """Fixture to provide a large pool of funders' addresses for fuzzed tests.
+
+    Each funder holds ETH and ZK tokens. The pool is restored from its snapshot
+    in `FUNDER_POOL_DIR` when one matches the ZK token state, funded and
+    snapshotted otherwise. Tests change it copy-on-write: the isolation anchor
+    of each test journals the accounts it writes and reverts only those.
+    """
+    if active_network.is_zksync:
+        funders = generate_pool_funders(FUNDER_POOL_SIZE, FUNDER_POOL_SEED)
+        fund_pool(mock_zktoken, funders, FUNDER_INITIAL_BALANCE_WEI)
+        return funders
+    return load_funder_pool(
+        mock_zktoken,
+        FUNDER_POOL_SIZE,
+        FUNDER_POOL_SEED,
+        FUNDER_INITIAL_BALANCE_WEI,
+        Path(pytestconfig.rootpath) / FUNDER_POOL_DIR,
+    )
+
+
+@pytest.fixture(scope="session")
+def permit_funder(mock_zktoken) -> MoccasinAccount:
+    """Fixture to provide a funder with a known private key, to sign permits.
+
+    Returns an account funded with ETH and ZK tokens.
+    """
+    account = MoccasinAccount(ANVIL_DICT_ADDRESSES["funder_zk"]["private"])
+    boa.env.set_balance(account.address, FUNDER_INITIAL_BALANCE_WEI)
+    mock_zktoken.mint(account.address, FUNDER_INITIAL_BALANCE_WEI)
+    return account
+
+
+################################################################
+#                         GAS FIXTURES                         #
+################################################################
+@pytest.fixture
+def gas_env() -> boa.Env:
+    """Fixture to provide a fresh boa environment for gas measurements.
+
+    Gas is measured on contracts deployed in a dedicated environment, so the
+    measures do not depend on the state left by the session fixtures. It is
+    thrown away after the test.
+    """
+    with boa.swap_env(boa.Env()):
+        yield boa.env
+
+
+@pytest.fixture
+def gas_fund_me(gas_env) -> VyperContract:
+    """Fixture to provide a FundMe contract instance in the gas environment.
+
+    Deploys the mock ZK token and the FundMe contract from scratch.
+    """
+    zksync_token: VyperContract = deploy_mock_zk_token.deploy()
+    return fund_me_contract.deploy(zksync_token.address)
+
+
+@pytest.fixture
+def gas_mock_zktoken(gas_fund_me) -> VyperContract:
+    """Fixture to provide the mock ZK token used by `gas_fund_me`."""
+    return mock_zk_token.at(gas_fund_me.get_zk_token_address())
+
+
+@pytest.fixture
+def gas_two_map_fund_me(gas_mock_zktoken) -> VyperContract:
+    """Fixture to provide FundMe with its funder totals in two HashMaps.
+
+    Deployed next to `gas_fund_me` from `src/mocks/fund_me_two_maps.vy`.
+    """
+    return fund_me_two_maps_contract.deploy(gas_mock_zktoken.address)
+
+
+@pytest.fixture
+def gas_mirror_fund_me(gas_mock_zktoken) -> VyperContract:
+    """Fixture to provide FundMe with its ZK token balance mirrored in storage.
+
+    Deployed next to `gas_fund_me` from `src/mocks/fund_me_zk_balance_mirror.vy`.
+    """
+    return fund_me_mirror_contract.deploy(gas_mock_zktoken.address)
+
+
+@pytest.fixture
+def gas_funders(gas_env, gas_mock_zktoken) -> list[str]:
+    """Fixture to provide funders' addresses in the gas environment.
+
+    Returns a list of addresses funded with ETH and ZK tokens.
+    """
+    funders = [boa.env.generate_address(f"gas_funder_{i}") for i in range(FUNDER_COUNT)]
+    for funder in funders:
+        boa.env.set_balance(funder, FUNDER_INITIAL_BALANCE_WEI)
+        gas_mock_zktoken.mint(funder, FUNDER_INITIAL_BALANCE_WEI)
+    return funders
+
+
+@pytest.fixture
+def gas_permit_funder(gas_env, gas_mock_zktoken) -> MoccasinAccount:
+    """Fixture to provide a funder signing permits in the gas environment.
+
+    Returns an account funded with ETH and ZK tokens.
+    """
+    account = MoccasinAccount(ANVIL_DICT_ADDRESSES["funder_new"]["private"])
+    boa.env.set_balance(account.address, FUNDER_INITIAL_BALANCE_WEI)
+    gas_mock_zktoken.mint(account.address, FUNDER_INITIAL_BALANCE_WEI)
+    return account
+
+
 ################################################################
 #                       STAGING FIXTURES                       #
 ################################################################
@@ -109,21 +311,86 @@ def staging_fund_contract() -> VyperContract:
 
 
 @pytest.fixture(scope="session")
-def staging_zktoken(staging_fund_contract) -> VyperContract:
+def staging_views(staging_fund_contract) -> CachedContract:
+    """Fixture to provide the FundMe contract with its views cached.
+
+    Views are cached per block and dropped by its state-changing calls and
+    after each staging test, constants are memoized for the session.
+    """
+    return CachedContract(staging_fund_contract, staging_view_stats)
+
+
+@pytest.fixture(scope="session")
+def staging_zktoken(staging_views) -> VyperContract:
     """Fixture to provide a mock ZK token contract instance for staging tests.
 
     Returns the mock ZK token contract instance used by the FundMe contract.
     """
     # return active_network.manifest_named("zktoken")
-    return mock_zk_token.at(staging_fund_contract.get_zk_token_address())
+    return mock_zk_token.at(staging_views.get_zk_token_address())
 
 
 @pytest.fixture(scope="session")
-def staging_owner(staging_fund_contract, staging_zktoken) -> str:
+def staging_owner(staging_views, staging_zktoken) -> str:
     """Fixture to provide the owner address for staging tests.
 
     Returns the address of the owner.
     """
-    owner: str = staging_fund_contract.owner()
+    owner: str = staging_views.owner()
     staging_zktoken.mint(owner, FUNDER_INITIAL_BALANCE_WEI)
     return owner
+
+
+@pytest.fixture(scope="session")
+def staging_anvil() -> AnvilNode | None:
+    """Fixture to provide the anvil node of the staging session.
+
+    Returns `None` when the staging network is not anvil.
+    """
+    return staging_node
+
+
+@pytest.fixture(scope="session")
+def staging_snapshot(staging_fund_contract, staging_owner) -> list[str]:
+    """Fixture to provide the snapshot staging tests are reverted to.
+
+    Taken once the contracts are deployed and the owner minted, so tests reuse
+    them instead of redeploying. Anvil forgets a snapshot reverted to, hence
+    the id is replaced after each revert.
+    """
+    return [staging_node.snapshot()]
+
+
+@pytest.fixture(autouse=True)
+def staging_isolation(request):
+    """Fixture to revert the anvil chain after each staging test.
+
+    Blocks are mined instantly, unless the test is marked `block_time`.
+    """
+    if staging_node is None or request.node.get_closest_marker("staging") is None:
+        yield
+        return
+    snapshot = request.getfixturevalue("staging_snapshot")
+    if request.node.get_closest_marker("block_time") is None:
+        staging_node.set_instant_mining()
+    else:
+        staging_node.set_block_time(STAGING_BLOCK_TIME_SECONDS)
+    yield
+    staging_node.revert(snapshot[0])
+    snapshot[0] = staging_node.snapshot()
+    # @dev boa keeps forking at the last block it saw, which the revert dropped
+    boa.env._reset_fork()
+    # @dev the reverted chain mines the same block numbers again
+    request.getfixturevalue("staging_views").invalidate()
+
+
+@pytest.fixture(scope="session")
+def staging_reader() -> AsyncRpcReader:
+    """Fixture to provide a batched RPC reader for staging tests.
+
+    Reads independent view calls and balances concurrently over pooled
+    connections to the active network.
+    """
+    reader = AsyncRpcReader(active_network.url)
+    yield reader
+    reader.close()
@@ -1,51 +1,173 @@
 import boa
+import os
+import pytest
+import time
 
 from boa.test.strategies import strategy as st_boa
-from hypothesis import assume, settings
-from hypothesis.stateful import RuleBasedStateMachine, rule, invariant, initialize
+from boa.vm.gas_meters import ProfilingGasMeter
+from contextlib import ExitStack
+from hypothesis import assume, currently_in_test_context, seed, settings
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    initialize,
+    invariant,
+    precondition,
+    rule,
+    run_state_machine_as_test,
+)
 
-from moccasin.config import get_active_network
+from moccasin.boa_tools import VyperContract
+from moccasin.config import get_active_network, get_config
+from pathlib import Path
 from script import deploy_fund_me
-from src.mocks import mock_zk_token
+from utils.artifacts import load_contract
 from utils.constants import (
+    COVERAGE_FUZZ_CORPUS_PATH,
+    COVERAGE_FUZZ_EXECUTIONS,
     FUNDER_INITIAL_BALANCE_WEI,
     FUZZING_FUNDER_COUNT,
     FUZZING_MAX_FUNDING_AMOUNT_WEI,
     FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI,
+    MAX_FUNDERS_BATCH_SIZE,
+    INVARIANT_STEP_COUNT,
     MINIMUM_FUNDING_AMOUNT_WEI,
 )
+from utils.coverage_fuzz import (
+    ArgRange,
+    Step,
+    coverage_features,
+    diff_hits,
+    fuzz,
+    if_branches,
+    line_hits,
+    load_corpus,
+    save_corpus,
+)
+from utils.fund_me_model import FundMeModel
+
+fund_me_contract = load_contract("src/fund_me.vy")
+mock_zk_token = load_contract("src/mocks/mock_zk_token.vy")
+
+
+def assume_rule(condition: bool):
+    """Skips the example when a rule's assumption fails, as `assume` does.
+
+    Rules are also run outside of Hypothesis by `execute_rule_sequence`, which
+    checks their `can_<rule>` method beforehand, so `assume` is only called
+    within a Hypothesis test, where it is supported.
+    """
+    if currently_in_test_context():
+        assume(condition)
 
 
 class InvariantTestFundMe(RuleBasedStateMachine):
     """Stateful test for the FundMe contract using Hypothesis."""
 
+    # @dev golden deployment shared by every example, see `deploy_golden`. boa
+    #    anchors each Hypothesis example, so the `golden_deployment` fixture
+    #    deploys it before the examples run, within the module's anchor.
+    golden: tuple[VyperContract, VyperContract, FundMeModel, list[str]] | None = None
+
     def __init__(self):
         super().__init__()
+        self.exit_stack = ExitStack()
+
+    @classmethod
+    def deploy_golden(
+        cls,
+    ) -> tuple[VyperContract, VyperContract, FundMeModel, list[str]]:
+        """Deploy the FundMe contract and funders once for the whole run.
+
+        This function deploys the FundMe contract and creates a list of funders
+        with specified amounts of ETH and ZK token. Examples revert to this
+        state instead of redeploying it.
+
+        :returns: tuple: The FundMe contract, the mock ZK token, the reference
+            model of the golden state, the funders.
+        """
+        if cls.golden is None:
+            # Deploy the FundMe contract
+            fund_me = deploy_fund_me.deploy()
+            # Deploy the mock ZK token
+            mock_zktoken = mock_zk_token.at(fund_me.get_zk_token_address())
+            # Create a list of funders with initial balances
+            funders: list[str] = []
+            for i in range(FUZZING_FUNDER_COUNT):
+                funder_address: str = boa.env.generate_address(f"funder-{i}")
+                # Set the balance of the funder to the specified amount
+                boa.env.set_balance(funder_address, FUNDER_INITIAL_BALANCE_WEI)
+                mock_zktoken.mint(funder_address, FUNDER_INITIAL_BALANCE_WEI)
+                # Append the funder address to the list
+                funders.append(funder_address)
+            owner = fund_me.owner()
+            accounts = [owner, *funders]
+            model = FundMeModel(
+                owner,
+                {account: boa.env.get_balance(account) for account in accounts},
+                {account: mock_zktoken.balanceOf(account) for account in accounts},
+            )
+            cls.golden = (fund_me, mock_zktoken, model, funders)
+        return cls.golden
 
     # --- Setup the initial state of the test
     @initialize()
     def setup(self):
         """Initialize the FundMe contract and funders.
 
-        This function deploys the FundMe contract and creates a list of funders
-        with specified amounts of ETH and ZK token.
-
-        :param amount_wei: The amount of ETH to fund each funder with.
+        This function gets the golden deployment and anchors the state, so
+        that `teardown` reverts the example back to the golden deployment.
         """
-        # Deploy the FundMe contract
-        self.fund_me = deploy_fund_me.deploy()
-        self.owner: str = self.fund_me.owner()
-        # Deploy the mock ZK token
-        self.mock_zktoken = mock_zk_token.at(self.fund_me.get_zk_token_address())
-        # Create a list of funders with initial balances
-        self.funders: list[str] = []
-        for i in range(FUZZING_FUNDER_COUNT):
-            funder_address: str = boa.env.generate_address(f"funder-{i}")
-            # Set the balance of the funder to the specified amount
-            boa.env.set_balance(funder_address, FUNDER_INITIAL_BALANCE_WEI)
-            self.mock_zktoken.mint(funder_address, FUNDER_INITIAL_BALANCE_WEI)
-            # Append the funder address to the list
-            self.funders.append(funder_address)
+        self.fund_me, self.mock_zktoken, golden_model, funders = self.deploy_golden()
+        self.funders: list[str] = list(funders)
+        self.owner = golden_model.owner
+        # Reference model stepped with the contract, starting from the golden state
+        self.model = FundMeModel(
+            golden_model.owner,
+            golden_model.eth_balances,
+            golden_model.zk_token_balances,
+        )
+        # Funders already compared with the funder list of the contract
+        self.listed_funder_count = 0
+        self.exit_stack.enter_context(boa.env.anchor())
+
+    def teardown(self):
+        """Revert the state changed by the example."""
+        self.exit_stack.close()
+
+    # --- Assumptions of the rules, also checked when replaying rule sequences
+    def can_fund_eth(self, funder_index: int, amount_wei: int) -> bool:
+        """Whether the funder has enough ETH to fund `amount_wei`."""
+        return self.model.eth_balances[self.funders[funder_index]] >= amount_wei
+
+    def can_fund_zk_token(self, funder_index: int, amount_wei: int) -> bool:
+        """Whether the funder has enough ZK token to fund `amount_wei`."""
+        return self.model.zk_token_balances[self.funders[funder_index]] >= amount_wei
+
+    def can_transfer_zk_token_directly(
+        self, funder_index: int, amount_wei: int
+    ) -> bool:
+        """Whether the funder has enough ZK token to transfer `amount_wei`."""
+        return self.can_fund_zk_token(funder_index, amount_wei)
+
+    def can_withdraw_eth(self, amount_wei: int) -> bool:
+        """Whether the contract holds enough ETH to withdraw `amount_wei`."""
+        return self.model.balance_of_eth >= amount_wei
+
+    def can_withdraw_zk_token(self, amount_wei: int) -> bool:
+        """Whether the contract holds enough ZK token to withdraw `amount_wei`."""
+        return self.model.balance_of_zk_token >= amount_wei
+
+    def can_withdraw(self, eth_amount_wei: int, zk_amount_wei: int) -> bool:
+        """Whether the contract holds both amounts, at least one not being zero."""
+        return (
+            (eth_amount_wei > 0 or zk_amount_wei > 0)
+            and self.can_withdraw_eth(eth_amount_wei)
+            and self.can_withdraw_zk_token(zk_amount_wei)
+        )
+
+    def can_withdraw_all(self) -> bool:
+        """Whether the contract holds some ETH or ZK token."""
+        return self.model.balance_of_eth > 0 or self.model.balance_of_zk_token > 0
 
     # --- Funder fund the contract with ETH.
     @rule(
@@ -66,11 +188,12 @@ class InvariantTestFundMe(RuleBasedStateMachine):
         :param funder_index: The index of the funder in the funders list.
         :param amount_wei: The amount of ETH to fund the contract with.
         """
-        funder = self.funders[funder_index]
         # Ensure the funder has enough balance to fund the contract
-        assume(boa.env.get_balance(funder) >= amount_wei)
+        assume_rule(self.can_fund_eth(funder_index, amount_wei))
+        funder = self.funders[funder_index]
         with boa.env.prank(funder):
             self.fund_me.fund_eth(value=amount_wei)
+        self.model.fund(funder, amount_wei, 0)
 
     # --- Funder funds the contract with ZK token
     @rule(
@@ -91,14 +214,39 @@ class InvariantTestFundMe(RuleBasedStateMachine):
         :param funder_index: The index of the funder in the funders list.
         :param amount_wei: The amount of ZK token to fund the contract with.
         """
-        funder = self.funders[funder_index]
         # Ensure the funder has enough balance to fund the contract
-        assume(self.mock_zktoken.balanceOf(funder) >= amount_wei)
+        assume_rule(self.can_fund_zk_token(funder_index, amount_wei))
+        funder = self.funders[funder_index]
         with boa.env.prank(funder):
             # Approve the FundMe contract to spend the ZK token
             self.mock_zktoken.approve(self.fund_me.address, amount_wei)
             # Fund the contract with ZK token
             self.fund_me.fund_zk_token(amount_wei)
+        self.model.fund(funder, 0, amount_wei)
+
+    # --- Funder sends ZK token to the contract without funding
+    @rule(
+        funder_index=st_boa("uint256", min_value=0, max_value=FUZZING_FUNDER_COUNT - 1),
+        amount_wei=st_boa(
+            "uint256",
+            min_value=1,
+            max_value=FUZZING_MAX_FUNDING_AMOUNT_WEI,
+        ),
+    )
+    def transfer_zk_token_directly(self, funder_index: int, amount_wei: int):
+        """Funder transfers ZK token to the contract without calling a fund function.
+
+        The transferred tokens are not recorded for the funder, but they are
+        part of the ZK token balance available for withdrawal.
+
+        :param funder_index: The index of the funder in the funders list.
+        :param amount_wei: The amount of ZK token to transfer to the contract.
+        """
+        assume_rule(self.can_transfer_zk_token_directly(funder_index, amount_wei))
+        funder = self.funders[funder_index]
+        with boa.env.prank(funder):
+            self.mock_zktoken.transfer(self.fund_me.address, amount_wei)
+        self.model.transfer_zk_token(funder, amount_wei)
 
     # --- Withdraw funds from the contract
     @rule(
@@ -108,6 +256,7 @@ class InvariantTestFundMe(RuleBasedStateMachine):
             max_value=FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI,
         )
     )
+    @precondition(lambda self: self.model.balance_of_eth > 0)
     def withdraw_eth(self, amount_wei: int):
         """Withdraw ETH from the FundMe contract.
 
@@ -117,9 +266,10 @@ class InvariantTestFundMe(RuleBasedStateMachine):
 
         :param amount_wei: The amount of ETH to withdraw from the contract.
         """
-        assume(boa.env.get_balance(self.fund_me.address) >= amount_wei)
+        assume_rule(self.can_withdraw_eth(amount_wei))
         with boa.env.prank(self.owner):
             self.fund_me.withdraw_eth(amount_wei)
+        self.model.withdraw(amount_wei, 0)
 
     # --- Withdraw ZK token from the contract
     @rule(
@@ -129,6 +279,7 @@ class InvariantTestFundMe(RuleBasedStateMachine):
             max_value=FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI,
         )
     )
+    @precondition(lambda self: self.model.balance_of_zk_token > 0)
     def withdraw_zk_token(self, amount_wei: int):
         """Withdraw ZK token from the FundMe contract.
 
@@ -138,50 +289,310 @@ class InvariantTestFundMe(RuleBasedStateMachine):
 
         :param amount_wei: The amount of ZK token to withdraw from the contract.
         """
-        assume(self.mock_zktoken.balanceOf(self.fund_me.address) >= amount_wei)
+        assume_rule(self.can_withdraw_zk_token(amount_wei))
         with boa.env.prank(self.owner):
             self.fund_me.withdraw_zk_token(amount_wei)
+        self.model.withdraw(0, amount_wei)
 
-    # --- Balance of ETH in the contract should never exceed the contract's balance
+    # --- Withdraw ETH and ZK token from the contract in a single call
+    @rule(
+        eth_amount_wei=st_boa(
+            "uint256",
+            min_value=0,
+            max_value=FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI,
+        ),
+        zk_amount_wei=st_boa(
+            "uint256",
+            min_value=0,
+            max_value=FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI,
+        ),
+    )
+    @precondition(
+        lambda self: self.model.balance_of_eth > 0 or self.model.balance_of_zk_token > 0
+    )
+    def withdraw(self, eth_amount_wei: int, zk_amount_wei: int):
+        """Withdraw ETH and ZK token from the FundMe contract at once.
+
+        This function allows the owner of the contract to withdraw specified
+        amounts of both assets in one call. It assumes that the contract holds
+        enough of each asset and that at least one amount is not zero.
+
+        :param eth_amount_wei: The amount of ETH to withdraw from the contract.
+        :param zk_amount_wei: The amount of ZK token to withdraw from the contract.
+        """
+        assume_rule(self.can_withdraw(eth_amount_wei, zk_amount_wei))
+        with boa.env.prank(self.owner):
+            self.fund_me.withdraw(eth_amount_wei, zk_amount_wei)
+        self.model.withdraw(eth_amount_wei, zk_amount_wei)
+
+    # --- Withdraw everything from the contract
+    @rule()
+    @precondition(
+        lambda self: self.model.balance_of_eth > 0 or self.model.balance_of_zk_token > 0
+    )
+    def withdraw_all(self):
+        """Withdraw all the ETH and ZK token from the FundMe contract.
+
+        It assumes that the contract holds some ETH or ZK token, and checks
+        that nothing is left afterwards.
+        """
+        assume_rule(self.can_withdraw_all())
+        with boa.env.prank(self.owner):
+            self.fund_me.withdraw_all()
+        self.model.withdraw_all()
+        assert self.fund_me.balance_of_eth() == 0
+        assert self.fund_me.balance_of_zk_token() == 0
+
+    # --- Contract totals should match the reference model
     @invariant()
-    def balance_of_eth_should_never_exceed_contract_balance(self):
-        """Invariant check to ensure the balance of ETH in the contract never exceeds the contract's balance."""
+    def totals_should_match_model(self):
+        """Invariant check to ensure the contract totals and owner match the model.
+
+        A single `get_dashboard` call reads them all, the ZK token balance from
+        the token.
+        """
+        balance_of_eth, balance_of_zk_token, funder_count, _, _, owner = (
+            self.fund_me.get_dashboard(self.owner)
+        )
         contract_balance = boa.env.get_balance(self.fund_me.address)
-        computed_balance = self.fund_me.balance_of_eth()
-        assert computed_balance <= contract_balance, (
-            f"Balance of ETH in the contract ({computed_balance}) exceeds "
-            f"the contract's balance ({contract_balance})"
+        expected = (
+            self.model.balance_of_eth,
+            self.model.balance_of_eth,
+            self.model.balance_of_zk_token,
+            self.model.funder_count,
+            self.model.owner,
+        )
+        actual = (
+            balance_of_eth,
+            contract_balance,
+            balance_of_zk_token,
+            funder_count,
+            owner,
+        )
+        assert actual == expected, (
+            "balance_of_eth, ETH balance, balance_of_zk_token, funder_count and "
+            f"owner of the contract {actual} do not match the model {expected}"
         )
 
-    # --- Balance of ZK token in the contract should never exceed the contract's balance
+    # --- New funders should be listed once, in order of first funding
     @invariant()
-    def balance_of_zk_token_should_never_exceed_contract_balance(self):
-        """Invariant check to ensure the balance of ZK token in the contract never exceeds the contract's balance."""
-        contract_balance = self.mock_zktoken.balanceOf(self.fund_me.address)
-        computed_balance = self.fund_me.balance_of_zk_token()
-        assert computed_balance <= contract_balance, (
-            f"Balance of ZK token in the contract ({computed_balance}) exceeds "
-            f"the contract's balance ({contract_balance})"
+    def new_funders_should_match_model(self):
+        """Invariant check to ensure funders are listed in the model's order.
+
+        Only the funders added since the last step are read, the earlier ones
+        being checked already.
+        """
+        listed = self.listed_funder_count
+        if listed == self.model.funder_count:
+            return
+        page = self.fund_me.get_funders(listed, MAX_FUNDERS_BATCH_SIZE)
+        new_funders = [funder.funder for funder in page]
+        assert new_funders == self.model.funders[listed:], (
+            f"Funders listed from index {listed} ({new_funders}) do not match "
+            f"the model ({self.model.funders[listed:]})"
         )
+        self.listed_funder_count = self.model.funder_count
 
-    # --- Funder count should not be doubled from funding ETH and ZK token
+    # --- Changed funder records and account balances should match the model
     @invariant()
-    def funder_count_should_not_double(self):
-        """Invariant check to ensure the funder count does not double from funding ETH and ZK token."""
-        # Get the funder count from the contract
-        contract_funder_count = self.fund_me.funder_count()
-        max_funder_count = len(self.funders)
-        assert contract_funder_count <= max_funder_count, (
-            f"Funder count in the contract ({contract_funder_count}) exceeds "
-            f"the maximum funder count ({max_funder_count})"
-        )
+    def changed_accounts_should_match_model(self):
+        """Invariant check to ensure funded totals and balances are the model's.
+
+        Only the accounts changed by the last step are read, the others being
+        unchanged in the model since they were last checked.
+        """
+        changed = self.model.pop_changed()
+        if not changed:
+            return
+        funders_amounts = self.fund_me.get_funders_amounts(changed)
+        for account, amounts in zip(changed, funders_amounts):
+            expected = (
+                self.model.funded_eth.get(account, 0),
+                self.model.funded_zk_token.get(account, 0),
+                self.model.eth_balances[account],
+                self.model.zk_token_balances[account],
+            )
+            actual = (
+                amounts.eth_amount,
+                amounts.zk_token_amount,
+                boa.env.get_balance(account),
+                self.mock_zktoken.balanceOf(account),
+            )
+            assert actual == expected, (
+                f"Funded ETH, funded ZK token, ETH and ZK token balances of "
+                f"{account} {actual} do not match the model {expected}"
+            )
 
 
 # --- Run the stateful test
 # Get the active network configuration
 active_network = get_active_network()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def golden_deployment():
+    """Fixture to deploy the golden state once for the tests of the module.
+
+    Deployed within an example, it would be reverted with the example.
+    """
+    InvariantTestFundMe.deploy_golden()
+    yield
+    InvariantTestFundMe.golden = None
+
+
+# Seed the shard when `script/run_invariant_shards.py` runs with a base seed
+# @dev Hypothesis does not use the example database for seeded runs
+if (shard_seed := os.environ.get("INVARIANT_SHARD_SEED")) is not None:
+    InvariantTestFundMe = seed(int(shard_seed))(InvariantTestFundMe)
 # Set the Hypothesis settings for the test by checking if the network is ZKSync
 invariant_test_fund_me = InvariantTestFundMe.TestCase
 invariant_test_fund_me.settings = settings.get_profile(
     "zksync_invariant" if active_network.is_zksync else "invariant"
 )
+
+
+################################################################
+#                   COVERAGE-GUIDED FUZZING                    #
+################################################################
+# @dev argument ranges of the rules, as drawn by their strategies
+FUNDER_INDEX = ArgRange(0, FUZZING_FUNDER_COUNT - 1)
+RULE_ARGS = {
+    "fund_eth": {
+        "funder_index": FUNDER_INDEX,
+        "amount_wei": ArgRange(
+            MINIMUM_FUNDING_AMOUNT_WEI, FUZZING_MAX_FUNDING_AMOUNT_WEI
+        ),
+    },
+    "fund_zk_token": {
+        "funder_index": FUNDER_INDEX,
+        "amount_wei": ArgRange(
+            MINIMUM_FUNDING_AMOUNT_WEI, FUZZING_MAX_FUNDING_AMOUNT_WEI
+        ),
+    },
+    "transfer_zk_token_directly": {
+        "funder_index": FUNDER_INDEX,
+        "amount_wei": ArgRange(1, FUZZING_MAX_FUNDING_AMOUNT_WEI),
+    },
+    "withdraw_eth": {"amount_wei": ArgRange(1, FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI)},
+    "withdraw_zk_token": {
+        "amount_wei": ArgRange(1, FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI)
+    },
+    "withdraw": {
+        "eth_amount_wei": ArgRange(0, FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI),
+        "zk_amount_wei": ArgRange(0, FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI),
+    },
+    "withdraw_all": {},
+}
+INVARIANTS = (
+    "totals_should_match_model",
+    "new_funders_should_match_model",
+    "changed_accounts_should_match_model",
+)
+
+
+def execute_rule_sequence(
+    steps: list[Step], branches: list | None = None
+) -> frozenset[str]:
+    """Runs a rule sequence as an example of `InvariantTestFundMe`.
+
+    Steps whose assumptions fail are skipped, as Hypothesis would, by checking
+    the `can_<rule>` method of their rule rather than calling `assume` outside
+    of a Hypothesis test, and the invariants are checked after every other step.
+
+    :param branches: The `if` statements of `fund_me.vy`, see `if_branches`.
+        Coverage is only measured when given, under `ProfilingGasMeter`.
+    :returns: frozenset[str]: The coverage features of `fund_me.vy` reached.
+    """
+    before = line_hits("fund_me.vy") if branches is not None else {}
+    machine = InvariantTestFundMe()
+    machine.setup()
+    try:
+        for step in steps:
+            if not getattr(machine, f"can_{step.rule}")(**step.args):
+                continue
+            getattr(machine, step.rule)(**step.args)
+            for invariant_name in INVARIANTS:
+                getattr(machine, invariant_name)()
+    except Exception as error:
+        raise AssertionError(f"Rule sequence failed: {steps}") from error
+    finally:
+        machine.teardown()
+    if branches is None:
+        return frozenset()
+    return coverage_features(diff_hits(before, line_hits("fund_me.vy")), branches)
+
+
+def measure_blind_profile(branches: list) -> tuple[frozenset[str], float]:
+    """Runs the `invariant` profile unguided, as `invariant_test_fund_me` does.
+
+    :returns: tuple: The coverage features of `fund_me.vy` reached by all the
+        examples, and the CPU seconds taken.
+    """
+    before = line_hits("fund_me.vy")
+    start = time.process_time()
+    run_state_machine_as_test(
+        InvariantTestFundMe, settings=settings.get_profile("invariant")
+    )
+    cpu_seconds = time.process_time() - start
+    hits = diff_hits(before, line_hits("fund_me.vy"))
+    return coverage_features(hits, branches), cpu_seconds
+
+
+def test_coverage_guided_invariants():
+    """
+    Replays the persistent corpus of rule sequences, then mutates it, keeping
+    the sequences that reach new lines or branches of `fund_me.vy`.
+
+    `COVERAGE_FUZZ_EXECUTIONS` sets the mutated sequences tried and
+    `COVERAGE_FUZZ_SEED` makes them reproducible. `COVERAGE_FUZZ_COMPARE=1`
+    also runs the unguided `invariant` profile and compares the coverage
+    reached per CPU second. Lines are not profiled on eravm, where the corpus
+    is only replayed.
+    """
+    corpus_path = Path(get_config().project_root) / COVERAGE_FUZZ_CORPUS_PATH
+    corpus = load_corpus(corpus_path)
+    if active_network.is_zksync:
+        for entry in corpus:
+            execute_rule_sequence(entry.steps)
+        return
+
+    executions = int(
+        os.environ.get("COVERAGE_FUZZ_EXECUTIONS", COVERAGE_FUZZ_EXECUTIONS)
+    )
+    fuzz_seed = os.environ.get("COVERAGE_FUZZ_SEED")
+    branches = if_branches(fund_me_contract.compiler_data.vyper_module)
+    with boa.env.gas_meter_class(ProfilingGasMeter):
+        guided = fuzz(
+            lambda steps: execute_rule_sequence(steps, branches),
+            RULE_ARGS,
+            corpus,
+            executions,
+            INVARIANT_STEP_COUNT,
+            None if fuzz_seed is None else int(fuzz_seed),
+        )
+        blind = (
+            measure_blind_profile(branches)
+            if os.environ.get("COVERAGE_FUZZ_COMPARE")
+            else None
+        )
+    save_corpus(corpus_path, corpus)
+
+    print(
+        f"\n[Coverage] guided: {len(guided.features)} features in "
+        f"{guided.cpu_seconds:.2f} CPU s "
+        f"({len(guided.features) / guided.cpu_seconds:.1f}/s), "
+        f"{guided.executions} executions, {guided.new_entries} new corpus entries"
+    )
+    if blind is not None:
+        blind_features, blind_seconds = blind
+        reached = next(
+            (t for t, count in guided.timeline if count >= len(blind_features)), None
+        )
+        catch_up = "never" if reached is None else f"after {reached:.2f} CPU s"
+        print(
+            f"[Coverage] blind `invariant` profile: {len(blind_features)} features "
+            f"in {blind_seconds:.2f} CPU s "
+            f"({len(blind_features) / blind_seconds:.1f}/s), "
+            f"reached by the guided run {catch_up}"
+        )
+    assert guided.features, "No line of fund_me.vy was covered"
@@ -2,8 +2,18 @@ import boa
 import pytest
 
 from moccasin.boa_tools import VyperContract
-
+from script.snapshot_state import snapshot
+
+from utils.async_rpc import (
+    AsyncRpcReader,
+    balance_call,
+    rpc_call,
+    transaction_call,
+    view_call,
+)
 from utils.constants import MINIMUM_FUNDING_AMOUNT_WEI
+from utils.tx_pipeline import TransactionPipeline
+from utils.view_cache import CachedContract
 
 
 ################################################################
@@ -12,39 +22,42 @@ from utils.constants import MINIMUM_FUNDING_AMOUNT_WEI
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
 def test_contract_deployment_and_owner(
-    staging_fund_contract: VyperContract, staging_owner: str
+    staging_views: CachedContract, staging_owner: str
 ):
     """
     Tests that the contract is deployed and the owner is set correctly.
     """
-    assert staging_fund_contract.address is not None, (
-        "Contract address should not be None"
-    )
-    assert staging_fund_contract.owner() == staging_owner, "Contract owner mismatch"
+    assert staging_views.address is not None, "Contract address should not be None"
+    assert staging_views.owner() == staging_owner, "Contract owner mismatch"
 
 
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_initial_state_variables(staging_fund_contract: VyperContract):
+def test_initial_state_variables(
+    staging_fund_contract: VyperContract, staging_reader: AsyncRpcReader
+):
     """
     Tests the initial state variables of the deployed contract.
     """
-    assert staging_fund_contract.balance_of_eth() == 0, (
-        "Initial ETH balance should be 0"
+    balance_of_eth, balance_of_zk_token, funder_count = staging_reader.read_all(
+        [
+            view_call(staging_fund_contract, "balance_of_eth"),
+            view_call(staging_fund_contract, "balance_of_zk_token"),
+            view_call(staging_fund_contract, "funder_count"),
+        ]
     )
-    assert staging_fund_contract.balance_of_zk_token() == 0, (
-        "Initial ZK token balance should be 0"
-    )
-    assert staging_fund_contract.funder_count() == 0, "Initial funder count should be 0"
+    assert balance_of_eth == 0, "Initial ETH balance should be 0"
+    assert balance_of_zk_token == 0, "Initial ZK token balance should be 0"
+    assert funder_count == 0, "Initial funder count should be 0"
 
 
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_get_minimal_funding_amount(staging_fund_contract: VyperContract):
+def test_get_minimal_funding_amount(staging_views: CachedContract):
     """
     Tests the get_minimal_funding_amount view function.
     """
-    min_funding_amount = staging_fund_contract.get_minimal_funding_amount()
+    min_funding_amount = staging_views.get_minimal_funding_amount()
     expected_min_funding = MINIMUM_FUNDING_AMOUNT_WEI
     assert min_funding_amount == expected_min_funding, "Minimal funding amount mismatch"
 
@@ -54,15 +67,23 @@ def test_get_minimal_funding_amount(staging_fund_contract: VyperContract):
 ################################################################
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_fund_eth_staging(staging_fund_contract: VyperContract, staging_owner: str):
+def test_fund_eth_staging(
+    staging_fund_contract: VyperContract,
+    staging_owner: str,
+    staging_reader: AsyncRpcReader,
+):
     """
     Tests funding ETH on the live network.
     Requires the 'owner' account to have sufficient ETH.
     """
-    initial_eth_balance_contract = staging_fund_contract.balance_of_eth()
+    initial_eth_balance_contract, owner_balance = staging_reader.read_all(
+        [
+            view_call(staging_fund_contract, "balance_of_eth"),
+            balance_call(staging_owner),
+        ]
+    )
 
     # Ensure the owner has enough ETH
-    owner_balance = boa.env.get_balance(staging_owner)
     assert owner_balance >= MINIMUM_FUNDING_AMOUNT_WEI, (
         "Owner does not have enough ETH to fund."
     )
@@ -72,9 +93,13 @@ def test_fund_eth_staging(staging_fund_contract: VyperContract, staging_owner: s
         staging_fund_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
 
     # Check the new state of the contract
-    new_eth_balance_contract = staging_fund_contract.balance_of_eth()
-    funder_eth_amount = staging_fund_contract.get_funder_eth_amount(staging_owner)
-    funder_count = staging_fund_contract.funder_count()
+    new_eth_balance_contract, funder_eth_amount, funder_count = staging_reader.read_all(
+        [
+            view_call(staging_fund_contract, "balance_of_eth"),
+            view_call(staging_fund_contract, "get_funder_eth_amount", staging_owner),
+            view_call(staging_fund_contract, "funder_count"),
+        ]
+    )
 
     assert (
         new_eth_balance_contract
@@ -90,21 +115,34 @@ def test_fund_eth_staging(staging_fund_contract: VyperContract, staging_owner: s
 
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_withdraw_eth_staging(staging_fund_contract: VyperContract, staging_owner: str):
+def test_withdraw_eth_staging(
+    staging_fund_contract: VyperContract,
+    staging_owner: str,
+    staging_reader: AsyncRpcReader,
+):
     """
     Tests withdrawing ETH from the contract on the live network.
-    Requires the 'owner' account to have funded the contract.
+    The owner funds the contract first, since each test starts from the snapshot.
     """
-    initial_eth_balance_contract = staging_fund_contract.balance_of_eth()
-    initial_owner_balance = boa.env.get_balance(staging_owner)
+    with boa.env.prank(staging_owner):
+        staging_fund_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    balance_reads = [
+        view_call(staging_fund_contract, "balance_of_eth"),
+        balance_call(staging_owner),
+    ]
+    initial_eth_balance_contract, initial_owner_balance = staging_reader.read_all(
+        balance_reads
+    )
 
     # Perform the withdrawal
     with boa.env.prank(staging_owner):
         staging_fund_contract.withdraw_eth(MINIMUM_FUNDING_AMOUNT_WEI)
 
     # Check the new state of the contract
-    new_eth_balance_contract = staging_fund_contract.balance_of_eth()
-    new_owner_balance = boa.env.get_balance(staging_owner)
+    new_eth_balance_contract, new_owner_balance = staging_reader.read_all(
+        balance_reads
+    )
 
     assert (
         new_eth_balance_contract
@@ -117,20 +155,65 @@ def test_withdraw_eth_staging(staging_fund_contract: VyperContract, staging_owne
     )
 
 
+@pytest.mark.staging
+@pytest.mark.ignore_isolation
+def test_pipelined_fundings_staging(
+    staging_anvil, staging_fund_contract, staging_owner, staging_reader
+):
+    """
+    Tests fundings sent at once by the transaction pipeline are all mined,
+    with consecutive nonces. The owner is unlocked on anvil, which signs them.
+    """
+    if staging_anvil is None:
+        pytest.skip("Only anvil signs the transactions of its dev accounts.")
+    fundings = 5
+    pipeline = TransactionPipeline(staging_anvil.url)
+    try:
+        sent = pipeline.send_all(
+            [
+                transaction_call(
+                    staging_fund_contract,
+                    "fund_eth",
+                    sender=staging_owner,
+                    value=MINIMUM_FUNDING_AMOUNT_WEI,
+                )
+                for _ in range(fundings)
+            ]
+        )
+    finally:
+        pipeline.close()
+
+    first_nonce = sent[0].nonce
+    assert [transaction.nonce for transaction in sent] == list(
+        range(first_nonce, first_nonce + fundings)
+    )
+    assert all(transaction.succeeded for transaction in sent)
+    (funder_eth_amount,) = staging_reader.read_all(
+        [view_call(staging_fund_contract, "get_funder_eth_amount", staging_owner)]
+    )
+    assert funder_eth_amount == fundings * MINIMUM_FUNDING_AMOUNT_WEI
+
+
 ################################################################
 #                   STAGING FUND/WITHDRAW ZK                   #
 ################################################################
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_fund_zk_staging(staging_fund_contract, staging_zktoken, staging_owner):
+def test_fund_zk_staging(
+    staging_fund_contract, staging_zktoken, staging_owner, staging_reader
+):
     """
     Tests funding ZK tokens on the live network.
     Requires the 'owner' to have sufficient ZK tokens.
     """
-    initial_zk_balance_contract = staging_fund_contract.balance_of_zk_token()
+    initial_zk_balance_contract, funder_balance = staging_reader.read_all(
+        [
+            view_call(staging_fund_contract, "balance_of_zk_token"),
+            view_call(staging_zktoken, "balanceOf", staging_owner),
+        ]
+    )
 
     # Ensure the funder has enough ZK tokens
-    funder_balance = staging_zktoken.balanceOf(staging_owner)
     assert funder_balance >= MINIMUM_FUNDING_AMOUNT_WEI, (
         "Owner does not have enough ZK tokens to fund."
     )
@@ -143,8 +226,12 @@ def test_fund_zk_staging(staging_fund_contract, staging_zktoken, staging_owner):
         staging_fund_contract.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
 
     # Check the new state of the contract
-    new_zk_balance_contract = staging_fund_contract.balance_of_zk_token()
-    funder_count = staging_fund_contract.funder_count()
+    new_zk_balance_contract, funder_count = staging_reader.read_all(
+        [
+            view_call(staging_fund_contract, "balance_of_zk_token"),
+            view_call(staging_fund_contract, "funder_count"),
+        ]
+    )
 
     assert (
         new_zk_balance_contract
@@ -156,24 +243,38 @@ def test_fund_zk_staging(staging_fund_contract, staging_zktoken, staging_owner):
 
 @pytest.mark.staging
 @pytest.mark.ignore_isolation
-def test_withdraw_zk_staging(staging_fund_contract, staging_zktoken, staging_owner):
+def test_withdraw_zk_staging(
+    staging_fund_contract, staging_zktoken, staging_owner, staging_reader
+):
     """
     Tests withdrawing ZK tokens from the contract on the live network.
-    Requires the 'owner' account to have funded the contract.
+    The owner funds the contract first, since each test starts from the snapshot.
     """
-    initial_zk_balance_contract = staging_fund_contract.balance_of_zk_token()
+    with boa.env.prank(staging_owner):
+        staging_zktoken.approve(
+            staging_fund_contract.address, MINIMUM_FUNDING_AMOUNT_WEI
+        )
+        staging_fund_contract.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+
+    balance_reads = [
+        view_call(staging_fund_contract, "balance_of_zk_token"),
+        view_call(staging_zktoken, "balanceOf", staging_owner),
+    ]
+    initial_zk_balance_contract, initial_owner_balance = staging_reader.read_all(
+        balance_reads
+    )
     assert initial_zk_balance_contract > 0, (
         "Contract ZK token balance should be greater than 0 before withdrawal"
     )
-    initial_owner_balance = staging_zktoken.balanceOf(staging_owner)
 
     # Perform the withdrawal
     with boa.env.prank(staging_owner):
         staging_fund_contract.withdraw_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
 
     # Check the new state of the contract
-    new_zk_balance_contract = staging_fund_contract.balance_of_zk_token()
-    new_owner_balance = staging_zktoken.balanceOf(staging_owner)
+    new_zk_balance_contract, new_owner_balance = staging_reader.read_all(
+        balance_reads
+    )
 
     assert (
         new_zk_balance_contract
@@ -182,3 +283,129 @@ def test_withdraw_zk_staging(staging_fund_contract, staging_zktoken, staging_own
     assert new_owner_balance == initial_owner_balance + MINIMUM_FUNDING_AMOUNT_WEI, (
         "Owner's ZK token balance not updated correctly after withdrawal"
     )
+
+
+################################################################
+#                       STAGING SNAPSHOT                       #
+################################################################
+@pytest.mark.staging
+@pytest.mark.ignore_isolation
+def test_snapshot_state_staging(
+    staging_fund_contract: VyperContract,
+    staging_owner: str,
+    staging_reader: AsyncRpcReader,
+):
+    """
+    Tests the snapshot lists every funder with the amounts they funded.
+    """
+    with boa.env.prank(staging_owner):
+        staging_fund_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    state = snapshot(staging_reader, staging_fund_contract)
+
+    assert state["funder_count"] >= 1
+    assert len(state["funders"]) == state["funder_count"]
+    (owner_funding,) = [
+        funding
+        for funding in state["funders"]
+        if funding["funder"] == str(staging_owner)
+    ]
+    assert int(owner_funding["eth_amount"]) >= MINIMUM_FUNDING_AMOUNT_WEI
+
+
+@pytest.mark.staging
+@pytest.mark.ignore_isolation
+def test_reads_pinned_to_block_staging(
+    staging_fund_contract: VyperContract,
+    staging_owner: str,
+    staging_reader: AsyncRpcReader,
+):
+    """
+    Tests reads pinned to a block ignore the fundings mined after it, as the
+    snapshot relies on.
+    """
+    (block,) = staging_reader.read_all([rpc_call("eth_blockNumber")])
+    pinned_reads = [
+        view_call(staging_fund_contract, "balance_of_eth", block=block),
+        balance_call(staging_fund_contract.address, block),
+    ]
+    before = staging_reader.read_all(pinned_reads)
+
+    with boa.env.prank(staging_owner):
+        staging_fund_contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    assert staging_reader.read_all(pinned_reads) == before
+    assert snapshot(staging_reader, staging_fund_contract)["block_number"] > int(
+        block, 16
+    )
+
+
+################################################################
+#                      STAGING VIEW CACHE                      #
+################################################################
+@pytest.mark.staging
+@pytest.mark.ignore_isolation
+def test_view_cache_staging(staging_views: CachedContract, staging_owner: str):
+    """
+    Tests cached views are read again after a funding through the cache, and
+    constants are not.
+    """
+    stats = staging_views.stats
+    # @dev the minimal amount is memoized for the session, read it before counting
+    staging_views.get_minimal_funding_amount()
+    misses = sum(stats.misses.values())
+    funded = staging_views.get_funder_eth_amount(staging_owner)
+    assert staging_views.get_funder_eth_amount(staging_owner) == funded
+
+    with boa.env.prank(staging_owner):
+        staging_views.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    assert (
+        staging_views.get_funder_eth_amount(staging_owner)
+        == funded + MINIMUM_FUNDING_AMOUNT_WEI
+    )
+    assert staging_views.get_minimal_funding_amount() == MINIMUM_FUNDING_AMOUNT_WEI
+    # The funded amount is read before and after the funding, nothing else
+    assert sum(stats.misses.values()) - misses == 2
+
+
+################################################################
+#                      STAGING ISOLATION                       #
+################################################################
+@pytest.mark.staging
+@pytest.mark.ignore_isolation
+def test_state_reverted_to_snapshot(
+    staging_anvil,
+    staging_fund_contract: VyperContract,
+    staging_zktoken: VyperContract,
+    staging_owner: str,
+    staging_reader: AsyncRpcReader,
+):
+    """
+    Tests a funding made after an anvil snapshot is undone by reverting to it,
+    as the staging tests are isolated.
+    """
+    if staging_anvil is None:
+        pytest.skip("Only anvil is reverted between staging tests.")
+    state_reads = [
+        view_call(staging_fund_contract, "balance_of_eth"),
+        view_call(staging_fund_contract, "balance_of_zk_token"),
+        view_call(staging_fund_contract, "funder_count"),
+        view_call(staging_fund_contract, "get_funder_eth_amount", staging_owner),
+    ]
+    initial_state = staging_reader.read_all(state_reads)
+    snapshot_id = staging_anvil.snapshot()
+
+    with boa.env.prank(staging_owner):
+        staging_zktoken.approve(
+            staging_fund_contract.address, MINIMUM_FUNDING_AMOUNT_WEI
+        )
+        staging_fund_contract.fund(
+            MINIMUM_FUNDING_AMOUNT_WEI, value=MINIMUM_FUNDING_AMOUNT_WEI
+        )
+    assert staging_reader.read_all(state_reads) != initial_state
+
+    staging_anvil.revert(snapshot_id)
+    boa.env._reset_fork()
+    assert staging_reader.read_all(state_reads) == initial_state
+    assert staging_fund_contract.funder_count() == initial_state[2]
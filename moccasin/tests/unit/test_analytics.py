@@ -0,0 +1,163 @@
+import boa
+import numpy as np
+import pytest
+
+from moccasin.config import get_active_network
+from script.generate_state_dump import plan_fundings, prepare_funders, send_funding
+from script.index_events import InMemoryLogSource, connect, index_events
+from utils.analytics import (
+    carry,
+    columns_from_rows,
+    cumulative_sum,
+    funder_distribution,
+    funder_totals,
+    join_amounts,
+    load_events,
+    period_split,
+    split_amounts,
+    top_k,
+)
+from utils.constants import (
+    ANALYTICS_BLOCKS_PER_PERIOD,
+    ANALYTICS_TOP_K,
+    INDEXED_EVENTS,
+    INDEXER_TEST_FUNDINGS,
+)
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Log recording relies on the pyevm environment.",
+)
+
+ANALYTICS_TEST_FUNDERS = 50
+ANALYTICS_TEST_SEED = 17
+
+
+@pytest.fixture
+def indexed_events(fund_me, mock_zktoken, owner, tmp_path):
+    """Fixture to provide the events of thousands of fundings, in columns."""
+    funders = [
+        boa.env.generate_address(f"analytics_funder_{i}")
+        for i in range(ANALYTICS_TEST_FUNDERS)
+    ]
+    prepare_funders(fund_me, mock_zktoken, funders, owner)
+    source = InMemoryLogSource()
+    with source.record():
+        fundings = plan_fundings(funders, INDEXER_TEST_FUNDINGS, ANALYTICS_TEST_SEED)
+        for i, funding in enumerate(fundings):
+            send_funding(fund_me, funding)
+            if i % 100 == 99:
+                boa.env.time_travel(blocks=ANALYTICS_BLOCKS_PER_PERIOD // 10)
+        with boa.env.prank(owner):
+            fund_me.withdraw(
+                fund_me.balance_of_eth() // 2, fund_me.balance_of_zk_token()
+            )
+        boa.env.time_travel(blocks=1)
+
+    connection = connect(str(tmp_path / "events.db"))
+    index_events(connection, fund_me, source)
+    return load_events(connection, str(fund_me.address))
+
+
+def test_amounts_round_trip_through_limbs():
+    """
+    Test amounts up to 2**256 - 1 are split and joined back exactly.
+    """
+    amounts = [0, 1, 2**32, 2**64 + 5, 10**18, 2**255 + 2**128, 2**256 - 1]
+
+    assert join_amounts(split_amounts(amounts)) == amounts
+
+
+def test_carry_keeps_sums_exact():
+    """
+    Test summed limbs are exact once carried, past the capacity of a single limb.
+    """
+    amounts = [2**256 // 4 - 1, 2**32 - 1, 2**200 + 2**64 - 1] * 1_000
+
+    total = carry(split_amounts(amounts).sum(axis=0))
+
+    assert join_amounts(total) == sum(amounts)
+
+
+def test_columns_from_rows_empty():
+    """
+    Test an empty event history gives empty columns and queries.
+    """
+    columns = columns_from_rows([])
+
+    assert len(columns.event) == 0
+    assert len(funder_totals(columns).keys) == 0
+    assert len(top_k(funder_totals(columns), ANALYTICS_TOP_K).keys) == 0
+
+
+def test_funder_totals_match_views(fund_me, indexed_events):
+    """
+    Test the vectorized funder totals match the amounts recorded by FundMe.
+    """
+    for event, view in (
+        ("FundedETH", fund_me.get_funder_eth_amount),
+        ("FundedZKToken", fund_me.get_funder_zk_token_amount),
+    ):
+        totals = funder_totals(indexed_events, event)
+        for account, amount in zip(totals.keys, join_amounts(totals.amount)):
+            assert amount == view(indexed_events.accounts[account])
+
+
+def test_top_k_matches_sorted_totals(indexed_events):
+    """
+    Test the top funders are the largest totals, largest first.
+    """
+    totals = funder_totals(indexed_events)
+    expected = sorted(
+        zip(join_amounts(totals.amount), totals.keys.tolist()),
+        key=lambda item: (-item[0], item[1]),
+    )[:ANALYTICS_TOP_K]
+
+    top = top_k(totals, ANALYTICS_TOP_K)
+
+    assert list(zip(join_amounts(top.amount), top.keys.tolist())) == expected
+
+
+def test_cumulative_sum_ends_at_total(indexed_events):
+    """
+    Test the running totals are nondecreasing and end at the total funded.
+    """
+    running = join_amounts(cumulative_sum(indexed_events, "FundedZKToken").amount)
+
+    assert running == sorted(running)
+    assert running[-1] == sum(
+        join_amounts(funder_totals(indexed_events, "FundedZKToken").amount)
+    )
+    # All ZK tokens were withdrawn at once
+    assert join_amounts(cumulative_sum(indexed_events, "WithdrawZK").amount) == [
+        running[-1]
+    ]
+
+
+def test_period_split_matches_events(indexed_events):
+    """
+    Test the per-period totals of every event kind add up to the event amounts.
+    """
+    split = period_split(indexed_events, ANALYTICS_BLOCKS_PER_PERIOD)
+    amounts = join_amounts(indexed_events.amount)
+    periods = (indexed_events.block_number // ANALYTICS_BLOCKS_PER_PERIOD).tolist()
+
+    for kind, totals in split.items():
+        expected: dict[int, int] = {}
+        for event, period, amount in zip(indexed_events.event, periods, amounts):
+            if INDEXED_EVENTS[event] == kind:
+                expected[period] = expected.get(period, 0) + amount
+        assert dict(zip(totals.keys.tolist(), join_amounts(totals.amount))) == expected
+    assert len(split["FundedETH"].keys) > 1, "Fundings should span periods"
+
+
+def test_funder_distribution_counts_every_funder(indexed_events):
+    """
+    Test every funder falls in exactly one bin of the distribution.
+    """
+    totals = funder_totals(indexed_events)
+    edges = np.array([0, 1e18, 1e19, 1e20, 1e30])
+
+    assert funder_distribution(totals, edges).sum() == len(totals.keys)
@@ -0,0 +1,35 @@
+import utils.constants
+
+from utils.artifacts import load_contract
+from vyper import ast as vy_ast
+
+# @dev constants of `utils/constants.py` duplicating a FundMe constant
+CONTRACT_CONSTANTS = {
+    "FUNDED_ETH_SHIFT",
+    "MAX_FUNDERS_BATCH_SIZE",
+    "MAX_FUNDING_INTENTS_BATCH_SIZE",
+    "MINIMUM_FUNDING_AMOUNT_WEI",
+    "PERIOD_BUCKET_COUNT",
+    "PERIOD_SECONDS",
+}
+
+
+def _contract_constants(contract_path: str) -> dict:
+    """Reads the constants of a contract, folded, from its annotated AST."""
+    module = load_contract(contract_path).compiler_data.annotated_vyper_module
+    return {
+        decl.target.id: decl.value.get_folded_value().value
+        for decl in module.get_children(vy_ast.VariableDecl, {"is_constant": True})
+    }
+
+
+def test_constants_match_fund_me():
+    """
+    Test the Python constants shared with FundMe hold the values of the contract.
+    """
+    contract_constants = _contract_constants("src/fund_me.vy")
+    shared = set(contract_constants) & set(vars(utils.constants))
+
+    assert shared == CONTRACT_CONSTANTS
+    for name in sorted(shared):
+        assert getattr(utils.constants, name) == contract_constants[name], name
@@ -0,0 +1,105 @@
+import random
+
+from utils.coverage_fuzz import (
+    ArgRange,
+    CorpusEntry,
+    Step,
+    coverage_features,
+    diff_hits,
+    fuzz,
+    load_corpus,
+    mutate,
+    save_corpus,
+)
+
+RULES = {
+    "fund": {"index": ArgRange(0, 3), "amount": ArgRange(10, 1_000)},
+    "withdraw_all": {},
+}
+
+
+def test_coverage_features_of_if_branches():
+    """
+    Test an `if` is covered taken from its body, not taken from its `else` or,
+    without `else`, from more hits of the `if` than of its body.
+    """
+    branches = [(10, 11, None), (20, 21, 23)]
+    hits = {10: 3, 11: 1, 20: 2, 21: 2}
+
+    features = coverage_features(hits, branches)
+
+    assert features == {
+        "line:10",
+        "line:11",
+        "line:20",
+        "line:21",
+        "branch:10:taken",
+        "branch:10:not_taken",
+        "branch:20:taken",
+    }
+
+
+def test_diff_hits_keeps_lines_hit_in_between():
+    """
+    Test only the lines hit between two reads are kept, with their new hits.
+    """
+    assert diff_hits({1: 2, 2: 5}, {1: 2, 2: 7, 3: 1}) == {2: 2, 3: 1}
+
+
+def test_mutate_keeps_rules_and_ranges():
+    """
+    Test mutated sequences only hold known rules, arguments within range, and
+    are at most `max_steps` long.
+    """
+    rng = random.Random(0)
+    steps = [Step("fund", {"index": 0, "amount": 10}), Step("withdraw_all", {})]
+    corpus = [CorpusEntry(steps, frozenset())]
+
+    for _ in range(500):
+        mutated = mutate(rng, steps, corpus, RULES, max_steps=5)
+        assert 0 < len(mutated) <= 5
+        for rule, args in mutated:
+            assert args.keys() == RULES[rule].keys()
+            for name, value in args.items():
+                low, high = RULES[rule][name]
+                assert low <= value <= high
+
+
+def test_corpus_round_trips(tmp_path):
+    """
+    Test a saved corpus loads back identical, and a missing one loads empty.
+    """
+    path = tmp_path / "corpus" / "fund_me.json"
+    assert load_corpus(path) == []
+    corpus = [
+        CorpusEntry(
+            [Step("fund", {"index": 1, "amount": 42}), Step("withdraw_all", {})],
+            frozenset({"line:1", "branch:2:taken"}),
+        )
+    ]
+
+    save_corpus(path, corpus)
+
+    assert load_corpus(path) == corpus
+
+
+def test_fuzz_keeps_sequences_reaching_new_coverage():
+    """
+    Test the corpus is replayed first and only grows with new coverage.
+    """
+
+    def execute(steps: list[Step]) -> frozenset[str]:
+        return frozenset(f"{rule}:{args.get('index')}" for rule, args in steps)
+
+    seed_entry = CorpusEntry([Step("fund", {"index": 0, "amount": 10})], frozenset())
+    corpus = [seed_entry]
+
+    run = fuzz(execute, RULES, corpus, executions=200, max_steps=4, seed=1)
+
+    assert corpus[0].features == {"fund:0"}
+    assert run.executions == 201
+    assert run.features == {"fund:0", "fund:1", "fund:2", "fund:3", "withdraw_all:None"}
+    assert run.new_entries == len(corpus) - 1 == len(run.timeline) - 1
+    assert [count for _, count in run.timeline] == sorted(
+        count for _, count in run.timeline
+    )
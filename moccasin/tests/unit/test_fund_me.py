@@ -8,15 +8,44 @@ from eth.constants import ZERO_ADDRESS
 from eth.exceptions import Revert
 from moccasin.boa_tools import VyperContract
 from moccasin.config import get_active_network
+from script.measure_dashboard_round_trips import (
+    load_dashboard_aggregated,
+    load_dashboard_per_value,
+    load_leaderboard_batched,
+    load_leaderboard_per_funder,
+    measure,
+)
+from script.measure_permit_latency import fund_with_approve, fund_with_permit
+from script.relay_fundings import (
+    FundingIntent,
+    generate_donors,
+    sign_funding_intent,
+    submit_intents,
+)
+from utils.artifacts import load_contract
 from utils.constants import (
     FUNDER_COUNT,
+    FUNDER_POOL_SIZE,
     MINIMUM_FUNDING_AMOUNT_WEI,
     ONE_ETH_IN_WEI,
     FUNDER_INITIAL_BALANCE_WEI,
+    MAX_FUNDERS_BATCH_SIZE,
+    RELAY_SEED,
+    ZK_BALANCE_MIRROR_DEPOSIT_GAS,
+    ZK_BALANCE_MIRROR_FIRST_DEPOSIT_GAS,
 )
+from utils.gas import gas_used
+from utils.permit import sign_permit
+from utils.rpc import count_transactions
 
 
 active_network = get_active_network()
+fund_me_contract = load_contract("src/fund_me.vy")
+mock_no_return_token = load_contract("src/mocks/mock_no_return_token.vy")
+mock_fallback_token = load_contract("src/mocks/mock_fallback_token.vy")
+
+# @dev deadline of the permits signed by the tests, which never expire
+PERMIT_NO_DEADLINE = 2**256 - 1
 
 
 ################################################################
@@ -72,18 +101,18 @@ def test_fund_eth_zero_address(fund_me):
     reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
 )
 @given(
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
     amount=st_boa(
         "uint256",
         min_value=0,
         max_value=MINIMUM_FUNDING_AMOUNT_WEI - 1,
     ),
 )
-def test_fund_eth_insufficient_amount(fund_me, funders, amount: int, index: int):
+def test_fund_eth_insufficient_amount(fund_me, funder_pool, amount: int, index: int):
     """
     Test ETH funding with insufficient amount.
     """
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
         fund_me.fund_eth(sender=funder_account, value=amount)
 
@@ -93,18 +122,18 @@ def test_fund_eth_insufficient_amount(fund_me, funders, amount: int, index: int)
     reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
 )
 @given(
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
     amount=st_boa(
         "uint256",
         min_value=MINIMUM_FUNDING_AMOUNT_WEI,
         max_value=FUNDER_INITIAL_BALANCE_WEI,
     ),
 )
-def test_fund_eth_success_fuzz(fund_me, funders, amount: int, index: int):
+def test_fund_eth_success_fuzz(fund_me, funder_pool, amount: int, index: int):
     """
     Test successful ETH funding.
     """
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     initial_contract_eth_balance = fund_me.balance_of_eth()
     initial_funder_eth_balance = fund_me.get_funder_eth_amount(funder_account)
     initial_funder_count = fund_me.funder_count()
@@ -158,18 +187,20 @@ def test_fund_zk_token_zero_address(fund_me):
     reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
 )
 @given(
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
     amount=st_boa(
         "uint256",
         min_value=0,
         max_value=MINIMUM_FUNDING_AMOUNT_WEI - 1,
     ),
 )
-def test_fund_zk_token_insufficient_amount(fund_me, funders, amount: int, index: int):
+def test_fund_zk_token_insufficient_amount(
+    fund_me, funder_pool, amount: int, index: int
+):
     """
     Test ZK token funding with insufficient amount.
     """
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
         fund_me.fund_zk_token(amount, sender=funder_account)
 
@@ -179,7 +210,7 @@ def test_fund_zk_token_insufficient_amount(fund_me, funders, amount: int, index:
     reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
 )
 @given(
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
     amount=st_boa(
         "uint256",
         min_value=MINIMUM_FUNDING_AMOUNT_WEI,
@@ -187,12 +218,12 @@ def test_fund_zk_token_insufficient_amount(fund_me, funders, amount: int, index:
     ),
 )
 def test_fund_zk_token_success_fuzz(
-    fund_me, mock_zktoken, funders, amount: int, index: int
+    fund_me, mock_zktoken, funder_pool, amount: int, index: int
 ):
     """
     Test successful ZK token funding.
     """
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     initial_contract_zk_balance = fund_me.balance_of_zk_token()
     initial_funder_zk_balance = fund_me.get_funder_zk_token_amount(funder_account)
     initial_funder_count = fund_me.funder_count()
@@ -234,6 +265,469 @@ def test_fund_zk_token_success_fuzz(
     assert mock_zktoken.balanceOf(fund_me.address) == fund_me.balance_of_zk_token()
 
 
+################################################################
+#                      FUNDING ETH AND ZK                      #
+################################################################
+def test_fund_zero_address(fund_me):
+    """
+    Test combined ETH and ZK token funding from a zero address.
+    """
+    boa.env.set_balance(ZERO_ADDRESS.hex(), FUNDER_INITIAL_BALANCE_WEI)
+    with boa.reverts(fund_me.ZERO_ADDRESS_ERROR()):
+        fund_me.fund(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=ZERO_ADDRESS.hex(),
+            value=MINIMUM_FUNDING_AMOUNT_WEI,
+        )
+
+
+def test_fund_insufficient_eth_amount(fund_me, funders):
+    """
+    Test combined funding with an insufficient ETH amount.
+    """
+    with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
+        fund_me.fund(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=funders[0],
+            value=MINIMUM_FUNDING_AMOUNT_WEI - 1,
+        )
+
+
+def test_fund_insufficient_zk_token_amount(fund_me, funders):
+    """
+    Test combined funding with an insufficient ZK token amount.
+    """
+    with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
+        fund_me.fund(
+            MINIMUM_FUNDING_AMOUNT_WEI - 1,
+            sender=funders[0],
+            value=MINIMUM_FUNDING_AMOUNT_WEI,
+        )
+
+
+def test_fund_without_zk_token_approval(fund_me, funders):
+    """
+    Test combined funding reverts when the ZK tokens were not approved.
+    """
+    with boa.reverts():
+        fund_me.fund(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            sender=funders[0],
+            value=MINIMUM_FUNDING_AMOUNT_WEI,
+        )
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
+)
+@given(
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
+    eth_amount=st_boa(
+        "uint256",
+        min_value=MINIMUM_FUNDING_AMOUNT_WEI,
+        max_value=FUNDER_INITIAL_BALANCE_WEI,
+    ),
+    zk_amount=st_boa(
+        "uint256",
+        min_value=MINIMUM_FUNDING_AMOUNT_WEI,
+        max_value=FUNDER_INITIAL_BALANCE_WEI,
+    ),
+)
+def test_fund_success_fuzz(
+    fund_me, mock_zktoken, funder_pool, eth_amount: int, zk_amount: int, index: int
+):
+    """
+    Test successful combined ETH and ZK token funding.
+    """
+    funder_account = funder_pool[index]
+    initial_contract_eth_balance = fund_me.balance_of_eth()
+    initial_contract_zk_balance = fund_me.balance_of_zk_token()
+    initial_funder_count = fund_me.funder_count()
+
+    # Approve ZK tokens for the contract, then fund both assets at once
+    with boa.env.prank(funder_account):
+        mock_zktoken.approve(fund_me.address, zk_amount)
+        fund_me.fund(zk_amount, value=eth_amount)
+        logs = fund_me.get_logs()
+
+    # Assert contract balances increased
+    assert fund_me.balance_of_eth() == initial_contract_eth_balance + eth_amount
+    assert fund_me.balance_of_zk_token() == initial_contract_zk_balance + zk_amount
+    # Assert funder's recorded balances increased
+    assert fund_me.get_funder_eth_amount(funder_account) == eth_amount
+    assert fund_me.get_funder_zk_token_amount(funder_account) == zk_amount
+    # Assert funder is only counted once
+    assert fund_me.funder_count() == initial_funder_count + 1
+
+    # Assert event emission, after the token's Approval and Transfer events
+    assert len(logs) == 4, "Should emit FundedETH and FundedZKToken events"
+    assert logs[2].funder == funder_account, "ETH funder address should match"
+    assert logs[2].amount == eth_amount, "Funded ETH amount should match"
+    assert logs[3].funder == funder_account, "ZK funder address should match"
+    assert logs[3].amount == zk_amount, "Funded ZK token amount should match"
+
+    # Assert contract's actual balances match recorded balances
+    assert fund_me.balance_of_eth() == boa.env.get_balance(fund_me.address)
+    assert mock_zktoken.balanceOf(fund_me.address) == fund_me.balance_of_zk_token()
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_fund_cheaper_than_two_calls(gas_fund_me, gas_mock_zktoken, gas_funders):
+    """
+    Test combined funding costs less gas than `fund_eth` plus `fund_zk_token`.
+
+    Both flows are measured for a first-time funder, including the intrinsic
+    cost of each transaction, and share the same `approve` call.
+    """
+    eth_amount = 2 * MINIMUM_FUNDING_AMOUNT_WEI
+    zk_amount = 3 * MINIMUM_FUNDING_AMOUNT_WEI
+
+    # Two-call flow
+    two_calls_funder = gas_funders[0]
+    with boa.env.prank(two_calls_funder):
+        gas_mock_zktoken.approve(gas_fund_me.address, zk_amount)
+        two_calls_gas = gas_used(lambda: gas_fund_me.fund_eth(value=eth_amount))
+        two_calls_gas += gas_used(lambda: gas_fund_me.fund_zk_token(zk_amount))
+
+    # Combined flow
+    combined_funder = gas_funders[1]
+    with boa.env.prank(combined_funder):
+        gas_mock_zktoken.approve(gas_fund_me.address, zk_amount)
+        combined_gas = gas_used(
+            lambda: gas_fund_me.fund(zk_amount, value=eth_amount)
+        )
+
+    assert gas_fund_me.get_funder_eth_amount(combined_funder) == eth_amount
+    assert gas_fund_me.get_funder_zk_token_amount(combined_funder) == zk_amount
+    assert combined_gas < two_calls_gas, (
+        f"Combined funding ({combined_gas} gas) should be cheaper "
+        f"than two calls ({two_calls_gas} gas)"
+    )
+    print(f"\n[Gas] fund: {combined_gas}, fund_eth + fund_zk_token: {two_calls_gas}")
+
+
+################################################################
+#                    FUNDING ZK WITH PERMIT                    #
+################################################################
+def test_fund_zk_token_with_permit_insufficient_amount(
+    fund_me, mock_zktoken, permit_funder
+):
+    """
+    Test permit funding with an insufficient ZK token amount.
+    """
+    amount = MINIMUM_FUNDING_AMOUNT_WEI - 1
+    signature = sign_permit(
+        mock_zktoken, permit_funder, fund_me.address, amount, PERMIT_NO_DEADLINE
+    )
+    with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
+        fund_me.fund_zk_token_with_permit(
+            amount, PERMIT_NO_DEADLINE, *signature, sender=permit_funder.address
+        )
+
+
+def test_fund_zk_token_with_permit_success(fund_me, mock_zktoken, permit_funder):
+    """
+    Test ZK token funding with a permit, without a prior `approve`.
+    """
+    funder = permit_funder.address
+    amount = 2 * MINIMUM_FUNDING_AMOUNT_WEI
+    nonce = mock_zktoken.nonces(funder)
+    signature = sign_permit(
+        mock_zktoken, permit_funder, fund_me.address, amount, PERMIT_NO_DEADLINE
+    )
+
+    with boa.env.prank(funder):
+        fund_me.fund_zk_token_with_permit(amount, PERMIT_NO_DEADLINE, *signature)
+        logs = fund_me.get_logs()
+
+    assert fund_me.get_funder_zk_token_amount(funder) == amount
+    assert fund_me.balance_of_zk_token() == amount
+    assert fund_me.funder_count() == 1
+    assert mock_zktoken.balanceOf(fund_me.address) == amount
+    # The permit is used up and its allowance spent
+    assert mock_zktoken.nonces(funder) == nonce + 1
+    assert mock_zktoken.allowance(funder, fund_me.address) == 0
+    assert logs[-1].funder == funder
+    assert logs[-1].amount == amount
+
+
+def test_fund_zk_token_with_permit_expired(fund_me, mock_zktoken, permit_funder):
+    """
+    Test permit funding reverts once the permit deadline has passed.
+    """
+    expired_deadline = 0
+    signature = sign_permit(
+        mock_zktoken,
+        permit_funder,
+        fund_me.address,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        expired_deadline,
+    )
+    with boa.reverts(fund_me.PERMIT_EXPIRED_ERROR()):
+        fund_me.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            expired_deadline,
+            *signature,
+            sender=permit_funder.address,
+        )
+
+
+def test_fund_zk_token_with_permit_replayed(fund_me, mock_zktoken, permit_funder):
+    """
+    Test a permit cannot fund twice, its nonce is used and its allowance spent.
+    """
+    signature = sign_permit(
+        mock_zktoken,
+        permit_funder,
+        fund_me.address,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        PERMIT_NO_DEADLINE,
+    )
+    with boa.env.prank(permit_funder.address):
+        fund_me.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI, PERMIT_NO_DEADLINE, *signature
+        )
+        with boa.reverts(fund_me.PERMIT_FAILED_ERROR()):
+            fund_me.fund_zk_token_with_permit(
+                MINIMUM_FUNDING_AMOUNT_WEI, PERMIT_NO_DEADLINE, *signature
+            )
+
+    assert fund_me.get_funder_zk_token_amount(permit_funder.address) == (
+        MINIMUM_FUNDING_AMOUNT_WEI
+    )
+
+
+def test_fund_zk_token_with_permit_of_another_funder(
+    fund_me, mock_zktoken, permit_funder, funders
+):
+    """
+    Test a permit signed by a funder cannot fund from another address.
+    """
+    signature = sign_permit(
+        mock_zktoken,
+        permit_funder,
+        fund_me.address,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        PERMIT_NO_DEADLINE,
+    )
+    with boa.reverts(fund_me.PERMIT_FAILED_ERROR()):
+        fund_me.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            PERMIT_NO_DEADLINE,
+            *signature,
+            sender=funders[0],
+        )
+
+
+def test_fund_zk_token_with_permit_front_run(
+    fund_me, mock_zktoken, permit_funder, funders
+):
+    """
+    Test permit funding goes on when someone else submitted the permit first.
+    """
+    funder = permit_funder.address
+    signature = sign_permit(
+        mock_zktoken,
+        permit_funder,
+        fund_me.address,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        PERMIT_NO_DEADLINE,
+    )
+    # Another address submits the permit seen in the mempool
+    with boa.env.prank(funders[0]):
+        mock_zktoken.permit(
+            funder,
+            fund_me.address,
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            PERMIT_NO_DEADLINE,
+            *signature,
+        )
+
+    with boa.env.prank(funder):
+        fund_me.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI, PERMIT_NO_DEADLINE, *signature
+        )
+
+    assert fund_me.get_funder_zk_token_amount(funder) == MINIMUM_FUNDING_AMOUNT_WEI
+
+
+def test_permit_funding_takes_one_transaction(
+    fund_me, mock_zktoken, funders, permit_funder
+):
+    """
+    Test the permit path funds like the approve path, with one transaction
+    instead of two.
+    """
+    with count_transactions() as approve_counter:
+        fund_with_approve(fund_me, mock_zktoken, funders[0])
+    with count_transactions() as permit_counter:
+        fund_with_permit(fund_me, mock_zktoken, permit_funder)
+
+    assert (approve_counter.transactions, permit_counter.transactions) == (2, 1)
+    assert fund_me.get_funder_zk_token_amount(funders[0]) == (
+        fund_me.get_funder_zk_token_amount(permit_funder.address)
+    )
+    assert fund_me.balance_of_zk_token() == 2 * MINIMUM_FUNDING_AMOUNT_WEI
+
+
+################################################################
+#                       RELAYED FUNDING                        #
+################################################################
+def test_fund_zk_token_for_without_donor_eth(fund_me, mock_zktoken, funders):
+    """
+    Test a relayer funds ZK tokens for a donor holding no ETH, with the
+    donor's permit.
+    """
+    (donor,) = generate_donors(1, RELAY_SEED)
+    mock_zktoken.mint(donor.address, MINIMUM_FUNDING_AMOUNT_WEI)
+    intent = sign_funding_intent(
+        mock_zktoken, donor, fund_me, MINIMUM_FUNDING_AMOUNT_WEI, PERMIT_NO_DEADLINE
+    )
+    relayer = funders[0]
+
+    with boa.env.prank(relayer):
+        fund_me.fund_zk_token_for(*intent)
+        logs = fund_me.get_logs()
+
+    assert boa.env.get_balance(donor.address) == 0
+    assert fund_me.get_funder_zk_token_amount(donor.address) == (
+        MINIMUM_FUNDING_AMOUNT_WEI
+    )
+    assert fund_me.get_funder_zk_token_amount(relayer) == 0
+    assert mock_zktoken.balanceOf(donor.address) == 0
+    assert logs[-1].funder == donor.address
+
+
+def test_fund_zk_token_for_expired(fund_me, mock_zktoken, funders):
+    """
+    Test a relayed funding reverts once the permit deadline has passed.
+    """
+    (donor,) = generate_donors(1, RELAY_SEED)
+    mock_zktoken.mint(donor.address, MINIMUM_FUNDING_AMOUNT_WEI)
+    intent = sign_funding_intent(
+        mock_zktoken, donor, fund_me, MINIMUM_FUNDING_AMOUNT_WEI, 0
+    )
+    with boa.reverts(fund_me.PERMIT_EXPIRED_ERROR()):
+        fund_me.fund_zk_token_for(*intent, sender=funders[0])
+
+
+def test_fund_zk_token_for_replayed(fund_me, mock_zktoken, funders):
+    """
+    Test a relayer cannot submit the same intent twice.
+    """
+    (donor,) = generate_donors(1, RELAY_SEED)
+    mock_zktoken.mint(donor.address, 2 * MINIMUM_FUNDING_AMOUNT_WEI)
+    intent = sign_funding_intent(
+        mock_zktoken, donor, fund_me, MINIMUM_FUNDING_AMOUNT_WEI, PERMIT_NO_DEADLINE
+    )
+    with boa.env.prank(funders[0]):
+        fund_me.fund_zk_token_for(*intent)
+        with boa.reverts(fund_me.PERMIT_FAILED_ERROR()):
+            fund_me.fund_zk_token_for(*intent)
+
+    assert fund_me.get_funder_zk_token_amount(donor.address) == (
+        MINIMUM_FUNDING_AMOUNT_WEI
+    )
+
+
+def test_fund_zk_token_for_ignores_standing_allowance(fund_me, mock_zktoken, funders):
+    """
+    Test a relayer cannot spend a funder's allowance without a matching permit.
+    """
+    funder = funders[1]
+    with boa.env.prank(funder):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.reverts(fund_me.PERMIT_FAILED_ERROR()):
+        fund_me.fund_zk_token_for(
+            funder,
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            PERMIT_NO_DEADLINE,
+            27,
+            b"\x00" * 32,
+            b"\x00" * 32,
+            sender=funders[0],
+        )
+    assert mock_zktoken.allowance(funder, fund_me.address) == (
+        MINIMUM_FUNDING_AMOUNT_WEI
+    )
+
+
+def test_fund_zk_token_for_many_skips_invalid_intents(
+    fund_me, mock_zktoken, funders
+):
+    """
+    Test a batch funds its valid intents and skips the others without reverting.
+    """
+    donors = generate_donors(4, RELAY_SEED)
+    for donor in donors[:3]:
+        mock_zktoken.mint(donor.address, MINIMUM_FUNDING_AMOUNT_WEI)
+    valid, expired, too_small, without_tokens = [
+        sign_funding_intent(mock_zktoken, donor, fund_me, amount, deadline)
+        for donor, amount, deadline in zip(
+            donors,
+            [MINIMUM_FUNDING_AMOUNT_WEI, MINIMUM_FUNDING_AMOUNT_WEI, 1, 10**18],
+            [PERMIT_NO_DEADLINE, 0, PERMIT_NO_DEADLINE, PERMIT_NO_DEADLINE],
+        )
+    ]
+
+    with boa.env.prank(funders[0]):
+        run = submit_intents(
+            fund_me, [expired, valid, too_small, without_tokens, valid]
+        )
+
+    # The second copy of the valid intent is a replay
+    assert (run.batches, run.funded) == (1, 1)
+    assert fund_me.funder_count() == 1
+    assert fund_me.get_funder_zk_token_amount(donors[0].address) == (
+        MINIMUM_FUNDING_AMOUNT_WEI
+    )
+    assert fund_me.balance_of_zk_token() == MINIMUM_FUNDING_AMOUNT_WEI
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_relayed_batch_cheaper_per_funding(
+    gas_fund_me, gas_mock_zktoken, gas_funders
+):
+    """
+    Test batched relayed fundings cost less gas per funding than single ones,
+    the intrinsic cost of the transaction being shared by the batch.
+    """
+    batch_size = 10
+    donors = generate_donors(2 * batch_size, RELAY_SEED)
+    intents = []
+    for donor in donors:
+        gas_mock_zktoken.mint(donor.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        intents.append(
+            sign_funding_intent(
+                gas_mock_zktoken,
+                donor,
+                gas_fund_me,
+                MINIMUM_FUNDING_AMOUNT_WEI,
+                PERMIT_NO_DEADLINE,
+            )
+        )
+
+    with boa.env.prank(gas_funders[0]):
+        single = submit_intents(gas_fund_me, intents[:batch_size], 1)
+        batched = submit_intents(gas_fund_me, intents[batch_size:], batch_size)
+
+    assert (single.funded, batched.funded) == (batch_size, batch_size)
+    assert (single.batches, batched.batches) == (batch_size, 1)
+    assert batched.gas < single.gas, (
+        f"A batch of {batch_size} ({batched.gas} gas) should be cheaper "
+        f"than {batch_size} single intents ({single.gas} gas)"
+    )
+    print(f"\n[Gas] relayed batch: {batched.gas}, single intents: {single.gas}")
+
+
 ################################################################
 #                         FUNDER COUNT                         #
 ################################################################
@@ -282,6 +776,131 @@ def test_fund_both_eth_and_zk(fund_me, mock_zktoken, funders):
     assert fund_me.funder_count() == 1  # Still one unique funder
 
 
+################################################################
+#                     PACKED FUNDER RECORD                     #
+################################################################
+def test_fund_zk_token_funded_amount_overflow(fund_me, mock_zktoken, funders):
+    """
+    Test ZK token funding reverts once the funder total exceeds 128 bits.
+    """
+    funder_account = funders[0]
+    amount = 2**128
+    mock_zktoken.mint(funder_account, amount)
+
+    with boa.env.prank(funder_account):
+        mock_zktoken.approve(fund_me.address, amount)
+        with boa.reverts(fund_me.FUNDED_AMOUNT_OVERFLOW_ERROR()):
+            fund_me.fund_zk_token(amount)
+
+
+def test_packed_funder_record_keeps_totals_apart(fund_me, mock_zktoken, funders):
+    """
+    Test the ETH and ZK token totals sharing a record do not leak into each other.
+    """
+    funder_account = funders[0]
+    eth_amount = FUNDER_INITIAL_BALANCE_WEI
+    zk_amount = 2**128 - 1
+    mock_zktoken.mint(funder_account, zk_amount)
+
+    with boa.env.prank(funder_account):
+        mock_zktoken.approve(fund_me.address, zk_amount)
+        fund_me.fund_zk_token(zk_amount)
+        fund_me.fund_eth(value=eth_amount)
+
+    assert fund_me.get_funder_eth_amount(funder_account) == eth_amount
+    assert fund_me.get_funder_zk_token_amount(funder_account) == zk_amount
+    assert fund_me.funder_count() == 1
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_packed_funder_record_gas_savings(
+    gas_fund_me, gas_two_map_fund_me, gas_mock_zktoken, gas_funders
+):
+    """
+    Test the packed funder record costs less gas than two HashMaps of totals.
+
+    `src/mocks/fund_me_two_maps.vy` is FundMe with only the funder record
+    unpacked, so the contracts differ only by it. First-time funders read a single cold slot instead of
+    two, and repeat ZK token funders no longer read the ETH total first.
+    """
+
+    def measure(contract: VyperContract) -> dict[str, int]:
+        eth_funder, zk_funder = gas_funders[0], gas_funders[1]
+        eth_amount = zk_amount = MINIMUM_FUNDING_AMOUNT_WEI
+        with boa.env.prank(eth_funder):
+            eth_first_time_gas = gas_used(lambda: contract.fund_eth(value=eth_amount))
+            eth_repeat_gas = gas_used(lambda: contract.fund_eth(value=eth_amount))
+        with boa.env.prank(zk_funder):
+            gas_mock_zktoken.approve(contract.address, 2 * zk_amount)
+            zk_first_time_gas = gas_used(lambda: contract.fund_zk_token(zk_amount))
+            zk_repeat_gas = gas_used(lambda: contract.fund_zk_token(zk_amount))
+        return {
+            "fund_eth first-time": eth_first_time_gas,
+            "fund_eth repeat": eth_repeat_gas,
+            "fund_zk_token first-time": zk_first_time_gas,
+            "fund_zk_token repeat": zk_repeat_gas,
+        }
+
+    packed = measure(gas_fund_me)
+    two_maps = measure(gas_two_map_fund_me)
+
+    for name, gas in packed.items():
+        legacy_gas = two_maps[name]
+        saved = legacy_gas - gas
+        print(f"\n[Gas] {name}: {gas} (two maps {legacy_gas}, saved {saved})")
+        assert gas <= legacy_gas, (
+            f"{name} ({gas} gas) should not cost more than two HashMaps "
+            f"({legacy_gas} gas)"
+        )
+    assert packed["fund_eth first-time"] < two_maps["fund_eth first-time"]
+    assert packed["fund_zk_token first-time"] < two_maps["fund_zk_token first-time"]
+    assert packed["fund_zk_token repeat"] < two_maps["fund_zk_token repeat"]
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_zk_token_balance_mirror_gas_savings(
+    gas_fund_me, gas_mirror_fund_me, gas_mock_zktoken, gas_funders
+):
+    """
+    Test ZK token deposits save at least the `balance_of_zk_token` storage mirror.
+
+    `src/mocks/fund_me_zk_balance_mirror.vy` is FundMe keeping the mirror, which
+    writes the first ZK tokens to a cold zero slot and reads then updates it on
+    later deposits. The deposits follow an ETH funding.
+    """
+
+    def measure(contract: VyperContract) -> dict[str, int]:
+        eth_funder, zk_funder = gas_funders[0], gas_funders[1]
+        zk_amount = MINIMUM_FUNDING_AMOUNT_WEI
+        contract.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI, sender=eth_funder)
+        with boa.env.prank(zk_funder):
+            gas_mock_zktoken.approve(contract.address, 2 * zk_amount)
+            first_deposit_gas = gas_used(lambda: contract.fund_zk_token(zk_amount))
+            deposit_gas = gas_used(lambda: contract.fund_zk_token(zk_amount))
+        return {"first deposit": first_deposit_gas, "later deposit": deposit_gas}
+
+    deposits = measure(gas_fund_me)
+    mirrored_deposits = measure(gas_mirror_fund_me)
+
+    mirror_gas = {
+        "first deposit": ZK_BALANCE_MIRROR_FIRST_DEPOSIT_GAS,
+        "later deposit": ZK_BALANCE_MIRROR_DEPOSIT_GAS,
+    }
+    for name, gas in deposits.items():
+        saved_gas = mirrored_deposits[name] - gas
+        print(f"\n[Gas] fund_zk_token {name}: {gas}, saved {saved_gas}")
+        assert saved_gas >= mirror_gas[name], (
+            f"fund_zk_token {name} saved {saved_gas} gas, less than "
+            f"the {mirror_gas[name]} gas of the mirror slot"
+        )
+
+
 ################################################################
 #                         WITHDRAW ETH                         #
 ################################################################
@@ -321,13 +940,13 @@ def test_withdraw_eth_zero_amount(fund_me, funders):
         min_value=MINIMUM_FUNDING_AMOUNT_WEI,
         max_value=FUNDER_INITIAL_BALANCE_WEI,
     ),
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
 )
-def test_withdraw_eth_success_fuzz(fund_me, funders, amount: int, index: int):
+def test_withdraw_eth_success_fuzz(fund_me, funder_pool, amount: int, index: int):
     """
     Test successful ETH withdrawal.
     """
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     owner = fund_me.owner()
 
     # Fund the contract first
@@ -399,12 +1018,12 @@ def test_withdraw_zk_token_zero_amount(fund_me, mock_zktoken, owner, funders):
         min_value=MINIMUM_FUNDING_AMOUNT_WEI,
         max_value=FUNDER_INITIAL_BALANCE_WEI,
     ),
-    index=st.integers(min_value=0, max_value=FUNDER_COUNT - 1),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
 )
 def test_withdraw_zk_token_success_fuzz(
     fund_me,
     mock_zktoken,
-    funders,
+    funder_pool,
     amount: int,
     index: int,
 ):
@@ -412,7 +1031,7 @@ def test_withdraw_zk_token_success_fuzz(
     Test successful ZK token withdrawal.
     """
     # Fund the contract first
-    funder_account = funders[index]
+    funder_account = funder_pool[index]
     owner = fund_me.owner()
     with boa.env.prank(funder_account):
         mock_zktoken.approve(fund_me.address, amount)
@@ -438,6 +1057,332 @@ def test_withdraw_zk_token_success_fuzz(
     assert log_amount == amount, "Withdrawn amount should match"
 
 
+def test_balance_of_zk_token_reads_token_balance(fund_me, mock_zktoken, owner, funders):
+    """
+    Test ZK tokens sent without funding are available for withdrawal.
+    """
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+        mock_zktoken.transfer(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+
+    assert fund_me.balance_of_zk_token() == 2 * MINIMUM_FUNDING_AMOUNT_WEI
+    assert fund_me.get_funder_zk_token_amount(funders[0]) == MINIMUM_FUNDING_AMOUNT_WEI
+
+    with boa.env.prank(owner):
+        fund_me.withdraw_zk_token(2 * MINIMUM_FUNDING_AMOUNT_WEI)
+    assert fund_me.balance_of_zk_token() == 0
+
+
+################################################################
+#                     WITHDRAW ETH AND ZK                      #
+################################################################
+def test_withdraw_not_owner(fund_me, funders):
+    """
+    Test combined and full withdrawals by a non-owner.
+    """
+    with boa.env.prank(funders[0]):
+        with boa.reverts("ownable: caller is not the owner"):
+            fund_me.withdraw(MINIMUM_FUNDING_AMOUNT_WEI, MINIMUM_FUNDING_AMOUNT_WEI)
+        with boa.reverts("ownable: caller is not the owner"):
+            fund_me.withdraw_all()
+
+
+def test_withdraw_exceeds_balance(fund_me, mock_zktoken, owner, funders):
+    """
+    Test combined withdrawal of more ETH or ZK tokens than the contract holds.
+    """
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund(MINIMUM_FUNDING_AMOUNT_WEI, value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.env.prank(owner):
+        with boa.reverts(fund_me.WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR()):
+            fund_me.withdraw(MINIMUM_FUNDING_AMOUNT_WEI + 1, MINIMUM_FUNDING_AMOUNT_WEI)
+        with boa.reverts(fund_me.WITHDRAWAL_AMOUNT_EXCEEDS_BALANCE_ERROR()):
+            fund_me.withdraw(MINIMUM_FUNDING_AMOUNT_WEI, MINIMUM_FUNDING_AMOUNT_WEI + 1)
+
+
+def test_withdraw_zero_amounts(fund_me, owner):
+    """
+    Test combined and full withdrawals with nothing to withdraw.
+    """
+    with boa.env.prank(owner):
+        with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
+            fund_me.withdraw(0, 0)
+        with boa.reverts(fund_me.INSUFFICIENT_AMOUNT_ERROR()):
+            fund_me.withdraw_all()
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Fuzzing with anvil zksync does not take hypothesis  settings.",
+)
+@given(
+    eth_amount=st_boa("uint256", min_value=1, max_value=FUNDER_INITIAL_BALANCE_WEI),
+    zk_amount=st_boa("uint256", min_value=1, max_value=FUNDER_INITIAL_BALANCE_WEI),
+    index=st.integers(min_value=0, max_value=FUNDER_POOL_SIZE - 1),
+)
+def test_withdraw_success_fuzz(
+    fund_me, mock_zktoken, funder_pool, eth_amount: int, zk_amount: int, index: int
+):
+    """
+    Test successful combined withdrawal of ETH and ZK tokens.
+    """
+    funder_account = funder_pool[index]
+    owner = fund_me.owner()
+    funded = FUNDER_INITIAL_BALANCE_WEI // 2
+    with boa.env.prank(funder_account):
+        mock_zktoken.approve(fund_me.address, funded)
+        fund_me.fund(funded, value=funded)
+    eth_amount, zk_amount = min(eth_amount, funded), min(zk_amount, funded)
+
+    initial_owner_balance = boa.env.get_balance(owner)
+    initial_owner_zk_balance = mock_zktoken.balanceOf(owner)
+
+    with boa.env.prank(owner):
+        fund_me.withdraw(eth_amount, zk_amount)
+        logs = fund_me.get_logs()
+
+    assert fund_me.balance_of_eth() == funded - eth_amount
+    assert fund_me.balance_of_zk_token() == funded - zk_amount
+    assert boa.env.get_balance(owner) > initial_owner_balance  # Account for gas fees
+    assert mock_zktoken.balanceOf(owner) == initial_owner_zk_balance + zk_amount
+    # WithdrawEth, the token Transfer, then WithdrawZK
+    assert len(logs) == 3
+    assert (logs[0].to, logs[0].amount) == (owner, eth_amount)
+    assert (logs[2].to, logs[2].amount) == (owner, zk_amount)
+
+
+def test_withdraw_eth_only(fund_me, mock_zktoken, owner, funders):
+    """
+    Test combined withdrawal of ETH only leaves the ZK tokens untouched.
+    """
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund(MINIMUM_FUNDING_AMOUNT_WEI, value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.env.prank(owner):
+        fund_me.withdraw(MINIMUM_FUNDING_AMOUNT_WEI, 0)
+        logs = fund_me.get_logs()
+
+    assert fund_me.balance_of_eth() == 0
+    assert fund_me.balance_of_zk_token() == MINIMUM_FUNDING_AMOUNT_WEI
+    assert len(logs) == 1, "Should only emit the WithdrawEth event"
+    assert logs[0].amount == MINIMUM_FUNDING_AMOUNT_WEI
+
+
+def test_withdraw_all(fund_me, mock_zktoken, owner, funders):
+    """
+    Test full withdrawal sweeps both assets without passing the balances.
+    """
+    eth_amount = 2 * MINIMUM_FUNDING_AMOUNT_WEI
+    zk_amount = 3 * MINIMUM_FUNDING_AMOUNT_WEI
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, zk_amount)
+        fund_me.fund(zk_amount, value=eth_amount)
+    initial_owner_zk_balance = mock_zktoken.balanceOf(owner)
+
+    with boa.env.prank(owner):
+        fund_me.withdraw_all()
+        logs = fund_me.get_logs()
+
+    assert fund_me.balance_of_eth() == 0
+    assert fund_me.balance_of_zk_token() == 0
+    assert boa.env.get_balance(fund_me.address) == 0
+    assert mock_zktoken.balanceOf(owner) == initial_owner_zk_balance + zk_amount
+    assert (logs[0].to, logs[0].amount) == (owner, eth_amount)
+    assert (logs[2].to, logs[2].amount) == (owner, zk_amount)
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_withdraw_cheaper_than_two_calls(gas_fund_me, gas_mock_zktoken, gas_funders):
+    """
+    Test combined withdrawal costs less gas than two separate withdrawals.
+
+    Both flows withdraw the same partial amounts, including the intrinsic cost
+    of each transaction.
+    """
+    amount = MINIMUM_FUNDING_AMOUNT_WEI
+    with boa.env.prank(gas_funders[0]):
+        gas_mock_zktoken.approve(gas_fund_me.address, 4 * amount)
+        gas_fund_me.fund(4 * amount, value=4 * amount)
+
+    with boa.env.prank(gas_fund_me.owner()):
+        two_calls_gas = gas_used(lambda: gas_fund_me.withdraw_eth(amount))
+        two_calls_gas += gas_used(lambda: gas_fund_me.withdraw_zk_token(amount))
+        combined_gas = gas_used(lambda: gas_fund_me.withdraw(amount, amount))
+
+    assert gas_fund_me.balance_of_eth() == 2 * amount
+    assert combined_gas < two_calls_gas, (
+        f"Combined withdrawal ({combined_gas} gas) should be cheaper "
+        f"than two calls ({two_calls_gas} gas)"
+    )
+    print(
+        f"\n[Gas] withdraw: {combined_gas}, "
+        f"withdraw_eth + withdraw_zk_token: {two_calls_gas}"
+    )
+
+
+################################################################
+#                      NON-STANDARD TOKEN                      #
+################################################################
+def test_fund_and_withdraw_with_token_returning_nothing(owner, funders):
+    """
+    Test funding and withdrawing work with a token whose transfers return nothing.
+    """
+    token = mock_no_return_token.deploy()
+    with boa.env.prank(owner):
+        fund_me = fund_me_contract.deploy(token.address)
+    funder_account = funders[0]
+    zk_amount = 2 * MINIMUM_FUNDING_AMOUNT_WEI
+    token.mint(funder_account, 2 * zk_amount)
+
+    with boa.env.prank(funder_account):
+        token.approve(fund_me.address, 2 * zk_amount)
+        fund_me.fund_zk_token(zk_amount)
+        fund_me.fund(zk_amount, value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    assert fund_me.get_funder_zk_token_amount(funder_account) == 2 * zk_amount
+    assert fund_me.balance_of_zk_token() == token.balanceOf(fund_me.address)
+    assert token.balanceOf(fund_me.address) == 2 * zk_amount
+
+    with boa.env.prank(owner):
+        fund_me.withdraw_zk_token(2 * zk_amount)
+    assert token.balanceOf(owner) == 2 * zk_amount
+    assert fund_me.balance_of_zk_token() == 0
+
+
+def test_fund_with_token_returning_nothing_without_approval(owner, funders):
+    """
+    Test a failed transfer of a token returning nothing still reverts the funding.
+    """
+    token = mock_no_return_token.deploy()
+    with boa.env.prank(owner):
+        fund_me = fund_me_contract.deploy(token.address)
+    token.mint(funders[0], MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.reverts():
+        fund_me.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI, sender=funders[0])
+    assert fund_me.funder_count() == 0
+
+
+################################################################
+#                        FALLBACK TOKEN                        #
+################################################################
+@pytest.fixture
+def fallback_token(owner):
+    """
+    Fixture to provide a token without `permit` whose fallback accepts any call.
+    """
+    with boa.env.prank(owner):
+        return mock_fallback_token.deploy()
+
+
+@pytest.fixture
+def fallback_fund_me(owner, fallback_token):
+    """
+    Fixture to provide a FundMe contract funded in the fallback token.
+    """
+    with boa.env.prank(owner):
+        return fund_me_contract.deploy(fallback_token.address)
+
+
+def test_fund_zk_token_with_permit_fallback_token(
+    fallback_fund_me, fallback_token, funders
+):
+    """
+    Test a permit reaching the fallback of a token is no permit without allowance.
+    """
+    funder_account = funders[0]
+    fallback_token.mint(funder_account, MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.reverts(fallback_fund_me.PERMIT_FAILED_ERROR()):
+        fallback_fund_me.fund_zk_token_with_permit(
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            PERMIT_NO_DEADLINE,
+            27,
+            b"\x00" * 32,
+            b"\x00" * 32,
+            sender=funder_account,
+        )
+    assert fallback_fund_me.funder_count() == 0
+
+
+def test_fund_zk_token_for_fallback_token(fallback_fund_me, fallback_token, funders):
+    """
+    Test a relayed funding reverts when the permit only reaches the token fallback.
+    """
+    funder_account = funders[1]
+    fallback_token.mint(funder_account, MINIMUM_FUNDING_AMOUNT_WEI)
+
+    with boa.reverts(fallback_fund_me.PERMIT_FAILED_ERROR()):
+        fallback_fund_me.fund_zk_token_for(
+            funder_account,
+            MINIMUM_FUNDING_AMOUNT_WEI,
+            PERMIT_NO_DEADLINE,
+            27,
+            b"\x00" * 32,
+            b"\x00" * 32,
+            sender=funders[0],
+        )
+    assert fallback_token.balanceOf(funder_account) == MINIMUM_FUNDING_AMOUNT_WEI
+
+
+def test_fund_zk_token_for_many_skips_fallback_token(
+    fallback_fund_me, fallback_token, funders
+):
+    """
+    Test a batch skips the intents whose permit only reaches the token fallback.
+    """
+    funder_account = funders[1]
+    fallback_token.mint(funder_account, MINIMUM_FUNDING_AMOUNT_WEI)
+    intent = FundingIntent(
+        funder_account,
+        MINIMUM_FUNDING_AMOUNT_WEI,
+        PERMIT_NO_DEADLINE,
+        27,
+        b"\x00" * 32,
+        b"\x00" * 32,
+    )
+
+    with boa.env.prank(funders[0]):
+        assert fallback_fund_me.fund_zk_token_for_many([intent]) == 0
+    assert fallback_fund_me.funder_count() == 0
+    assert fallback_token.balanceOf(funder_account) == MINIMUM_FUNDING_AMOUNT_WEI
+
+
+
+def test_relayer_funds_nothing_with_fallback_token(
+    fallback_fund_me, fallback_token, funders
+):
+    """
+    Test a relayer run over a fallback token submits every batch but funds nothing.
+    """
+    donors = generate_donors(4, RELAY_SEED)
+    intents = []
+    for donor in donors:
+        fallback_token.mint(donor.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        intents.append(
+            FundingIntent(
+                donor.address,
+                MINIMUM_FUNDING_AMOUNT_WEI,
+                PERMIT_NO_DEADLINE,
+                27,
+                b"\x00" * 32,
+                b"\x00" * 32,
+            )
+        )
+
+    with boa.env.prank(funders[0]):
+        run = submit_intents(fallback_fund_me, intents, 2)
+
+    assert (run.batches, run.funded) == (2, 0)
+    assert fallback_fund_me.balance_of_zk_token() == 0
+
 ################################################################
 #                     SET ZK TOKEN ADDRESS                     #
 ################################################################
@@ -558,3 +1503,170 @@ def test_get_zk_token_address(fund_me, mock_zktoken):
     Test get_zk_token_address view function.
     """
     assert fund_me.get_zk_token_address() == mock_zktoken.address
+
+
+def test_get_max_funders_batch_size(fund_me):
+    """
+    Test get_max_funders_batch_size view function.
+    """
+    assert fund_me.get_max_funders_batch_size() == MAX_FUNDERS_BATCH_SIZE
+
+
+################################################################
+#                       DASHBOARD VIEWS                        #
+################################################################
+def test_get_dashboard_initial(fund_me, owner, funders):
+    """
+    Test get_dashboard view function before any funding.
+    """
+    assert fund_me.get_dashboard(funders[0]) == (0, 0, 0, 0, 0, owner)
+
+
+def test_get_dashboard_matches_views(fund_me, mock_zktoken, funders):
+    """
+    Test get_dashboard returns the same values as the individual views.
+    """
+    funder_account = funders[0]
+    with boa.env.prank(funder_account):
+        mock_zktoken.approve(fund_me.address, 3 * MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund(
+            3 * MINIMUM_FUNDING_AMOUNT_WEI, value=2 * MINIMUM_FUNDING_AMOUNT_WEI
+        )
+    fund_me.fund_eth(sender=funders[1], value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    for funder in funders:
+        assert fund_me.get_dashboard(funder) == (
+            fund_me.balance_of_eth(),
+            fund_me.balance_of_zk_token(),
+            fund_me.funder_count(),
+            fund_me.get_funder_eth_amount(funder),
+            fund_me.get_funder_zk_token_amount(funder),
+            fund_me.owner(),
+        )
+
+
+def test_get_funders_amounts(fund_me, mock_zktoken, funders):
+    """
+    Test get_funders_amounts returns the amounts of each funder in order.
+    """
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, 3 * MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund_zk_token(3 * MINIMUM_FUNDING_AMOUNT_WEI)
+    fund_me.fund_eth(sender=funders[1], value=2 * MINIMUM_FUNDING_AMOUNT_WEI)
+    not_funder = boa.env.generate_address("not_funder")
+
+    addresses = [funders[1], not_funder, funders[0], funders[1]]
+    funders_amounts = fund_me.get_funders_amounts(addresses)
+
+    assert len(funders_amounts) == len(addresses)
+    for address, funder_amounts in zip(addresses, funders_amounts):
+        assert funder_amounts.funder == address
+        assert funder_amounts.eth_amount == fund_me.get_funder_eth_amount(address)
+        assert funder_amounts.zk_token_amount == fund_me.get_funder_zk_token_amount(
+            address
+        )
+
+
+def test_get_funders_amounts_empty(fund_me):
+    """
+    Test get_funders_amounts with no addresses.
+    """
+    assert fund_me.get_funders_amounts([]) == []
+
+
+def test_dashboard_round_trips(fund_me, funders):
+    """
+    Test the aggregated views replace per-value calls with a single round trip.
+    """
+    fund_me.fund_eth(sender=funders[0], value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    per_value_round_trips, per_value = measure(
+        load_dashboard_per_value, fund_me, funders[0]
+    )
+    aggregated_round_trips, aggregated = measure(
+        load_dashboard_aggregated, fund_me, funders[0]
+    )
+    assert per_value == aggregated
+    assert (per_value_round_trips, aggregated_round_trips) == (6, 1)
+
+    per_funder_round_trips, per_funder = measure(
+        load_leaderboard_per_funder, fund_me, funders
+    )
+    batched_round_trips, batched = measure(load_leaderboard_batched, fund_me, funders)
+    assert per_funder == batched
+    assert (per_funder_round_trips, batched_round_trips) == (2 * len(funders), 1)
+
+
+################################################################
+#                      FUNDER ENUMERATION                      #
+################################################################
+def test_get_funders_empty(fund_me):
+    """
+    Test get_funders before any funding.
+    """
+    assert fund_me.get_funders(0, MAX_FUNDERS_BATCH_SIZE) == []
+
+
+def test_get_funders_in_first_funding_order(fund_me, mock_zktoken, funders):
+    """
+    Test get_funders lists each funder once, in order of first funding.
+    """
+    fund_me.fund_eth(sender=funders[2], value=MINIMUM_FUNDING_AMOUNT_WEI)
+    with boa.env.prank(funders[0]):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+    fund_me.fund_eth(sender=funders[2], value=MINIMUM_FUNDING_AMOUNT_WEI)
+    fund_me.fund_eth(sender=funders[1], value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    listed_funders = fund_me.get_funders(0, MAX_FUNDERS_BATCH_SIZE)
+
+    assert [funder.funder for funder in listed_funders] == [
+        funders[2],
+        funders[0],
+        funders[1],
+    ]
+    assert len(listed_funders) == fund_me.funder_count()
+    for funder in listed_funders:
+        assert funder.eth_amount == fund_me.get_funder_eth_amount(funder.funder)
+        assert funder.zk_token_amount == fund_me.get_funder_zk_token_amount(
+            funder.funder
+        )
+
+
+def test_get_funders_pagination(fund_me, funders):
+    """
+    Test get_funders pages through funders with offset and limit.
+    """
+    for funder in funders:
+        fund_me.fund_eth(sender=funder, value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    # Page through the funders two at a time
+    paged_funders = []
+    offset = 0
+    while page := fund_me.get_funders(offset, 2):
+        assert len(page) <= 2
+        paged_funders.extend(funder.funder for funder in page)
+        offset += len(page)
+
+    assert paged_funders == funders
+    assert fund_me.get_funders(len(funders), 1) == []
+    assert fund_me.get_funders(0, 0) == []
+    assert fund_me.get_funders(2**256 - 1, 2**256 - 1) == []
+
+
+def test_get_funders_limit_capped(fund_me):
+    """
+    Test get_funders returns at most MAX_FUNDERS_BATCH_SIZE funders.
+    """
+    funders = [
+        boa.env.generate_address(f"capped_funder_{i}")
+        for i in range(MAX_FUNDERS_BATCH_SIZE + 1)
+    ]
+    for funder in funders:
+        boa.env.set_balance(funder, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund_eth(sender=funder, value=MINIMUM_FUNDING_AMOUNT_WEI)
+
+    first_page = fund_me.get_funders(0, 2**256 - 1)
+    assert len(first_page) == MAX_FUNDERS_BATCH_SIZE
+    last_page = fund_me.get_funders(MAX_FUNDERS_BATCH_SIZE, 2**256 - 1)
+    assert [funder.funder for funder in last_page] == funders[-1:]
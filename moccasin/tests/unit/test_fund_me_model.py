@@ -0,0 +1,70 @@
+from utils.fund_me_model import FundMeModel
+
+OWNER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+FUNDER = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+OTHER_FUNDER = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+
+
+def new_model() -> FundMeModel:
+    """Builds a model where every account holds 100 wei of ETH and 50 of ZK."""
+    accounts = [OWNER, FUNDER, OTHER_FUNDER]
+    return FundMeModel(
+        OWNER,
+        {account: 100 for account in accounts},
+        {account: 50 for account in accounts},
+    )
+
+
+def test_model_lists_funders_once_in_order_of_first_funding():
+    """
+    Test the model lists a funder once, on its first funding, and sums its totals.
+    """
+    model = new_model()
+    model.fund(FUNDER, 10, 0)
+    model.fund(OTHER_FUNDER, 0, 5)
+    model.fund(FUNDER, 1, 2)
+
+    assert model.funders == [FUNDER, OTHER_FUNDER]
+    assert model.funder_count == 2
+    assert (model.funded_eth[FUNDER], model.funded_zk_token[FUNDER]) == (11, 2)
+    assert (model.balance_of_eth, model.balance_of_zk_token) == (11, 7)
+    assert (model.eth_balances[FUNDER], model.zk_token_balances[FUNDER]) == (89, 48)
+
+
+def test_model_withdrawals_move_balances_to_owner():
+    """
+    Test withdrawals and direct transfers move balances without touching totals.
+    """
+    model = new_model()
+    model.fund(FUNDER, 10, 10)
+    model.transfer_zk_token(OTHER_FUNDER, 5)
+    model.withdraw(4, 0)
+    model.withdraw_all()
+
+    assert (model.balance_of_eth, model.balance_of_zk_token) == (0, 0)
+    assert (model.eth_balances[OWNER], model.zk_token_balances[OWNER]) == (110, 65)
+    assert model.funders == [FUNDER]
+    assert model.funded_zk_token[FUNDER] == 10
+
+
+def test_model_pops_changed_accounts_once():
+    """
+    Test changed accounts are returned once, then forgotten.
+    """
+    model = new_model()
+    model.fund(FUNDER, 10, 0)
+    model.withdraw(1, 0)
+
+    assert sorted(model.pop_changed()) == sorted([FUNDER, OWNER])
+    assert model.pop_changed() == []
+
+
+def test_model_copies_initial_balances():
+    """
+    Test a model does not share the balances it was created from.
+    """
+    balances = {OWNER: 0, FUNDER: 100}
+    model = FundMeModel(OWNER, balances, dict(balances))
+    model.fund(FUNDER, 10, 0)
+
+    assert balances[FUNDER] == 100
@@ -0,0 +1,70 @@
+import boa
+import pytest
+
+from moccasin.config import get_active_network
+from utils.constants import FUNDER_INITIAL_BALANCE_WEI
+from utils.funder_pool import load_funder_pool
+
+POOL_SIZE = 20
+POOL_SEED = 1
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Pool snapshots write the storage of the pyevm environment.",
+)
+
+
+def read_pool(mock_zktoken, funders: list[str]) -> tuple:
+    """Reads the ETH and ZK tokens of the funders and the ZK token supply."""
+    return (
+        [boa.env.get_balance(funder) for funder in funders],
+        [mock_zktoken.balanceOf(funder) for funder in funders],
+        mock_zktoken.totalSupply(),
+    )
+
+
+def test_restored_pool_matches_funded_pool(mock_zktoken, tmp_path):
+    """
+    Test a pool restored from its snapshot holds what the funded pool held.
+    """
+    supply = mock_zktoken.totalSupply()
+    with boa.env.anchor():
+        funders = load_funder_pool(
+            mock_zktoken, POOL_SIZE, POOL_SEED, FUNDER_INITIAL_BALANCE_WEI, tmp_path
+        )
+        funded = read_pool(mock_zktoken, funders)
+    with boa.env.anchor():
+        restored_funders = load_funder_pool(
+            mock_zktoken, POOL_SIZE, POOL_SEED, FUNDER_INITIAL_BALANCE_WEI, tmp_path
+        )
+        restored = read_pool(mock_zktoken, restored_funders)
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert restored_funders == funders
+    assert len(set(funders)) == POOL_SIZE
+    assert restored == funded
+    assert funded == (
+        [FUNDER_INITIAL_BALANCE_WEI] * POOL_SIZE,
+        [FUNDER_INITIAL_BALANCE_WEI] * POOL_SIZE,
+        supply + POOL_SIZE * FUNDER_INITIAL_BALANCE_WEI,
+    )
+
+
+def test_pool_snapshot_is_keyed_by_token_state(mock_zktoken, tmp_path):
+    """
+    Test a pool funded from another ZK token state gets its own snapshot.
+    """
+    with boa.env.anchor():
+        load_funder_pool(
+            mock_zktoken, POOL_SIZE, POOL_SEED, FUNDER_INITIAL_BALANCE_WEI, tmp_path
+        )
+    mock_zktoken.mint(boa.env.generate_address("holder"), 1)
+    supply = mock_zktoken.totalSupply()
+    load_funder_pool(
+        mock_zktoken, POOL_SIZE, POOL_SEED, FUNDER_INITIAL_BALANCE_WEI, tmp_path
+    )
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert mock_zktoken.totalSupply() == supply + POOL_SIZE * FUNDER_INITIAL_BALANCE_WEI
@@ -0,0 +1,193 @@
+import boa
+import os
+import pytest
+
+from boa.vm.gas_meters import ProfilingGasMeter
+from contextlib import nullcontext
+from moccasin.config import get_active_network, get_config
+from pathlib import Path
+from utils.constants import (
+    GAS_BASELINE_PATH,
+    GAS_REGRESSION_THRESHOLD,
+    GAS_REPORT_PATH,
+    MINIMUM_FUNDING_AMOUNT_WEI,
+)
+from utils.gas import (
+    find_regressions,
+    gas_used,
+    line_profile,
+    read_baseline,
+    write_baseline,
+    write_gas_report,
+)
+from utils.permit import sign_permit
+
+
+active_network = get_active_network()
+
+
+def _measure_external_functions(
+    fund_me, mock_zktoken, funders, permit_funder, owner
+) -> dict:
+    """Measures the gas of every state-changing FundMe external function.
+
+    Funding is measured for first-time funders, which write their funder record
+    and list entry from zero, and for repeat funders, which update them.
+    Withdrawals are measured partial, leaving a balance, then full, clearing it.
+    """
+    eth_funder, zk_funder, both_funder = funders[0], funders[1], funders[2]
+    amount = MINIMUM_FUNDING_AMOUNT_WEI
+    measures = {}
+
+    with boa.env.prank(eth_funder):
+        measures["fund_eth/first_time"] = gas_used(
+            lambda: fund_me.fund_eth(value=amount)
+        )
+        measures["fund_eth/repeat"] = gas_used(lambda: fund_me.fund_eth(value=amount))
+
+    with boa.env.prank(zk_funder):
+        mock_zktoken.approve(fund_me.address, 2 * amount)
+        measures["fund_zk_token/first_time"] = gas_used(
+            lambda: fund_me.fund_zk_token(amount)
+        )
+        measures["fund_zk_token/repeat"] = gas_used(
+            lambda: fund_me.fund_zk_token(amount)
+        )
+
+    with boa.env.prank(both_funder):
+        mock_zktoken.approve(fund_me.address, 2 * amount)
+        measures["fund/first_time"] = gas_used(
+            lambda: fund_me.fund(amount, value=amount)
+        )
+        measures["fund/repeat"] = gas_used(lambda: fund_me.fund(amount, value=amount))
+
+    with boa.env.prank(permit_funder.address):
+        # @dev sign first, the nonce and domain separator views would be counted
+        for measure in ("first_time", "repeat"):
+            signature = sign_permit(
+                mock_zktoken, permit_funder, fund_me.address, amount, 2**256 - 1
+            )
+            measures[f"fund_zk_token_with_permit/{measure}"] = gas_used(
+                lambda: fund_me.fund_zk_token_with_permit(
+                    amount, 2**256 - 1, *signature
+                )
+            )
+
+    with boa.env.prank(owner):
+        measures["withdraw_eth/partial"] = gas_used(
+            lambda: fund_me.withdraw_eth(amount)
+        )
+        # @dev read the balances first, views would be counted as gas otherwise
+        eth_left = fund_me.balance_of_eth()
+        zk_token_left = fund_me.balance_of_zk_token()
+        measures["withdraw_eth/full"] = gas_used(
+            lambda: fund_me.withdraw_eth(eth_left)
+        )
+        measures["withdraw_zk_token/partial"] = gas_used(
+            lambda: fund_me.withdraw_zk_token(amount)
+        )
+        measures["withdraw_zk_token/full"] = gas_used(
+            lambda: fund_me.withdraw_zk_token(zk_token_left - amount)
+        )
+        measures["set_zk_token_address"] = gas_used(
+            lambda: fund_me.set_zk_token_address(mock_zktoken.address)
+        )
+
+    # Fund again to measure the combined withdrawals
+    with boa.env.prank(both_funder):
+        mock_zktoken.approve(fund_me.address, 2 * amount)
+        fund_me.fund(2 * amount, value=2 * amount)
+    with boa.env.prank(owner):
+        measures["withdraw/partial"] = gas_used(
+            lambda: fund_me.withdraw(amount, amount)
+        )
+        measures["withdraw_all"] = gas_used(lambda: fund_me.withdraw_all())
+    return measures
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_gas_report_within_baseline(
+    gas_fund_me, gas_mock_zktoken, gas_funders, gas_permit_funder
+):
+    """
+    Test no FundMe external function costs more gas than its committed baseline.
+
+    Writes `gas_report.json` and `gas_report.md`, with the line profile of
+    `fund_me.vy` when `GAS_LINE_PROFILE=1`. Set `GAS_UPDATE_BASELINE=1` to write
+    the baseline instead.
+    """
+    project_root = Path(get_config().project_root)
+    baseline_path = project_root / GAS_BASELINE_PATH
+    # @dev boa's pytest plugin prints every profiled call at the end of the
+    #    session, so lines are only profiled on demand
+    line_profiled = bool(os.environ.get("GAS_LINE_PROFILE"))
+
+    with (
+        boa.env.gas_meter_class(ProfilingGasMeter) if line_profiled else nullcontext()
+    ):
+        measures = _measure_external_functions(
+            gas_fund_me,
+            gas_mock_zktoken,
+            gas_funders,
+            gas_permit_funder,
+            gas_fund_me.owner(),
+        )
+
+    if os.environ.get("GAS_UPDATE_BASELINE"):
+        write_baseline(baseline_path, measures)
+    assert baseline_path.exists(), (
+        f"No gas baseline at {GAS_BASELINE_PATH}, write it with `just gas-baseline`"
+    )
+    baseline = read_baseline(baseline_path)
+    write_gas_report(
+        project_root / GAS_REPORT_PATH,
+        measures,
+        baseline,
+        line_profile("fund_me.vy") if line_profiled else [],
+    )
+
+    regressions = find_regressions(measures, baseline)
+    assert not regressions, (
+        f"Gas regressed by more than {GAS_REGRESSION_THRESHOLD:.0%}:\n"
+        + "\n".join(regressions)
+    )
+
+
+@pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Gas metering is only meaningful on the EVM.",
+)
+def test_gas_used_within_anchor(fund_me, funders):
+    """
+    Test measures inside an anchor start cold and are reverted with the anchor.
+    """
+    amount = MINIMUM_FUNDING_AMOUNT_WEI
+    funder_count = fund_me.funder_count()
+
+    with boa.env.anchor(), boa.env.prank(funders[0]):
+        gas_used(lambda: fund_me.fund_eth(value=amount))
+        repeat_gas = gas_used(lambda: fund_me.fund_eth(value=amount))
+        again_gas = gas_used(lambda: fund_me.fund_eth(value=amount))
+
+    assert repeat_gas == again_gas
+    assert fund_me.funder_count() == funder_count
+
+
+def test_find_regressions_uses_threshold():
+    """
+    Test only measures above the baseline by more than the threshold regress.
+    """
+    baseline = {"fund_eth/first_time": 1_000, "fund_eth/repeat": 1_000}
+    measures = {
+        "fund_eth/first_time": 1_050,
+        "fund_eth/repeat": 1_051,
+        "withdraw_eth/full": 5_000,
+    }
+
+    regressions = find_regressions(measures, baseline, threshold=0.05)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("fund_eth/repeat: 1051 gas, baseline 1000")
@@ -0,0 +1,128 @@
+import boa
+import json
+import pytest
+
+from moccasin.config import get_active_network
+from script.generate_state_dump import (
+    fund_me,
+    generate_funders,
+    generate_state,
+    load_state,
+    plan_fundings,
+    serialize_state,
+)
+from utils.constants import ANVIL_DICT_ADDRESSES, ANVIL_FUND_ME_ADDRESS
+from utils.state_dump import StateDumpReader, read_fund_me_state
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="State generation relies on the pyevm environment.",
+)
+
+DUMP_FUNDERS = 40
+DUMP_FUNDINGS = 120
+DUMP_SEED = 7
+
+
+@pytest.fixture(scope="module")
+def generated_state() -> dict:
+    """Fixture to provide a state dump generated from the test parameters."""
+    return generate_state(DUMP_FUNDERS, DUMP_FUNDINGS, DUMP_SEED)
+
+
+def test_generated_state_is_reproducible(generated_state):
+    """
+    Test the same seed gives the same dump bytes, and another seed another dump.
+    """
+    serialized = serialize_state(generated_state)
+    assert serialize_state(
+        generate_state(DUMP_FUNDERS, DUMP_FUNDINGS, DUMP_SEED)
+    ) == serialized
+    assert serialize_state(
+        generate_state(DUMP_FUNDERS, DUMP_FUNDINGS, DUMP_SEED + 1)
+    ) != serialized
+    # The dump is valid JSON in anvil's format
+    assert json.loads(serialized).keys() == {
+        "block",
+        "accounts",
+        "best_block_number",
+        "blocks",
+        "transactions",
+        "historical_states",
+    }
+
+
+def test_loaded_state_matches_fundings(generated_state):
+    """
+    Test the contract views of the loaded dump match the generated fundings.
+    """
+    funders = generate_funders(DUMP_FUNDERS, DUMP_SEED)
+    fundings = plan_fundings(funders, DUMP_FUNDINGS, DUMP_SEED)
+    expected = {funder: [0, 0] for funder in funders}
+    for funding in fundings:
+        expected[funding.funder][0] += funding.eth_amount
+        expected[funding.funder][1] += funding.zk_token_amount
+
+    # @dev a fresh env stands in for a fresh anvil loading the dump
+    with boa.swap_env(boa.Env()):
+        load_state(generated_state)
+        fund_me_contract = fund_me.at(ANVIL_FUND_ME_ADDRESS)
+
+        assert fund_me_contract.owner() == ANVIL_DICT_ADDRESSES["owner"]["public"]
+        assert fund_me_contract.funder_count() == DUMP_FUNDERS
+        assert fund_me_contract.balance_of_eth() == sum(
+            eth_amount for eth_amount, _ in expected.values()
+        )
+        assert fund_me_contract.balance_of_zk_token() == sum(
+            zk_token_amount for _, zk_token_amount in expected.values()
+        )
+        assert boa.env.get_balance(ANVIL_FUND_ME_ADDRESS) == (
+            fund_me_contract.balance_of_eth()
+        )
+
+        listed = fund_me_contract.get_funders(0, DUMP_FUNDERS)
+        assert [amounts.funder for amounts in listed] == funders
+        for amounts in listed:
+            assert [amounts.eth_amount, amounts.zk_token_amount] == expected[
+                amounts.funder
+            ]
+
+
+def test_state_dump_reader_streams_accounts(generated_state, tmp_path):
+    """
+    Test the streaming reader parses the same accounts as `json.load`.
+    """
+    path = tmp_path / "state.json"
+    path.write_text(serialize_state(generated_state))
+
+    # @dev a small window makes the reader release pages while scanning
+    with StateDumpReader(str(path), window=4_096) as reader:
+        assert dict(reader.iter_accounts()) == generated_state["accounts"]
+        assert reader.read_account(ANVIL_FUND_ME_ADDRESS) == (
+            generated_state["accounts"][ANVIL_FUND_ME_ADDRESS.lower()]
+        )
+        assert reader.read_account("0x" + "11" * 20) is None
+
+
+def test_decoded_fund_me_state_matches_views(generated_state, tmp_path):
+    """
+    Test the FundMe storage decoded from the dump matches the loaded contract views.
+    """
+    path = tmp_path / "state.json"
+    path.write_text(serialize_state(generated_state))
+
+    state = read_fund_me_state(str(path), ANVIL_FUND_ME_ADDRESS)
+
+    with boa.swap_env(boa.Env()):
+        load_state(generated_state)
+        fund_me_contract = fund_me.at(ANVIL_FUND_ME_ADDRESS)
+
+        assert state.owner == fund_me_contract.owner()
+        assert state.zk_token_address == fund_me_contract.get_zk_token_address()
+        assert state.balance_of_eth == fund_me_contract.balance_of_eth()
+        assert state.funder_count == fund_me_contract.funder_count() == DUMP_FUNDERS
+        assert [tuple(amounts) for amounts in state.funders] == [
+            tuple(amounts) for amounts in fund_me_contract.get_funders(0, DUMP_FUNDERS)
+        ]
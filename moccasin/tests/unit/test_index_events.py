@@ -0,0 +1,185 @@
+import boa
+import pytest
+
+from boa.rpc import RPCError
+from moccasin.config import get_active_network
+from script.index_events import (
+    InMemoryLogSource,
+    connect,
+    fetch_log_chunks,
+    funder_totals,
+    get_checkpoint,
+    index_events,
+    seed_in_memory,
+)
+from utils.constants import (
+    FUNDER_INITIAL_BALANCE_WEI,
+    INDEXER_TEST_FUNDINGS,
+    MINIMUM_FUNDING_AMOUNT_WEI,
+)
+
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Log recording relies on the pyevm environment.",
+)
+
+
+def _seed_fundings(fund_me, funders: list[str], count: int, offset: int = 0):
+    """Funds the contract `count` times, alternating ETH, ZK tokens and both.
+
+    A new block is mined every 100 fundings so events span many blocks.
+    """
+    for i in range(offset, offset + count):
+        funder = funders[i % len(funders)]
+        amount = MINIMUM_FUNDING_AMOUNT_WEI * (1 + i % 7)
+        with boa.env.prank(funder):
+            if i % 3 == 0:
+                fund_me.fund_eth(value=amount)
+            elif i % 3 == 1:
+                fund_me.fund_zk_token(amount)
+            else:
+                fund_me.fund(amount, value=amount)
+        if i % 100 == 99:
+            boa.env.time_travel(blocks=1)
+
+
+@pytest.fixture
+def indexer_funders(fund_me, mock_zktoken) -> list[str]:
+    """Fixture to provide funders that approved FundMe for their ZK tokens."""
+    funders = [boa.env.generate_address(f"indexer_funder_{i}") for i in range(50)]
+    for funder in funders:
+        boa.env.set_balance(funder, FUNDER_INITIAL_BALANCE_WEI)
+        mock_zktoken.mint(funder, FUNDER_INITIAL_BALANCE_WEI)
+        mock_zktoken.approve(fund_me.address, 2**256 - 1, sender=funder)
+    return funders
+
+
+def test_index_events_totals_match_views(fund_me, indexer_funders, tmp_path):
+    """
+    Test indexed funding totals match the contract views after thousands of fundings.
+    """
+    source = InMemoryLogSource()
+    with source.record():
+        _seed_fundings(fund_me, indexer_funders, INDEXER_TEST_FUNDINGS)
+        with boa.env.prank(fund_me.owner()):
+            fund_me.withdraw_eth(MINIMUM_FUNDING_AMOUNT_WEI)
+            fund_me.withdraw_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+        boa.env.time_travel(blocks=1)
+
+    connection = connect(str(tmp_path / "events.db"))
+    indexed = index_events(connection, fund_me, source)
+    contract = str(fund_me.address)
+
+    # fund() emits two events, and two withdrawals were made
+    expected_events = INDEXER_TEST_FUNDINGS + INDEXER_TEST_FUNDINGS // 3 + 2
+    assert indexed == expected_events
+    assert get_checkpoint(connection, contract) == source.latest_block()
+
+    totals = funder_totals(connection, contract)
+    assert len(totals) == fund_me.funder_count()
+    for funder in indexer_funders:
+        assert totals[funder] == (
+            fund_me.get_funder_eth_amount(funder),
+            fund_me.get_funder_zk_token_amount(funder),
+        )
+
+    # Funded minus withdrawn amounts match the contract balances
+    for funded_event, withdraw_event, balance in (
+        ("FundedETH", "WithdrawEth", fund_me.balance_of_eth()),
+        ("FundedZKToken", "WithdrawZK", fund_me.balance_of_zk_token()),
+    ):
+        amounts = {funded_event: 0, withdraw_event: 0}
+        for event, amount in connection.execute(
+            "SELECT event, amount FROM events WHERE event IN (?, ?)",
+            (funded_event, withdraw_event),
+        ):
+            amounts[event] += int(amount)
+        assert amounts[funded_event] - amounts[withdraw_event] == balance
+
+
+def test_index_events_is_incremental(fund_me, indexer_funders, tmp_path):
+    """
+    Test a rerun only indexes the blocks mined since the last checkpoint.
+    """
+    source = InMemoryLogSource()
+    connection = connect(str(tmp_path / "events.db"))
+    contract = str(fund_me.address)
+
+    with source.record():
+        _seed_fundings(fund_me, indexer_funders, 300)
+        boa.env.time_travel(blocks=1)
+    first_run = index_events(connection, fund_me, source)
+    first_checkpoint = get_checkpoint(connection, contract)
+
+    # Nothing new was mined
+    assert index_events(connection, fund_me, source) == 0
+
+    with source.record():
+        _seed_fundings(fund_me, indexer_funders, 300, offset=300)
+        boa.env.time_travel(blocks=1)
+    second_run = index_events(connection, fund_me, source)
+
+    assert first_run == second_run == 300 + 100
+    assert get_checkpoint(connection, contract) > first_checkpoint
+    (stored,) = connection.execute("SELECT COUNT(*) FROM events").fetchone()
+    assert stored == first_run + second_run
+
+
+def test_index_events_skips_open_block(fund_me, indexer_funders, tmp_path):
+    """
+    Test events of the block still open to transactions are left for the next run.
+    """
+    source = InMemoryLogSource()
+    connection = connect(str(tmp_path / "events.db"))
+    with source.record():
+        _seed_fundings(fund_me, indexer_funders, 10)
+
+    assert index_events(connection, fund_me, source) == 0
+
+    boa.env.time_travel(blocks=1)
+    assert index_events(connection, fund_me, source) == 10 + 3
+
+
+def test_index_events_of_seeded_in_memory_fund_me(tmp_path):
+    """
+    Test the in-memory run of the indexer indexes every funding it seeded.
+    """
+    fund_me, source = seed_in_memory()
+    connection = connect(str(tmp_path / "events.db"))
+
+    assert index_events(connection, fund_me, source) > 0
+    totals = funder_totals(connection, str(fund_me.address))
+    assert len(totals) == fund_me.funder_count()
+    for funder, (eth_amount, zk_amount) in totals.items():
+        assert fund_me.get_funder_eth_amount(funder) == eth_amount
+        assert fund_me.get_funder_zk_token_amount(funder) == zk_amount
+
+class _RangeLimitedSource:
+    """Log source refusing block ranges wider than `max_blocks`."""
+
+    def __init__(self, max_blocks: int):
+        self.max_blocks = max_blocks
+        self.ranges: list[tuple[int, int]] = []
+
+    def get_logs(self, address, topics, from_block, to_block):
+        if to_block - from_block + 1 > self.max_blocks:
+            raise RPCError("block range too large", -32005)
+        self.ranges.append((from_block, to_block))
+        return []
+
+
+def test_fetch_log_chunks_adapts_block_range():
+    """
+    Test chunks shrink on refused ranges and cover every block exactly once.
+    """
+    source = _RangeLimitedSource(max_blocks=300)
+
+    chunks = list(fetch_log_chunks(source, "0x0", [], 0, 9_999, chunk_blocks=2_000))
+
+    covered = [block for start, end in source.ranges for block in range(start, end + 1)]
+    assert covered == list(range(10_000))
+    assert all(end - start + 1 <= 300 for start, end in source.ranges)
+    assert [end for end, _ in chunks] == [end for _, end in source.ranges]
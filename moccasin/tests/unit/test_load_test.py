@@ -0,0 +1,54 @@
+import pytest
+
+from moccasin.config import get_active_network
+from script.generate_state_dump import generate_funders, plan_fundings, prepare_funders
+from script.load_test import check_consistency, percentile, run_in_memory
+from utils.constants import TX_INTRINSIC_GAS
+
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="The in-memory load test relies on the pyevm environment.",
+)
+
+
+def test_run_in_memory_keeps_state_consistent(fund_me, mock_zktoken, owner):
+    """
+    Test a burst of mixed fundings leaves views matching the sent fundings.
+    """
+    funders = generate_funders(50, seed=1)
+    fundings = plan_fundings(funders, 200, seed=1, ratios=(2, 1, 1))
+    prepare_funders(fund_me, mock_zktoken, funders, owner)
+
+    run = run_in_memory(fund_me, fundings)
+
+    assert len(run.gas) == len(run.latencies) == 200
+    assert run.failed == 0
+    assert min(run.gas) > TX_INTRINSIC_GAS
+    assert check_consistency(fund_me, fundings) == []
+
+
+def test_check_consistency_reports_missing_funding(fund_me, mock_zktoken, owner):
+    """
+    Test fundings the contract did not receive are reported.
+    """
+    funders = generate_funders(5, seed=2)
+    fundings = plan_fundings(funders, 10, seed=2)
+    prepare_funders(fund_me, mock_zktoken, funders, owner)
+    run_in_memory(fund_me, fundings[:-1])
+
+    errors = check_consistency(fund_me, fundings)
+
+    assert any(fundings[-1].funder in error for error in errors)
+
+
+def test_percentile_is_nearest_rank():
+    """
+    Test percentiles pick the nearest-rank value.
+    """
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
@@ -0,0 +1,187 @@
+import boa
+import pytest
+import random
+
+from moccasin.config import get_active_network
+from script.generate_state_dump import Funding, prepare_funders, send_funding
+from utils.constants import (
+    MINIMUM_FUNDING_AMOUNT_WEI,
+    PERIOD_BUCKET_COUNT,
+    PERIOD_SECONDS,
+    PERIOD_TEST_FUNDINGS,
+    PERIOD_TEST_MAX_GAP_SECONDS,
+    STATE_DUMP_MAX_FUNDING_MULTIPLIER,
+)
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Time travel relies on the pyevm environment.",
+)
+
+PERIOD_TEST_FUNDERS = 50
+PERIOD_TEST_SEED = 16
+PERIOD_TEST_CHECK_EVERY = 250
+
+
+def _assert_buckets_match(fund_me, expected: dict[int, list[int]]):
+    """Compares every period kept on-chain with the recomputed totals."""
+    current_period = fund_me.get_current_period()
+    start_period = max(0, current_period - PERIOD_BUCKET_COUNT + 1)
+    periods_totals = fund_me.get_period_totals(start_period, PERIOD_BUCKET_COUNT)
+
+    assert [totals.period for totals in periods_totals] == list(
+        range(start_period, start_period + PERIOD_BUCKET_COUNT)
+    )
+    for totals in periods_totals:
+        assert [
+            totals.eth_amount,
+            totals.zk_token_amount,
+            totals.funding_count,
+            totals.new_funder_count,
+        ] == expected.get(totals.period, [0, 0, 0, 0]), f"Period {totals.period}"
+
+
+def test_get_current_period(fund_me):
+    """
+    Test the current period is the block timestamp divided by the period length.
+    """
+    assert fund_me.get_current_period() == boa.env.evm.patch.timestamp // PERIOD_SECONDS
+    boa.env.time_travel(seconds=PERIOD_SECONDS)
+    assert fund_me.get_current_period() == boa.env.evm.patch.timestamp // PERIOD_SECONDS
+
+
+def test_get_period_totals_empty(fund_me):
+    """
+    Test periods without fundings have zero totals.
+    """
+    current_period = fund_me.get_current_period()
+    periods_totals = fund_me.get_period_totals(current_period - 1, 3)
+
+    assert [totals.period for totals in periods_totals] == [
+        current_period - 1,
+        current_period,
+        current_period + 1,
+    ]
+    assert all(tuple(totals)[1:] == (0, 0, 0, 0) for totals in periods_totals)
+
+
+def test_get_period_totals_count_capped(fund_me):
+    """
+    Test the number of periods returned is capped at the number of buckets.
+    """
+    current_period = fund_me.get_current_period()
+    assert len(fund_me.get_period_totals(current_period, 2**64)) == (
+        PERIOD_BUCKET_COUNT
+    )
+    assert fund_me.get_period_totals(current_period, 0) == []
+
+
+def test_get_period_totals_out_of_range(fund_me, funders):
+    """
+    Test periods overwritten in the ring of buckets cannot be read anymore.
+    """
+    first_period = fund_me.get_current_period()
+    fund_me.fund_eth(sender=funders[0], value=MINIMUM_FUNDING_AMOUNT_WEI)
+    boa.env.time_travel(seconds=PERIOD_BUCKET_COUNT * PERIOD_SECONDS)
+    current_period = fund_me.get_current_period()
+
+    with boa.reverts(fund_me.PERIOD_OUT_OF_RANGE_ERROR()):
+        fund_me.get_period_totals(first_period, 1)
+    # The bucket of the first period now stands for the current one
+    (totals,) = fund_me.get_period_totals(current_period, 1)
+    assert totals.period == first_period + PERIOD_BUCKET_COUNT
+    assert totals.funding_count == 0
+    (totals,) = fund_me.get_period_totals(current_period - PERIOD_BUCKET_COUNT + 1, 1)
+    assert totals.funding_count == 0
+
+
+def test_period_totals_match_recomputed_fundings(fund_me, mock_zktoken, owner):
+    """
+    Test the period buckets against totals recomputed off-chain.
+
+    Thousands of randomized ETH, ZK token and combined fundings are spread over
+    more periods than there are buckets, so buckets get overwritten, and some
+    periods get no funding at all.
+    """
+    rng = random.Random(PERIOD_TEST_SEED)
+    funders = [
+        boa.env.generate_address(f"period_funder_{i}")
+        for i in range(PERIOD_TEST_FUNDERS)
+    ]
+    prepare_funders(fund_me, mock_zktoken, funders, owner)
+
+    # period -> [ETH total, ZK token total, funding count, new funder count]
+    expected: dict[int, list[int]] = {}
+    funded: set[str] = set()
+    for i in range(PERIOD_TEST_FUNDINGS):
+        boa.env.time_travel(seconds=rng.randint(0, PERIOD_TEST_MAX_GAP_SECONDS))
+        funder = rng.choice(funders)
+        kind = rng.randrange(3)
+        amount = MINIMUM_FUNDING_AMOUNT_WEI * rng.randint(
+            1, STATE_DUMP_MAX_FUNDING_MULTIPLIER
+        )
+        funding = Funding(
+            funder, amount if kind != 1 else 0, amount if kind != 0 else 0
+        )
+        send_funding(fund_me, funding)
+
+        totals = expected.setdefault(
+            boa.env.evm.patch.timestamp // PERIOD_SECONDS, [0, 0, 0, 0]
+        )
+        totals[0] += funding.eth_amount
+        totals[1] += funding.zk_token_amount
+        totals[2] += 1
+        totals[3] += funder not in funded
+        funded.add(funder)
+
+        if (i + 1) % PERIOD_TEST_CHECK_EVERY == 0:
+            _assert_buckets_match(fund_me, expected)
+
+    _assert_buckets_match(fund_me, expected)
+    assert len(expected) > PERIOD_BUCKET_COUNT, "Fundings should overwrite buckets"
+
+
+def test_funding_writes_only_funded_asset_buckets(fund_me, mock_zktoken, funders):
+    """
+    Test a ZK token funding leaves the ETH bucket alone, and is still counted.
+    """
+    funder = funders[0]
+    period = fund_me.get_current_period()
+    bucket_index = period % PERIOD_BUCKET_COUNT
+    with boa.env.prank(funder):
+        mock_zktoken.approve(fund_me.address, MINIMUM_FUNDING_AMOUNT_WEI)
+        fund_me.fund_zk_token(MINIMUM_FUNDING_AMOUNT_WEI)
+
+    eth_buckets = fund_me._storage.period_eth_bucket.get()
+    assert eth_buckets.get(bucket_index, 0) == 0
+    (totals,) = fund_me.get_period_totals(period, 1)
+    assert tuple(totals) == (period, 0, MINIMUM_FUNDING_AMOUNT_WEI, 1, 1)
+
+
+def test_period_eth_amount_overflow(fund_me, funders):
+    """
+    Test ETH funding reverts once the period total exceeds 128 bits.
+    """
+    amount = 2**127
+    for funder in funders[:2]:
+        boa.env.set_balance(funder, amount)
+
+    fund_me.fund_eth(sender=funders[0], value=amount)
+    with boa.reverts(fund_me.PERIOD_AMOUNT_OVERFLOW_ERROR()):
+        fund_me.fund_eth(sender=funders[1], value=amount)
+
+
+def test_period_zk_token_amount_overflow(fund_me, mock_zktoken, funders):
+    """
+    Test ZK token funding reverts once the period total exceeds 128 bits.
+    """
+    amount = 2**127
+    for funder in funders[:2]:
+        mock_zktoken.mint(funder, amount)
+        mock_zktoken.approve(fund_me.address, amount, sender=funder)
+
+    fund_me.fund_zk_token(amount, sender=funders[0])
+    with boa.reverts(fund_me.PERIOD_AMOUNT_OVERFLOW_ERROR()):
+        fund_me.fund_zk_token(amount, sender=funders[1])
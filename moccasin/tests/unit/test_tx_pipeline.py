@@ -0,0 +1,95 @@
+import pytest
+
+from boa.rpc import RPCError
+from utils.async_rpc import RpcCall
+from utils.constants import TX_PIPELINE_PRICE_BUMP_PERCENT
+from utils.tx_pipeline import TransactionPipeline, assign_nonces, bump_gas_price
+
+OWNER = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
+FUNDER = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def test_assign_nonces_is_consecutive_per_sender():
+    """
+    Test each sender's transactions get consecutive nonces, in their order.
+    """
+    next_nonces = {OWNER.lower(): 7, FUNDER.lower(): 0}
+    transactions = [
+        {"from": OWNER, "data": "0x01"},
+        {"from": FUNDER, "data": "0x02"},
+        {"from": OWNER.lower(), "data": "0x03"},
+        {"from": FUNDER, "data": "0x04"},
+    ]
+
+    assigned = assign_nonces(transactions, next_nonces)
+
+    assert [t["nonce"] for t in assigned] == ["0x7", "0x0", "0x8", "0x1"]
+    assert [t["data"] for t in assigned] == ["0x01", "0x02", "0x03", "0x04"]
+    assert next_nonces == {OWNER.lower(): 9, FUNDER.lower(): 2}
+    # The transactions are copied, not updated
+    assert "nonce" not in transactions[0]
+
+
+def test_bump_gas_price_replaces_pending_transaction():
+    """
+    Test a replacement pays more than the 10% nodes require, even at 1 wei.
+    """
+    gas_price = 1_000_000_000
+    assert bump_gas_price(gas_price) == (
+        gas_price * (100 + TX_PIPELINE_PRICE_BUMP_PERCENT) // 100
+    )
+    assert bump_gas_price(gas_price) * 10 >= gas_price * 11
+    assert bump_gas_price(1) == 2
+
+
+class StubNode:
+    """Answers the pipeline's RPC calls, rejecting the first `rejected` submissions.
+
+    The pending nonce of every sender is `pending_nonce` and every accepted
+    transaction is mined at once.
+    """
+
+    def __init__(self, pending_nonce: int, rejected: int):
+        self.pending_nonce = pending_nonce
+        self.rejected = rejected
+        self.submitted: list[dict] = []
+
+    async def read(self, calls):
+        results = []
+        for call in calls:
+            if call.method == "eth_sendTransaction":
+                if self.rejected:
+                    self.rejected -= 1
+                    raise RPCError("insufficient funds for gas * price + value", -32003)
+                self.submitted.append(call.params[0])
+                results.append(f"0x{len(self.submitted):064x}")
+            else:
+                results.append(
+                    {
+                        "eth_chainId": "0x7a69",
+                        "eth_gasPrice": "0x1",
+                        "eth_getTransactionCount": hex(self.pending_nonce),
+                        "eth_getTransactionReceipt": {"status": "0x1"},
+                    }[call.method]
+                )
+        return results
+
+
+def test_rejected_submission_does_not_skip_nonces():
+    """
+    Test transactions sent after a rejected submission reuse its nonce instead
+    of leaving a gap the node would wait on.
+    """
+    pipeline = TransactionPipeline("http://127.0.0.1:8545")
+    pipeline._reader = StubNode(pending_nonce=5, rejected=1)
+    calls = [
+        RpcCall("eth_sendTransaction", [{"from": FUNDER, "to": OWNER}], str)
+        for _ in range(2)
+    ]
+
+    with pytest.raises(RPCError):
+        pipeline.send_all(calls)
+    sent = pipeline.send_all(calls)
+
+    assert [transaction.nonce for transaction in sent] == [5, 6]
+    assert [t["nonce"] for t in pipeline._reader.submitted] == ["0x5", "0x6"]
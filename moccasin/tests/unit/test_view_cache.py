@@ -0,0 +1,83 @@
+import boa
+import pytest
+
+from moccasin.config import get_active_network
+from utils.constants import MINIMUM_FUNDING_AMOUNT_WEI
+from utils.rpc import count_round_trips
+from utils.view_cache import CachedContract, permanent_getters
+
+active_network = get_active_network()
+
+pytestmark = pytest.mark.skipif(
+    active_network.is_zksync,
+    reason="Permanent getters are read from the Vyper AST of the contract.",
+)
+
+
+def test_permanent_getters_are_constants(fund_me):
+    """
+    Test the getters of constants are permanent, and views of storage are not.
+    """
+    permanent = permanent_getters(fund_me)
+
+    assert {
+        "ZERO_ADDRESS_ERROR",
+        "get_minimal_funding_amount",
+        "get_max_funders_batch_size",
+        "get_max_funding_intents_batch_size",
+    } <= permanent
+    assert not permanent & {
+        "owner",
+        "get_zk_token_address",
+        "balance_of_eth",
+        "funder_count",
+        "get_current_period",
+        "get_funders_amounts",
+    }
+
+
+def test_views_are_cached_until_a_state_changing_call(fund_me, funders):
+    """
+    Test repeated views are served by the cache, and a funding through the
+    cache reads them again.
+    """
+    funder = funders[0]
+    views = CachedContract(fund_me)
+
+    with count_round_trips() as counter:
+        amounts = [views.get_funders_amounts([funder]) for _ in range(3)]
+        balance = views.balance_of_eth()
+        with boa.env.prank(funder):
+            views.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+        new_balance = views.balance_of_eth()
+
+    assert amounts[0][0].eth_amount == 0
+    assert amounts[2] is amounts[1] is amounts[0]
+    assert new_balance == balance + MINIMUM_FUNDING_AMOUNT_WEI
+    # Two views read, the balance twice, and the funding
+    assert counter.round_trips == 4
+    summary = views.stats.summary()
+    assert summary["get_funders_amounts"]["hits"] == 2
+    assert summary["balance_of_eth"]["misses"] == 2
+    assert summary["total"]["round_trips"] == 3
+
+
+def test_new_block_drops_views_but_not_constants(fund_me, funders):
+    """
+    Test views written around the cache are read again in a new block, and
+    constants are read once.
+    """
+    views = CachedContract(fund_me)
+    funder_count = views.funder_count()
+    minimal_amount = views.get_minimal_funding_amount()
+
+    with boa.env.prank(funders[0]):
+        fund_me.fund_eth(value=MINIMUM_FUNDING_AMOUNT_WEI)
+    # The funding did not go through the cache
+    assert views.funder_count() == funder_count
+
+    boa.env.time_travel(blocks=1)
+
+    assert views.funder_count() == funder_count + 1
+    assert views.get_minimal_funding_amount() == minimal_amount
+    assert views.stats.misses == {"funder_count": 2, "get_minimal_funding_amount": 1}
@@ -0,0 +1,193 @@
+import numpy as np
+import sqlite3
+
+from typing import Iterable, NamedTuple
+from utils.constants import (
+    ANALYTICS_AMOUNT_LIMB_BITS,
+    ANALYTICS_AMOUNT_LIMBS,
+    INDEXED_EVENTS,
+)
+
+# @dev Mask of a single limb of a split amount.
+_LIMB_MASK = (1 << ANALYTICS_AMOUNT_LIMB_BITS) - 1
+# @dev Typed, as NumPy 1 casts `uint64` scalars shifted by a Python int to float
+_LIMB_SHIFT = np.uint64(ANALYTICS_AMOUNT_LIMB_BITS)
+
+
+class EventColumns(NamedTuple):
+    """FundMe events in columnar arrays, one row per event in chain order.
+
+    Amounts are split into `ANALYTICS_AMOUNT_LIMBS` limbs of
+    `ANALYTICS_AMOUNT_LIMB_BITS` bits, least significant first, held in `uint64`
+    so that up to 2**32 amounts can be summed without overflow.
+    """
+
+    block_number: np.ndarray  # uint64
+    log_index: np.ndarray  # uint32
+    event: np.ndarray  # uint8, index in `INDEXED_EVENTS`
+    account: np.ndarray  # uint32, index in `accounts`
+    amount: np.ndarray  # uint64, shape (events, limbs)
+    accounts: list[str]
+
+
+class GroupTotals(NamedTuple):
+    """Amounts summed by key, the keys being sorted."""
+
+    keys: np.ndarray
+    amount: np.ndarray  # uint64 limbs, carried, shape (keys, limbs)
+
+
+################################################################
+#                           AMOUNTS                            #
+################################################################
+def split_amounts(amounts: Iterable[int]) -> np.ndarray:
+    """Splits 256-bit amounts into `uint64` limbs, least significant first.
+
+    :returns: np.ndarray: The limbs, shape (amounts, `ANALYTICS_AMOUNT_LIMBS`).
+    """
+    values = np.fromiter((int(amount) for amount in amounts), dtype=object)
+    limbs = np.empty((len(values), ANALYTICS_AMOUNT_LIMBS), dtype=np.uint64)
+    for i in range(ANALYTICS_AMOUNT_LIMBS):
+        limbs[:, i] = (values >> (i * ANALYTICS_AMOUNT_LIMB_BITS)) & _LIMB_MASK
+    return limbs
+
+
+def carry(limbs: np.ndarray) -> np.ndarray:
+    """Propagates the carries of summed limbs, so that each limb fits its bits again.
+
+    Carried limbs compare like the amounts they hold, most significant limb first.
+    A carry out of the last limb, beyond 256 bits, is dropped.
+    """
+    carried = limbs.copy()
+    for i in range(ANALYTICS_AMOUNT_LIMBS - 1):
+        carried[..., i + 1] += carried[..., i] >> _LIMB_SHIFT
+        carried[..., i] &= np.uint64(_LIMB_MASK)
+    return carried
+
+
+def join_amounts(limbs: np.ndarray) -> list[int]:
+    """Joins limbs back into exact Python integers, see `split_amounts`."""
+    values = np.zeros(limbs.shape[:-1], dtype=object)
+    for i in reversed(range(ANALYTICS_AMOUNT_LIMBS)):
+        values = (values << ANALYTICS_AMOUNT_LIMB_BITS) + limbs[..., i].astype(object)
+    # @dev a single amount is summed into a Python int, not an array
+    return np.asarray(values, dtype=object).tolist()
+
+
+def amounts_to_float(limbs: np.ndarray) -> np.ndarray:
+    """Approximates limbs as `float64`, e.g. to plot or bin amounts."""
+    weights = 2.0 ** (ANALYTICS_AMOUNT_LIMB_BITS * np.arange(ANALYTICS_AMOUNT_LIMBS))
+    return limbs.astype(np.float64) @ weights
+
+
+################################################################
+#                           LOADING                            #
+################################################################
+def columns_from_rows(
+    rows: Iterable[tuple[int, int, str, str, int | str]],
+) -> EventColumns:
+    """Builds the event columns from `(block_number, log_index, event, account,
+    amount)` rows in chain order, e.g. the events of `script/index_events.py`."""
+    rows = list(rows)
+    block_numbers, log_indexes, events, accounts, amounts = (
+        zip(*rows) if rows else ((),) * 5
+    )
+    event_ids = {event: i for i, event in enumerate(INDEXED_EVENTS)}
+    account_names, account_ids = np.unique(
+        np.array(accounts, dtype=object).astype(str), return_inverse=True
+    )
+    return EventColumns(
+        block_number=np.array(block_numbers, dtype=np.uint64),
+        log_index=np.array(log_indexes, dtype=np.uint32),
+        event=np.array([event_ids[event] for event in events], dtype=np.uint8),
+        account=account_ids.astype(np.uint32).reshape(-1),
+        amount=split_amounts(amounts),
+        accounts=account_names.tolist(),
+    )
+
+
+def load_events(connection: sqlite3.Connection, contract: str) -> EventColumns:
+    """Loads the indexed events of a contract from the event database."""
+    rows = connection.execute(
+        "SELECT block_number, log_index, event, account, amount FROM events "
+        "WHERE contract = ? ORDER BY block_number, log_index",
+        (contract,),
+    ).fetchall()
+    return columns_from_rows(rows)
+
+
+def select(columns: EventColumns, event: str) -> EventColumns:
+    """Keeps the events of a single kind, e.g. `FundedETH`."""
+    mask = columns.event == INDEXED_EVENTS.index(event)
+    return EventColumns(
+        block_number=columns.block_number[mask],
+        log_index=columns.log_index[mask],
+        event=columns.event[mask],
+        account=columns.account[mask],
+        amount=columns.amount[mask],
+        accounts=columns.accounts,
+    )
+
+
+################################################################
+#                           QUERIES                            #
+################################################################
+def group_sum(keys: np.ndarray, amount: np.ndarray) -> GroupTotals:
+    """Sums the amounts of each key, sorting the rows once and reducing the runs."""
+    if len(keys) == 0:
+        return GroupTotals(keys, amount[:0])
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    totals = np.add.reduceat(amount[order], starts, axis=0)
+    return GroupTotals(sorted_keys[starts], carry(totals))
+
+
+def funder_totals(columns: EventColumns, event: str = "FundedETH") -> GroupTotals:
+    """Sums the amounts funded by each funder, keyed by account index."""
+    funded = select(columns, event)
+    return group_sum(funded.account, funded.amount)
+
+
+def top_k(totals: GroupTotals, k: int) -> GroupTotals:
+    """Keeps the `k` largest totals, largest first.
+
+    Ties keep the smallest key first.
+    """
+    # @dev `lexsort` sorts by the last key first, i.e. the most significant limb
+    limbs = [totals.amount[:, i] for i in range(ANALYTICS_AMOUNT_LIMBS)]
+    order = np.lexsort([-totals.keys.astype(np.int64), *limbs])[::-1][:k]
+    return GroupTotals(totals.keys[order], totals.amount[order])
+
+
+def cumulative_sum(columns: EventColumns, event: str = "FundedETH") -> GroupTotals:
+    """Running total of an event's amounts, at each event, keyed by block number."""
+    selected = select(columns, event)
+    running = carry(np.cumsum(selected.amount, axis=0))
+    return GroupTotals(selected.block_number, running)
+
+
+def period_split(
+    columns: EventColumns, blocks_per_period: int
+) -> dict[str, GroupTotals]:
+    """Sums the amounts of every event kind per period of `blocks_per_period` blocks.
+
+    :returns: dict[str, GroupTotals]: The totals of each event kind, keyed by
+        period (`block_number // blocks_per_period`).
+    """
+    periods = columns.block_number // np.uint64(blocks_per_period)
+    return {
+        event: group_sum(periods[mask], columns.amount[mask])
+        for event, mask in (
+            (event, columns.event == i) for i, event in enumerate(INDEXED_EVENTS)
+        )
+    }
+
+
+def funder_distribution(totals: GroupTotals, edges: np.ndarray) -> np.ndarray:
+    """Counts the funders whose total falls in each `[edges[i], edges[i + 1])` bin.
+
+    :returns: np.ndarray: The number of funders per bin.
+    """
+    counts, _ = np.histogram(amounts_to_float(totals.amount), bins=edges)
+    return counts
@@ -0,0 +1,90 @@
+import requests
+import subprocess
+import time
+
+from boa.rpc import RPCError
+from typing import Any, Optional
+from urllib.parse import urlparse
+from utils.async_rpc import AsyncRpcReader, rpc_call
+from utils.constants import ANVIL_STARTUP_TIMEOUT_SECONDS
+
+
+class AnvilNode:
+    """An anvil node shared by a test session, started if none is running.
+
+    A node already answering at `url`, e.g. started by hand, is reused and left
+    running. Otherwise an empty anvil is launched once and stopped with `stop`.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._process: Optional[subprocess.Popen] = None
+        self._reader = AsyncRpcReader(url)
+
+    def rpc(self, method: str, *params) -> Any:
+        """Sends a single RPC call to the node, its result undecoded."""
+        (result,) = self._reader.read_all([rpc_call(method, *params)])
+        return result
+
+    def is_running(self) -> bool:
+        """Checks a node answers at the url."""
+        try:
+            self.rpc("eth_chainId")
+        except (requests.ConnectionError, RPCError):
+            return False
+        return True
+
+    def start(self) -> bool:
+        """Starts anvil unless a node already answers at the url.
+
+        :returns: bool: Whether anvil was started by this call.
+        :raises RuntimeError: If anvil does not answer within
+            `ANVIL_STARTUP_TIMEOUT_SECONDS`.
+        """
+        if self.is_running():
+            return False
+        address = urlparse(self.url)
+        command = ["anvil", "--host", address.hostname, "--port", str(address.port)]
+        self._process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + ANVIL_STARTUP_TIMEOUT_SECONDS
+        while not self.is_running():
+            if self._process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"anvil did not start at {self.url}")
+            time.sleep(0.05)
+        return True
+
+    def stop(self):
+        """Stops anvil if this node started it."""
+        self._reader.close()
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process = None
+
+    def snapshot(self) -> str:
+        """Snapshots the chain state.
+
+        :returns: str: The snapshot id, to revert to with `revert`.
+        """
+        return self.rpc("evm_snapshot")
+
+    def revert(self, snapshot_id: str):
+        """Reverts the chain to a snapshot, which anvil then forgets.
+
+        :raises RuntimeError: If the snapshot is unknown to the node.
+        """
+        if not self.rpc("evm_revert", snapshot_id):
+            raise RuntimeError(f"Unknown anvil snapshot {snapshot_id}")
+
+    def set_instant_mining(self):
+        """Mines a block per transaction, as soon as it is sent."""
+        self.rpc("evm_setIntervalMining", 0)
+        self.rpc("evm_setAutomine", True)
+
+    def set_block_time(self, seconds: int):
+        """Mines a block every `seconds`, like `anvil --block-time`."""
+        self.rpc("evm_setAutomine", False)
+        self.rpc("evm_setIntervalMining", seconds)
@@ -0,0 +1,98 @@
+import boa
+import hashlib
+import vyper
+
+from functools import cache
+from pathlib import Path
+
+from boa.contracts.vyper.vyper_contract import VyperDeployer
+from boa.interpret import compiler_data
+from boa.util.disk_cache import DiskCache
+from moccasin.config import get_config
+from utils.constants import (
+    ARTIFACTS_CACHE_DIR,
+    ARTIFACTS_COMPILER_SETTINGS,
+    ARTIFACTS_SOURCE_DIRS,
+)
+from vyper.compiler.settings import OptimizationLevel
+
+
+def sources_hash(project_root: Path) -> str:
+    """Hashes every Vyper source a contract of the project can import.
+
+    The contracts and their `lib/` dependencies (e.g. `snekmate`) are hashed
+    without being parsed, so any change to them invalidates the artifacts.
+
+    :returns: str: The hex digest of the sources.
+    """
+    digest = hashlib.sha256()
+    for source_dir in ARTIFACTS_SOURCE_DIRS:
+        for path in sorted((project_root / source_dir).rglob("*.vy*")):
+            digest.update(str(path.relative_to(project_root)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def compiler_settings() -> dict:
+    """Reads the compiler settings of the `[project]` table of `moccasin.toml`.
+
+    Only `ARTIFACTS_COMPILER_SETTINGS` are read, e.g. `optimize = "codesize"`
+    or `evm_version = "cancun"`. Settings left out keep the compiler defaults
+    or the pragmas of the contract.
+
+    :returns: dict: The settings, as keyword arguments of the compiler `Settings`.
+    """
+    project = get_config().project
+    settings = {
+        name: project[name] for name in ARTIFACTS_COMPILER_SETTINGS if name in project
+    }
+    if "optimize" in settings:
+        settings["optimize"] = OptimizationLevel.from_string(settings["optimize"])
+    return settings
+
+
+@cache
+def _load_contract(contract_path: str, deployer_class: type) -> VyperDeployer:
+    """Loads the deployer of a contract for a deployer class, see `load_contract`."""
+    project_root = Path(get_config().project_root)
+    filename = str(project_root / contract_path)
+    # @dev the compiler version salts the cache directory, sources and settings the key
+    compiler_version = f"{vyper.__version__}.{vyper.__commit__}"
+    disk_cache = DiskCache(project_root / ARTIFACTS_CACHE_DIR, compiler_version)
+    settings = compiler_settings()
+    cache_key = str(
+        (
+            contract_path,
+            sources_hash(project_root),
+            sorted(settings.items()),
+            repr(deployer_class),
+        )
+    )
+
+    def compile_contract():
+        with open(filename) as f:
+            data = compiler_data(
+                f.read(), filename, filename, deployer_class, **settings
+            )
+        # force compilation so that the bytecode is cached with the ABI
+        _ = data.bytecode, data.bytecode_runtime
+        return data
+
+    data = disk_cache.caching_lookup(cache_key, compile_contract)
+    return deployer_class(data, filename=filename)
+
+
+def load_contract(contract_path: str) -> VyperDeployer:
+    """Loads the deployer of a contract from the compiled artifacts cache.
+
+    Replaces the `from src import <contract>` import hook, which parses and
+    analyzes the contract and all its dependencies on every session even when
+    boa's own compilation cache is hit. Artifacts are keyed by the sources
+    hash, the compiler version and settings, see `compiler_settings`, and the
+    deployer class of the active env.
+
+    :param contract_path: The contract path relative to the project root.
+    :returns: VyperDeployer: The deployer, with `deploy` and `at`.
+    """
+    deployer_class = getattr(boa.env, "deployer_class", VyperDeployer)
+    return _load_contract(contract_path, deployer_class)
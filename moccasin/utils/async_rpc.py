@@ -0,0 +1,172 @@
+import asyncio
+import json
+
+import requests
+
+from typing import Any, Callable, NamedTuple, Sequence
+
+from boa.contracts.vyper.vyper_contract import VyperDeployer, vyper_object
+from boa.rpc import RPCError, to_bytes, to_hex, to_int
+from boa.util.abi import abi_decode, abi_encode
+from moccasin.boa_tools import VyperContract
+from requests.adapters import HTTPAdapter
+from utils.constants import RPC_BATCH_SIZE, RPC_MAX_CONNECTIONS, RPC_TIMEOUT_SECONDS
+from vyper.codegen.core import calculate_type_for_external_return
+from vyper.compiler.output import build_abi_output
+from vyper.semantics.types import TupleT
+
+
+class RpcCall(NamedTuple):
+    """A JSON-RPC request with the function decoding its result."""
+
+    method: str
+    params: list
+    decode: Callable[[Any], Any]
+
+
+def view_call(
+    contract: VyperContract, function_name: str, *args, block: str = "latest"
+) -> RpcCall:
+    """Builds the `eth_call` reading a view function of a contract at `block`.
+
+    `block` is a block tag or a hex block number, e.g. from `eth_blockNumber`.
+
+    :returns: RpcCall: The call, decoding the result like the contract would.
+    """
+    function = getattr(contract, function_name)
+    calldata = function.prepare_calldata(*args)
+    return_type = function.func_t.return_type
+
+    def decode(result: str) -> Any:
+        if return_type is None:
+            return None
+        # @dev same decoding as a boa contract call, single values are wrapped
+        abi_type = calculate_type_for_external_return(return_type).abi_type
+        decoded = abi_decode(abi_type.selector_name(), to_bytes(result))
+        if not isinstance(return_type, TupleT):
+            (decoded,) = decoded
+        return vyper_object(decoded, return_type)
+
+    params = [{"to": str(contract.address), "data": to_hex(calldata)}, block]
+    return RpcCall("eth_call", params, decode)
+
+
+def balance_call(address: str, block: str = "latest") -> RpcCall:
+    """Builds the `eth_getBalance` reading the ETH balance of an address at `block`."""
+    return RpcCall("eth_getBalance", [str(address), block], to_int)
+
+
+def transaction_call(
+    contract: VyperContract, function_name: str, *args, sender: str, value: int = 0
+) -> RpcCall:
+    """Builds the `eth_sendTransaction` calling a function of a contract.
+
+    The node signs the transaction, so `sender` must be unlocked or impersonated
+    on it, e.g. with `anvil_impersonateAccount`.
+
+    :returns: RpcCall: The call, its result being the transaction hash.
+    """
+    calldata = getattr(contract, function_name).prepare_calldata(*args)
+    transaction = {
+        "from": str(sender),
+        "to": str(contract.address),
+        "data": to_hex(calldata),
+        "value": hex(value),
+    }
+    return RpcCall("eth_sendTransaction", [transaction], str)
+
+
+def deploy_call(deployer: VyperDeployer, *args, sender: str) -> RpcCall:
+    """Builds the `eth_sendTransaction` deploying a contract.
+
+    The constructor arguments are encoded from the contract ABI, so they must be
+    of static or dynamic base types, not structs.
+
+    :returns: RpcCall: The call, its result being the transaction hash.
+    """
+    compiler_data = deployer.compiler_data
+    constructor_inputs = next(
+        (
+            item["inputs"]
+            for item in build_abi_output(compiler_data)
+            if item["type"] == "constructor"
+        ),
+        [],
+    )
+    schema = "(" + ",".join(arg["type"] for arg in constructor_inputs) + ")"
+    init_code = compiler_data.bytecode + abi_encode(schema, args)
+    transaction = {"from": str(sender), "data": to_hex(init_code), "value": "0x0"}
+    return RpcCall("eth_sendTransaction", [transaction], str)
+
+
+def rpc_call(method: str, *params) -> RpcCall:
+    """Builds any other RPC call, its result being returned undecoded."""
+    return RpcCall(method, list(params), lambda result: result)
+
+
+class AsyncRpcReader:
+    """Reads independent RPC calls concurrently, packed into JSON-RPC batches.
+
+    Calls are split into batches of `batch_size`, each sent as a single HTTP
+    request, and at most `max_connections` batches are in flight at once over
+    a pooled `requests` session.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        batch_size: int = RPC_BATCH_SIZE,
+        max_connections: int = RPC_MAX_CONNECTIONS,
+    ):
+        self._url = url
+        self._batch_size = batch_size
+        self._max_connections = max_connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    async def read(self, calls: Sequence[RpcCall]) -> list[Any]:
+        """Sends the calls in concurrent batches.
+
+        :returns: list[Any]: The decoded results, in the order of `calls`.
+        :raises RPCError: If any call fails.
+        """
+        semaphore = asyncio.Semaphore(self._max_connections)
+
+        async def send(batch: Sequence[RpcCall]) -> list[Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self._send_batch, batch)
+
+        batches = [
+            calls[i : i + self._batch_size]
+            for i in range(0, len(calls), self._batch_size)
+        ]
+        results = await asyncio.gather(*(send(batch) for batch in batches))
+        return [result for batch_results in results for result in batch_results]
+
+    def read_all(self, calls: Sequence[RpcCall]) -> list[Any]:
+        """Blocking version of `read` for synchronous callers such as tests."""
+        return asyncio.run(self.read(calls))
+
+    def close(self) -> None:
+        """Closes the pooled HTTP connections."""
+        self._session.close()
+
+    def _send_batch(self, batch: Sequence[RpcCall]) -> list[Any]:
+        """Sends a batch of calls as a single JSON-RPC batch request."""
+        payload = [
+            {"jsonrpc": "2.0", "method": call.method, "params": call.params, "id": i}
+            for i, call in enumerate(batch)
+        ]
+        response = self._session.post(
+            self._url, json=payload, timeout=RPC_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+
+        results = {}
+        for item in json.loads(response.text):
+            if "error" in item:
+                raise RPCError.from_json(item["error"])
+            results[item["id"]] = item["result"]
+        return [call.decode(results[i]) for i, call in enumerate(batch)]
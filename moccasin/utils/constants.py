@@ -11,17 +11,130 @@ ZK_INITIAL_SUPPLY = 10_000 * 10**18  # 10,000 tokens with 18 decimals
 ################################################################
 #                            TESTS                             #
 ################################################################
+# @dev Constants also declared in `fund_me.vy` must keep its values, as checked by
+#    `tests/unit/test_constants.py`.
 MINIMUM_FUNDING_AMOUNT_WEI = 1 * 10**14  # 0.0001 ETH in wei
 FUNDER_INITIAL_BALANCE_WEI = 1000 * 10**18  # 1000 ETH in wei
 ONE_ETH_IN_WEI = 1 * 10**18  # 1 ETH in wei
 FUNDER_COUNT = 5  # Number of funders to simulate in tests
 FUZZING_FUNDER_COUNT = 10  # Number of funders for fuzzing tests
+FUNDER_POOL_SIZE = 1_000  # Funded accounts fuzzed unit tests draw their funder from
+FUNDER_POOL_SEED = 0  # Seed of the funder pool addresses
+FUNDER_POOL_DIR = ".funder_pool"  # Funder pool snapshots, keyed by the ZK token state
 FUZZING_MAX_FUNDING_AMOUNT_WEI = 20 * 10**18  # 20 ETH in wei
 FUZZING_MAX_WITHDRAWAL_AMOUNT_WEI = 10 * 10**18  # 10 ETH in wei
+MAX_FUNDERS_BATCH_SIZE = 256  # Maximum number of funders per batched view call
+MAX_FUNDING_INTENTS_BATCH_SIZE = 100  # Maximum funding intents per relayed call
+INVARIANT_MAX_EXAMPLES = 256  # Examples of the invariant profile, split across shards
+INVARIANT_STEP_COUNT = 50  # Stateful steps per invariant example
+COVERAGE_FUZZ_CORPUS_PATH = ".fuzz_corpus/fund_me.json"  # Persistent rule sequences
+COVERAGE_FUZZ_EXECUTIONS = 100  # Sequences tried per run after the corpus replay
+
+################################################################
+#                             GAS                              #
+################################################################
+TX_INTRINSIC_GAS = 21_000  # Base gas paid by every transaction
+GAS_BASELINE_PATH = "gas_baseline.json"  # Committed gas of every external function
+GAS_REPORT_PATH = "gas_report"  # Gas report written as `.json` and `.md`
+GAS_REGRESSION_THRESHOLD = 0.05  # Allowed gas increase over the baseline (5%)
+
+# @dev Gas of the `balance_of_zk_token` storage mirror, paid on every ZK token
+#    deposit before the balance was read from the token instead. boa never commits
+#    its journal, so a later deposit prices the slot as dirty (5,000 gas on chain).
+ZK_BALANCE_MIRROR_FIRST_DEPOSIT_GAS = 22_100  # Cold SSTORE of the first ZK tokens
+ZK_BALANCE_MIRROR_DEPOSIT_GAS = 2_200  # Cold SLOAD and dirty SSTORE on later deposits
+
+################################################################
+#                        PERIOD TOTALS                         #
+################################################################
+PERIOD_SECONDS = 86_400  # Length of a period of the on-chain donation totals
+PERIOD_BUCKET_COUNT = 128  # Periods kept on-chain, older ones are overwritten
+PERIOD_TEST_FUNDINGS = 2_000  # Randomized fundings checked against the buckets
+PERIOD_TEST_MAX_GAP_SECONDS = 6 * 3_600  # Maximum time travel between two fundings
+
+################################################################
+#                            PERMIT                            #
+################################################################
+PERMIT_DEADLINE_SECONDS = 3_600  # Validity of the permits signed by the scripts
+PERMIT_LATENCY_ROUNDS = 5  # ZK token fundings timed per funding path
+RELAY_INTENTS = 300  # Funding intents submitted by the relayer per batch size
+RELAY_BATCH_SIZES = (1, 10, 100)  # Batch sizes compared by the relayer benchmark
+RELAY_SEED = 0  # Seed of the donors signing the funding intents
+
+################################################################
+#                           INDEXER                            #
+################################################################
+INDEXED_EVENTS = ("FundedETH", "FundedZKToken", "WithdrawEth", "WithdrawZK")
+INDEXER_DB_PATH = "fund_me_events.db"  # Default SQLite database of the indexer
+INDEXER_INITIAL_CHUNK_BLOCKS = 2_000  # Block range of the first eth_getLogs call
+INDEXER_MAX_CHUNK_BLOCKS = 100_000  # Upper bound of the adaptive block range
+INDEXER_TARGET_LOGS_PER_CHUNK = 5_000  # Logs per call the block range adapts to
+INDEXER_TEST_FUNDINGS = 2_000  # Number of fundings seeded by the indexer tests
+
+################################################################
+#                          ANALYTICS                           #
+################################################################
+# @dev Amounts are split into 8 limbs of 32 bits held in uint64, so sums of up to
+#    2**32 amounts stay exact before their carries are propagated.
+ANALYTICS_AMOUNT_LIMB_BITS = 32
+ANALYTICS_AMOUNT_LIMBS = 8
+ANALYTICS_BENCHMARK_EVENTS = 1_000_000  # Events of the synthetic benchmark dataset
+ANALYTICS_SEED_FUNDINGS = 5_000  # Fundings sent through FundMe to seed the dataset
+ANALYTICS_BLOCKS_PER_PERIOD = 7_200  # About a day of 12 second blocks
+ANALYTICS_TOP_K = 10  # Funders listed by the top funders query
+
+################################################################
+#                             RPC                              #
+################################################################
+RPC_BATCH_SIZE = 100  # Calls packed into a single JSON-RPC batch request
+RPC_MAX_CONNECTIONS = 8  # Pooled HTTP connections, i.e. batches in flight
+RPC_TIMEOUT_SECONDS = 60  # Timeout of a single HTTP request
+RPC_BENCHMARK_READS = 1_000  # Number of reads timed by the RPC benchmark
+
+################################################################
+#                         TX PIPELINE                          #
+################################################################
+TX_PIPELINE_GAS_LIMIT = 500_000  # Gas limit of pipelined calls not setting theirs
+TX_PIPELINE_PRICE_BUMP_PERCENT = 12  # Gas price raise of a replacement, nodes need 10%
+TX_PIPELINE_RESUBMIT_SECONDS = 12  # Wait for a receipt before replacing a transaction
+TX_PIPELINE_MAX_ATTEMPTS = 5  # Submissions of a transaction, replacements included
+TX_PIPELINE_POLL_SECONDS = 0.05  # Interval between receipt polls
+TX_PIPELINE_BENCHMARK_FUNDERS = 1_000  # Funders seeded by the pipeline benchmark
+
+################################################################
+#                          ARTIFACTS                           #
+################################################################
+ARTIFACTS_CACHE_DIR = ".artifacts"  # Compiled contracts cache, keyed by sources hash
+ARTIFACTS_SOURCE_DIRS = ("src", "lib")  # Vyper sources hashed into the cache key
+ARTIFACTS_COMPILER_SETTINGS = ("optimize", "evm_version")  # Read from `[project]`
 
 ################################################################
 #                         ANVIL STATE                          #
 ################################################################
+# @dev FundMe address in `fund_me_state.json`, deployed by `anvil_dump_state.py`.
+ANVIL_FUND_ME_ADDRESS = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+ANVIL_CHAIN_ID = 31337
+ANVIL_ACCOUNT_BALANCE_WEI = 10_000 * 10**18  # Balance of anvil's dev accounts
+ANVIL_BASE_FEE_WEI = 1_000_000_000  # Base fee of anvil's genesis block
+ANVIL_GAS_LIMIT = 30_000_000  # Block gas limit of anvil
+ANVIL_STARTUP_TIMEOUT_SECONDS = 10  # Wait for a launched anvil to answer
+STAGING_BLOCK_TIME_SECONDS = 1  # Block time of staging tests marked `block_time`
+
+# @dev Defaults of `generate_state_dump.py`, the dump only depends on them.
+STATE_DUMP_PATH = "fund_me_state.json"
+STATE_DUMP_FUNDERS = 100  # Generated funders
+STATE_DUMP_FUNDINGS = 300  # Generated fundings, each funder funds at least once
+STATE_DUMP_SEED = 0  # Seed of the funders and fundings
+STATE_DUMP_TIMESTAMP = 1_750_022_988  # Genesis timestamp of the generated state
+STATE_DUMP_MAX_FUNDING_MULTIPLIER = 100  # Fundings are up to 100x the minimum amount
+STATE_DUMP_FUNDING_RATIOS = (1, 1, 1)  # Weights of ETH, ZK token and combined fundings
+# @dev ETH funded in the high half of FundMe's packed funder record, ZK tokens below.
+FUNDED_ETH_SHIFT = 128
+STATE_DUMP_SCAN_WINDOW_BYTES = 64 * 2**20  # Dump bytes kept resident while scanning
+STATE_DUMP_BENCHMARK_PATH = "fund_me_state_large.json"  # Synthetic benchmark dump
+STATE_DUMP_BENCHMARK_BYTES = 500 * 2**20  # Size of the synthetic benchmark dump
+STATE_DUMP_FILLER_SLOTS = 10_000  # Storage slots of each filler contract
+
 ANVIL_DICT_ADDRESSES = {
     "owner": {
         "public": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
@@ -44,3 +157,12 @@ ANVIL_DICT_ADDRESSES = {
         "private": "0x47e179ec197488593b187f80a00eb0da91f1b9d0b13f8733639f19c30a34926a",
     },
 }
+
+################################################################
+#                          LOAD TEST                           #
+################################################################
+LOAD_TEST_FUNDERS = 10_000  # Donors of the simulated burst
+LOAD_TEST_FUNDINGS = 20_000  # Fundings sent by the donors
+LOAD_TEST_RATIOS = "1:1:1"  # Weights of ETH, ZK token and combined fundings
+LOAD_TEST_SEED = 0  # Seed of the donors and fundings
+LOAD_TEST_POLL_SECONDS = 0.05  # Interval between receipt polls on anvil
@@ -0,0 +1,244 @@
+import json
+import random
+import time
+
+from boa.profiling import global_profile
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional
+from vyper import ast as vy_ast
+
+
+class Step(NamedTuple):
+    """A rule of a state machine called with its arguments."""
+
+    rule: str
+    args: dict[str, int]
+
+
+class ArgRange(NamedTuple):
+    """The range of an integer rule argument, bounds included."""
+
+    min_value: int
+    max_value: int
+
+
+class CorpusEntry(NamedTuple):
+    """A rule sequence kept in the corpus, with the coverage it reached."""
+
+    steps: list[Step]
+    features: frozenset[str]
+
+
+class FuzzRun(NamedTuple):
+    """Measures of a coverage-guided fuzzing run."""
+
+    executions: int
+    features: frozenset[str]
+    cpu_seconds: float
+    new_entries: int
+    # @dev (CPU seconds, features covered) after each execution reaching new coverage
+    timeline: list[tuple[float, int]]
+
+
+################################################################
+#                            CORPUS                            #
+################################################################
+def load_corpus(path: Path) -> list[CorpusEntry]:
+    """Loads the corpus, empty when the file does not exist yet."""
+    if not path.exists():
+        return []
+    return [
+        CorpusEntry(
+            [Step(rule, args) for rule, args in entry["steps"]],
+            frozenset(entry["features"]),
+        )
+        for entry in json.loads(path.read_text())
+    ]
+
+
+def save_corpus(path: Path, corpus: list[CorpusEntry]):
+    """Writes the corpus, the steps and features of each entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entries = [
+        {
+            "steps": [[step.rule, step.args] for step in entry.steps],
+            "features": sorted(entry.features),
+        }
+        for entry in corpus
+    ]
+    path.write_text(json.dumps(entries, indent=1) + "\n")
+
+
+################################################################
+#                          MUTATIONS                           #
+################################################################
+def draw_arg(rng: random.Random, arg_range: ArgRange) -> int:
+    """Draws an argument, favouring the bounds where edge cases live."""
+    low, high = arg_range
+    choice = rng.random()
+    if choice < 0.25:
+        return rng.choice([low, high, min(low + 1, high), max(high - 1, low)])
+    if choice < 0.5 and high > 0:
+        # @dev log-uniform, so small amounts are drawn as often as large ones
+        magnitude = 2 ** rng.randint(0, high.bit_length())
+        return max(low, min(high, rng.randint(1, magnitude)))
+    return rng.randint(low, high)
+
+
+def random_step(rng: random.Random, rules: dict[str, dict[str, ArgRange]]) -> Step:
+    """Draws a rule and its arguments."""
+    rule = rng.choice(sorted(rules))
+    return Step(rule, {name: draw_arg(rng, r) for name, r in rules[rule].items()})
+
+
+def mutate(
+    rng: random.Random,
+    steps: list[Step],
+    corpus: list[CorpusEntry],
+    rules: dict[str, dict[str, ArgRange]],
+    max_steps: int,
+) -> list[Step]:
+    """Returns a mutated copy of a rule sequence, at most `max_steps` long.
+
+    One to four mutations are stacked: an argument redrawn, a step inserted,
+    deleted or duplicated, or the tail replaced by the tail of another entry.
+    """
+    steps = list(steps)
+    for _ in range(rng.randint(1, 4)):
+        mutation = rng.randrange(5)
+        index = rng.randrange(len(steps)) if steps else 0
+        if mutation == 0 and steps and steps[index].args:
+            rule, args = steps[index]
+            name = rng.choice(sorted(args))
+            args = {**args, name: draw_arg(rng, rules[rule][name])}
+            steps[index] = Step(rule, args)
+        elif mutation == 1 or not steps:
+            steps.insert(index, random_step(rng, rules))
+        elif mutation == 2 and len(steps) > 1:
+            del steps[index]
+        elif mutation == 3:
+            steps.insert(index, steps[index])
+        elif corpus:
+            other = rng.choice(corpus).steps
+            steps = steps[:index] + other[rng.randrange(len(other)) :]
+    return steps[:max_steps]
+
+
+################################################################
+#                           COVERAGE                           #
+################################################################
+def line_hits(contract_file: str) -> dict[int, int]:
+    """Counts the profiled executions of each line of a contract so far.
+
+    Lines are only profiled while `ProfilingGasMeter` is the gas meter.
+    """
+    hits: dict[int, int] = {}
+    for line, gas_data in global_profile().line_profiles.items():
+        if Path(line.module_path).name == contract_file:
+            hits[line.lineno] = hits.get(line.lineno, 0) + len(gas_data)
+    return hits
+
+
+def if_branches(
+    vyper_module: vy_ast.Module,
+) -> list[tuple[int, int, Optional[int]]]:
+    """Lists the `if` statements of a contract.
+
+    :returns: list: The line of each `if`, of the first statement of its body
+        and of its `else`, `None` without `else`.
+    """
+    return [
+        (
+            node.lineno,
+            node.body[0].lineno,
+            node.orelse[0].lineno if node.orelse else None,
+        )
+        for node in vyper_module.get_descendants(vy_ast.If)
+    ]
+
+
+def coverage_features(
+    hits: dict[int, int], branches: Iterable[tuple[int, int, Optional[int]]]
+) -> frozenset[str]:
+    """Turns the line hits of an execution into its coverage features.
+
+    A line is covered when hit. An `if` is covered taken when its body is hit,
+    and not taken when its `else` is hit or, without `else`, when the `if` is
+    hit more often than its body.
+    """
+    features = {f"line:{lineno}" for lineno, count in hits.items() if count}
+    for if_line, body_line, else_line in branches:
+        if hits.get(body_line, 0):
+            features.add(f"branch:{if_line}:taken")
+        skipped = (
+            hits.get(else_line, 0)
+            if else_line is not None
+            else hits.get(if_line, 0) > hits.get(body_line, 0)
+        )
+        if skipped:
+            features.add(f"branch:{if_line}:not_taken")
+    return frozenset(features)
+
+
+def diff_hits(before: dict[int, int], after: dict[int, int]) -> dict[int, int]:
+    """Returns the line hits between two `line_hits` reads."""
+    return {
+        lineno: count - before.get(lineno, 0)
+        for lineno, count in after.items()
+        if count > before.get(lineno, 0)
+    }
+
+
+################################################################
+#                            ENGINE                            #
+################################################################
+def fuzz(
+    execute: Callable[[list[Step]], frozenset[str]],
+    rules: dict[str, dict[str, ArgRange]],
+    corpus: list[CorpusEntry],
+    executions: int,
+    max_steps: int,
+    seed: Optional[int] = None,
+) -> FuzzRun:
+    """Runs coverage-guided fuzzing, the corpus being updated in place.
+
+    The corpus is replayed first, so a run starts from the coverage reached by
+    the previous ones. Then `executions` sequences are executed, each a
+    mutation of a corpus entry, or a random sequence while the corpus is
+    empty, and those reaching new coverage are added to the corpus.
+
+    :param execute: Runs a rule sequence, failing on a broken invariant, and
+        returns the coverage features it reached.
+    """
+    rng = random.Random(seed)
+    covered: set[str] = set()
+    timeline: list[tuple[float, int]] = []
+    start = time.process_time()
+
+    for i, entry in enumerate(corpus):
+        # @dev the contract may have changed since the entry was saved
+        corpus[i] = CorpusEntry(entry.steps, execute(entry.steps))
+        covered |= corpus[i].features
+    timeline.append((time.process_time() - start, len(covered)))
+
+    new_entries = 0
+    for _ in range(executions):
+        if corpus:
+            steps = mutate(rng, rng.choice(corpus).steps, corpus, rules, max_steps)
+        else:
+            length = rng.randint(1, max_steps)
+            steps = [random_step(rng, rules) for _ in range(length)]
+        features = execute(steps)
+        if not features <= covered:
+            corpus.append(CorpusEntry(steps, features))
+            covered |= features
+            new_entries += 1
+            timeline.append((time.process_time() - start, len(covered)))
+
+    return FuzzRun(
+        len(corpus) - new_entries + executions,
+        frozenset(covered),
+        time.process_time() - start,
+        new_entries,
+        timeline,
+    )
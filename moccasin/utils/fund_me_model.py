@@ -0,0 +1,90 @@
+class FundMeModel:
+    """Pure Python reference model of FundMe, stepped in lockstep with it.
+
+    It holds what the differential fuzzing compares exactly: the ETH and ZK
+    token balances of FundMe and of the accounts calling it, the totals funded
+    by each funder, the funders in order of first funding and the owner. The
+    state is integers keyed by address, so a step is a few dict updates, far
+    cheaper than the contract call it mirrors.
+
+    Operations mirror calls that succeed on the contract, callers check the
+    preconditions on the model first. Addresses whose balances or totals
+    changed are collected in `changed`, so only those are read back from the
+    contract after a step.
+    """
+
+    __slots__ = (
+        "owner",
+        "balance_of_eth",
+        "balance_of_zk_token",
+        "eth_balances",
+        "zk_token_balances",
+        "funded_eth",
+        "funded_zk_token",
+        "funders",
+        "changed",
+    )
+
+    def __init__(
+        self,
+        owner: str,
+        eth_balances: dict[str, int],
+        zk_token_balances: dict[str, int],
+    ):
+        """
+        :param owner: The owner of FundMe.
+        :param eth_balances: The ETH of the accounts calling FundMe, owner
+            included, copied.
+        :param zk_token_balances: Their ZK tokens, copied.
+        """
+        self.owner = owner
+        self.balance_of_eth = 0
+        self.balance_of_zk_token = 0
+        self.eth_balances = dict(eth_balances)
+        self.zk_token_balances = dict(zk_token_balances)
+        self.funded_eth: dict[str, int] = {}
+        self.funded_zk_token: dict[str, int] = {}
+        self.funders: list[str] = []
+        self.changed: set[str] = set()
+
+    @property
+    def funder_count(self) -> int:
+        """The number of funders, as `funder_count` of FundMe."""
+        return len(self.funders)
+
+    def fund(self, funder: str, eth_amount: int, zk_token_amount: int):
+        """Mirrors `fund_eth`, `fund_zk_token` or `fund`, from an approved funder."""
+        if funder not in self.funded_eth:
+            self.funders.append(funder)
+            self.funded_eth[funder] = 0
+            self.funded_zk_token[funder] = 0
+        self.funded_eth[funder] += eth_amount
+        self.funded_zk_token[funder] += zk_token_amount
+        self.eth_balances[funder] -= eth_amount
+        self.zk_token_balances[funder] -= zk_token_amount
+        self.balance_of_eth += eth_amount
+        self.balance_of_zk_token += zk_token_amount
+        self.changed.add(funder)
+
+    def transfer_zk_token(self, sender: str, amount: int):
+        """Mirrors a ZK token transfer to FundMe, outside of any funding."""
+        self.zk_token_balances[sender] -= amount
+        self.balance_of_zk_token += amount
+        self.changed.add(sender)
+
+    def withdraw(self, eth_amount: int, zk_token_amount: int):
+        """Mirrors `withdraw_eth`, `withdraw_zk_token` or `withdraw` by the owner."""
+        self.balance_of_eth -= eth_amount
+        self.balance_of_zk_token -= zk_token_amount
+        self.eth_balances[self.owner] += eth_amount
+        self.zk_token_balances[self.owner] += zk_token_amount
+        self.changed.add(self.owner)
+
+    def withdraw_all(self):
+        """Mirrors `withdraw_all` by the owner."""
+        self.withdraw(self.balance_of_eth, self.balance_of_zk_token)
+
+    def pop_changed(self) -> list[str]:
+        """Returns the addresses changed since the last call, and forgets them."""
+        changed, self.changed = list(self.changed), set()
+        return changed
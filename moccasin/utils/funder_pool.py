@@ -0,0 +1,130 @@
+import boa
+import hashlib
+import json
+import os
+
+from boa.util.abi import Address
+from eth_utils import keccak
+from moccasin.boa_tools import VyperContract
+from pathlib import Path
+
+
+def generate_pool_funders(pool_size: int, seed: int) -> list[str]:
+    """Derives the addresses of a funder pool from the seed.
+
+    The funders have no known private key, tests prank them.
+    """
+    return [
+        str(Address(keccak(f"fund-me-pool-{seed}-{i}".encode())[-20:]))
+        for i in range(pool_size)
+    ]
+
+
+def written_storage(address: str) -> dict[int, int]:
+    """Reads the storage slots of a contract that boa traced as written.
+
+    Slots written then reverted are traced too, they are read back as they are
+    now. Zero slots are left out.
+    """
+    slots = sorted(boa.env.sstore_trace.get(Address(address), set()))
+    storage = {slot: boa.env.get_storage(address, slot) for slot in slots}
+    return {slot: value for slot, value in storage.items() if value != 0}
+
+
+def pool_key(
+    zk_token_contract: VyperContract, pool_size: int, seed: int, balance: int
+) -> str:
+    """Hashes what a funder pool snapshot depends on.
+
+    A snapshot holds absolute storage values of the ZK token, so it only
+    applies to the token state it was built from: its address, code and
+    written storage, e.g. the total supply minted before the pool.
+
+    :returns: str: The hex digest, the name of the snapshot file.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{pool_size}-{seed}-{balance}".encode())
+    digest.update(Address(zk_token_contract.address).canonical_address)
+    digest.update(boa.env.get_code(zk_token_contract.address))
+    for slot, value in written_storage(zk_token_contract.address).items():
+        digest.update(slot.to_bytes(32, "big") + value.to_bytes(32, "big"))
+    return digest.hexdigest()
+
+
+def fund_pool(zk_token_contract: VyperContract, funders: list[str], balance: int):
+    """Gives each funder `balance` of ETH and of ZK tokens, minted by the sender."""
+    for funder in funders:
+        boa.env.set_balance(funder, balance)
+        zk_token_contract.mint(funder, balance)
+
+
+def snapshot_pool(
+    zk_token_contract: VyperContract,
+    funders: list[str],
+    balance: int,
+    storage_before: dict[int, int],
+) -> dict:
+    """Captures a funded pool, to be written back with `restore_pool`.
+
+    It holds the ETH of the funders and the ZK token slots changed since
+    `storage_before`, read with `written_storage`.
+    """
+    storage_after = written_storage(zk_token_contract.address)
+    changed = {
+        slot: value
+        for slot, value in storage_after.items()
+        if storage_before.get(slot) != value
+    }
+    return {
+        "funders": funders,
+        "balance": hex(balance),
+        "zk_token": {
+            "address": zk_token_contract.address,
+            "storage": {
+                f"0x{slot:064x}": f"0x{value:064x}" for slot, value in changed.items()
+            },
+        },
+    }
+
+
+def restore_pool(snapshot: dict) -> list[str]:
+    """Writes a pool snapshot into the active pyevm env, without running code."""
+    balance = int(snapshot["balance"], 16)
+    for funder in snapshot["funders"]:
+        boa.env.set_balance(funder, balance)
+    zk_token = snapshot["zk_token"]
+    for slot, value in zk_token["storage"].items():
+        boa.env.set_storage(zk_token["address"], int(slot, 16), int(value, 16))
+    return snapshot["funders"]
+
+
+def load_funder_pool(
+    zk_token_contract: VyperContract,
+    pool_size: int,
+    seed: int,
+    balance: int,
+    snapshot_dir: Path,
+) -> list[str]:
+    """Restores a funder pool from its snapshot, or funds and snapshots it.
+
+    Snapshots are named by `pool_key`, so a pool funded from another ZK token
+    state gets its own snapshot instead of replacing this one. Restoring sets
+    balances and storage directly, skipping the `pool_size` mint calls.
+
+    :returns: list[str]: The funders, each with `balance` of ETH and ZK tokens.
+    """
+    key = pool_key(zk_token_contract, pool_size, seed, balance)
+    path = snapshot_dir / f"{key}.json"
+    if path.exists():
+        return restore_pool(json.loads(path.read_text()))
+
+    funders = generate_pool_funders(pool_size, seed)
+    storage_before = written_storage(zk_token_contract.address)
+    fund_pool(zk_token_contract, funders, balance)
+    snapshot = snapshot_pool(zk_token_contract, funders, balance, storage_before)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    # @dev written aside then renamed, so parallel sessions never read half a file
+    partial_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    partial_path.write_text(json.dumps(snapshot) + "\n")
+    partial_path.replace(path)
+    return funders
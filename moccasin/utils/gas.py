@@ -0,0 +1,139 @@
+import boa
+import json
+import statistics
+
+from pathlib import Path
+from typing import NamedTuple
+
+from boa.profiling import global_profile
+from utils.constants import GAS_REGRESSION_THRESHOLD, TX_INTRINSIC_GAS
+
+
+class LineGas(NamedTuple):
+    """Gas of a source line, averaged over the profiled calls running it."""
+
+    fn_name: str
+    lineno: int
+    source: str
+    count: int
+    mean_gas: int
+
+
+def gas_used(transaction) -> int:
+    """Returns the gas paid by a single transaction, including the intrinsic cost.
+
+    The gas is read from the computations run by the transaction, as boa tracks
+    it. Warm/cold access counters are cleared first, so each call is priced as
+    its own transaction. The clear is journaled, unlike boa's `reset_gas_used`,
+    so it is undone by an enclosing `boa.env.anchor()` instead of breaking it.
+    boa never commits its journal, so storage written by earlier calls is
+    priced as dirty by SSTORE, as within a single transaction on chain.
+
+    :param transaction: A callable sending exactly one transaction.
+    """
+    boa.env.evm.vm.state._account_db._journal_accessed_state.clear()
+    gas_before = boa.env.get_gas_used()
+    transaction()
+    return TX_INTRINSIC_GAS + boa.env.get_gas_used() - gas_before
+
+
+def line_profile(contract_file: str) -> list[LineGas]:
+    """Reads the line profile of a contract from boa's global profile.
+
+    Calls are only line profiled while `ProfilingGasMeter` is the gas meter.
+
+    :param contract_file: The file name of the contract, e.g. `fund_me.vy`.
+    :returns: list[LineGas]: The profiled lines, by function and line number.
+    """
+    profile = global_profile()
+    lines = []
+    for line, gas_data in profile.line_profiles.items():
+        if Path(line.module_path).name != contract_file:
+            continue
+        source = profile.get_module_line(line.module_path, line.lineno).strip()
+        lines.append(
+            LineGas(
+                line.fn_name,
+                line.lineno,
+                source,
+                len(gas_data),
+                int(statistics.mean(gas_data)),
+            )
+        )
+    return sorted(lines, key=lambda line: (line.fn_name, line.lineno))
+
+
+def find_regressions(
+    measures: dict[str, int],
+    baseline: dict[str, int],
+    threshold: float = GAS_REGRESSION_THRESHOLD,
+) -> list[str]:
+    """Compares gas measures to the baseline.
+
+    :returns: list[str]: A message per measure above the baseline by more than
+        `threshold` (a ratio). Measures missing from the baseline are not checked.
+    """
+    return [
+        f"{name}: {gas} gas, baseline {baseline[name]} (+{gas / baseline[name] - 1:.1%})"
+        for name, gas in measures.items()
+        if name in baseline and gas > baseline[name] * (1 + threshold)
+    ]
+
+
+def read_baseline(path: Path) -> dict[str, int]:
+    """Reads the committed gas baseline.
+
+    :raises FileNotFoundError: If the baseline was not written yet.
+    """
+    return json.loads(path.read_text())
+
+
+def write_baseline(path: Path, measures: dict[str, int]):
+    """Writes the gas measures as the new baseline."""
+    path.write_text(json.dumps(measures, indent=2, sort_keys=True) + "\n")
+
+
+def write_gas_report(
+    path: Path,
+    measures: dict[str, int],
+    baseline: dict[str, int],
+    lines: list[LineGas],
+):
+    """Writes the gas report as `<path>.json` and `<path>.md`.
+
+    The JSON report holds the measures and their baseline. The Markdown report
+    adds the difference to the baseline and the line profile, unless `lines` is
+    empty.
+    """
+    report = {
+        name: {"gas": gas, "baseline": baseline.get(name)}
+        for name, gas in measures.items()
+    }
+    path.with_suffix(".json").write_text(json.dumps(report, indent=2) + "\n")
+
+    markdown = [
+        "# FundMe gas report",
+        "",
+        "| Call | Gas | Baseline | Diff |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    for name, gas in measures.items():
+        if name in baseline:
+            diff = f"{gas - baseline[name]:+} ({gas / baseline[name] - 1:+.1%})"
+            markdown.append(f"| `{name}` | {gas} | {baseline[name]} | {diff} |")
+        else:
+            markdown.append(f"| `{name}` | {gas} | - | new |")
+    if lines:
+        markdown += [
+            "",
+            "## Line profile",
+            "",
+            "| Function | Line | Source | Calls | Mean gas |",
+            "| --- | ---: | --- | ---: | ---: |",
+        ]
+    for line in lines:
+        source = line.source.replace("|", "\\|")
+        markdown.append(
+            f"| `{line.fn_name}` | {line.lineno} | `{source}` | {line.count} | {line.mean_gas} |"
+        )
+    path.with_suffix(".md").write_text("\n".join(markdown) + "\n")
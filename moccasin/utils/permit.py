@@ -0,0 +1,56 @@
+from eth_abi import encode
+from eth_account.signers.local import LocalAccount
+from eth_keys import keys
+from eth_utils import keccak
+from moccasin.boa_tools import VyperContract
+from typing import NamedTuple
+
+# @dev The type hash of EIP-2612 permits, as `_PERMIT_TYPE_HASH` in snekmate's erc20.
+PERMIT_TYPE_HASH = keccak(
+    text="Permit(address owner,address spender,uint256 value,uint256 nonce,"
+    "uint256 deadline)"
+)
+
+
+class PermitSignature(NamedTuple):
+    """The `v`, `r` and `s` parameters of a permit signature."""
+
+    v: int
+    r: bytes
+    s: bytes
+
+
+def sign_permit(
+    token: VyperContract,
+    account: LocalAccount,
+    spender: str,
+    amount: int,
+    deadline: int,
+) -> PermitSignature:
+    """Signs an EIP-2612 permit letting `spender` spend `amount` of the account tokens.
+
+    The permit is signed for the current nonce of the account and the domain
+    separator of the token, so it is only valid once and on that token.
+
+    :returns: PermitSignature: The signature, unpacked into `v`, `r` and `s`.
+    """
+    struct_hash = keccak(
+        encode(
+            ["bytes32", "address", "address", "uint256", "uint256", "uint256"],
+            [
+                PERMIT_TYPE_HASH,
+                account.address,
+                str(spender),
+                amount,
+                token.nonces(account.address),
+                deadline,
+            ],
+        )
+    )
+    digest = keccak(b"\x19\x01" + token.DOMAIN_SEPARATOR() + struct_hash)
+    signature = keys.PrivateKey(account.key).sign_msg_hash(digest)
+    return PermitSignature(
+        signature.v + 27,
+        signature.r.to_bytes(32, "big"),
+        signature.s.to_bytes(32, "big"),
+    )
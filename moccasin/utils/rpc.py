@@ -0,0 +1,85 @@
+import boa
+
+from contextlib import contextmanager
+from typing import Generator
+
+from boa.network import NetworkEnv
+
+
+class RoundTripCounter:
+    """Counts the RPC round trips sent by the active boa environment."""
+
+    def __init__(self):
+        self.round_trips: int = 0
+
+
+class TransactionCounter:
+    """Counts the transactions sent by the active boa environment."""
+
+    def __init__(self):
+        self.transactions: int = 0
+
+
+@contextmanager
+def _counting(target: object, name: str, count) -> Generator[None, None, None]:
+    """Calls `count` with the arguments of every call to `target.<name>`."""
+    original = getattr(target, name)
+    # @dev a counter opened within another one wraps the outer counting method
+    outer = vars(target).get(name)
+
+    def counted(*args, **kwargs):
+        count(*args, **kwargs)
+        return original(*args, **kwargs)
+
+    setattr(target, name, counted)
+    try:
+        yield
+    finally:
+        if outer is not None:
+            setattr(target, name, outer)
+        else:
+            # @dev drop the instance attribute so the class method is used again
+            delattr(target, name)
+
+
+@contextmanager
+def count_round_trips() -> Generator[RoundTripCounter, None, None]:
+    """Counts the RPC round trips issued within the context.
+
+    On a network environment (e.g. anvil) every HTTP request sent to the node is
+    a round trip, a JSON-RPC batch counting as one. On the in-memory pyevm
+    environment every contract call stands for the `eth_call` a node would serve.
+
+    :returns: RoundTripCounter: The counter, updated while the context is open.
+    """
+    counter = RoundTripCounter()
+    if isinstance(boa.env, NetworkEnv):
+        target, name = boa.env._rpc._session, "post"
+    else:
+        target, name = boa.env, "execute_code"
+
+    def count(*args, **kwargs):
+        counter.round_trips += 1
+
+    with _counting(target, name, count):
+        yield counter
+
+
+@contextmanager
+def count_transactions() -> Generator[TransactionCounter, None, None]:
+    """Counts the transactions sent within the context.
+
+    Every state-changing contract call is a transaction, signed and sent to the
+    node on a network environment, executed in memory on pyevm, where sender
+    nonces are not advanced. Views and deployments are not counted.
+
+    :returns: TransactionCounter: The counter, updated while the context is open.
+    """
+    counter = TransactionCounter()
+
+    def count(*args, is_modifying: bool = True, **kwargs):
+        if is_modifying:
+            counter.transactions += 1
+
+    with _counting(boa.env, "execute_code", count):
+        yield counter
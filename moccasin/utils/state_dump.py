@@ -0,0 +1,213 @@
+import json
+import mmap
+import re
+
+from boa.util.abi import Address
+from eth_utils import keccak
+from typing import Iterator, NamedTuple, Optional
+from utils.artifacts import load_contract
+from utils.constants import FUNDED_ETH_SHIFT, STATE_DUMP_SCAN_WINDOW_BYTES
+
+# @dev The zero-padded hex strings of a dump hold no braces, so objects can be
+#    delimited by counting braces without tokenizing the strings.
+_BRACE = re.compile(rb"[{}]")
+_ACCOUNTS_START = re.compile(rb'"accounts"\s*:\s*\{')
+_ACCOUNT_KEY = re.compile(rb'\s*"(0x[0-9a-fA-F]{40})"\s*:\s*(?=\{)')
+_ACCOUNT_SEPARATOR = re.compile(rb"\s*,")
+# @dev Longest account key a window boundary can cut, with generous whitespace.
+_KEY_OVERLAP = 256
+
+
+class FunderAmounts(NamedTuple):
+    """A funder and its funded amounts, as the `FunderAmounts` struct of FundMe."""
+
+    funder: str
+    eth_amount: int
+    zk_token_amount: int
+
+
+class FundMeState(NamedTuple):
+    """The FundMe state decoded from the storage of its account."""
+
+    owner: str
+    zk_token_address: str
+    balance_of_eth: int
+    funder_count: int
+    funders: list[FunderAmounts]  # in order of their first funding
+
+
+################################################################
+#                            READER                            #
+################################################################
+class StateDumpReader:
+    """Memory-mapped reader of an anvil state dump.
+
+    Accounts are located and parsed one at a time, so reading a single
+    contract's storage out of a dump of any size only parses that account.
+    Pages scanned past are released as the reader moves on, keeping the
+    resident memory within about `STATE_DUMP_SCAN_WINDOW_BYTES`.
+    """
+
+    def __init__(self, path: str, window: int = STATE_DUMP_SCAN_WINDOW_BYTES):
+        self._file = open(path, "rb")
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._window = window
+        self._released = 0
+        accounts = _ACCOUNTS_START.search(self._buffer)
+        if accounts is None:
+            self.close()
+            raise ValueError(f"{path} has no accounts, not an anvil state dump")
+        # @dev points at the `{` of the accounts map
+        self._accounts_start = accounts.end() - 1
+
+    def __enter__(self) -> "StateDumpReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._buffer.close()
+        self._file.close()
+
+    def iter_accounts(self) -> Iterator[tuple[str, dict]]:
+        """Yields the accounts of the dump in file order, parsing one at a time.
+
+        :returns: Iterator[tuple[str, dict]]: The lowercase address and the
+            `nonce`, `balance`, `code` and `storage` of each account.
+        """
+        position = self._accounts_start + 1
+        while key := _ACCOUNT_KEY.match(self._buffer, position):
+            end = self._object_end(key.end())
+            yield key.group(1).decode().lower(), json.loads(
+                self._buffer[key.end() : end]
+            )
+            self._release(end)
+            separator = _ACCOUNT_SEPARATOR.match(self._buffer, end)
+            if separator is None:
+                return
+            position = separator.end()
+
+    def read_account(self, address: str) -> Optional[dict]:
+        """Reads a single account, without parsing the accounts before it.
+
+        :returns: Optional[dict]: The account, `None` if not in the dump.
+        """
+        pattern = re.compile(rb'"%s"\s*:\s*(?=\{)' % str(address).lower().encode())
+        position = self._accounts_start
+        while position < len(self._buffer):
+            window_end = min(position + self._window, len(self._buffer))
+            key = pattern.search(self._buffer, position, window_end)
+            if key is not None:
+                end = self._object_end(key.end())
+                account = json.loads(self._buffer[key.end() : end])
+                self._release(end)
+                return account
+            self._release(window_end)
+            position = max(window_end - _KEY_OVERLAP, position + 1)
+        return None
+
+    def _object_end(self, start: int) -> int:
+        """Returns the offset past the JSON object starting at `start`."""
+        depth = 0
+        for brace in _BRACE.finditer(self._buffer, start):
+            depth += 1 if brace.group() == b"{" else -1
+            if depth == 0:
+                return brace.end()
+            if brace.start() - self._released > 2 * self._window:
+                self._release(brace.start())
+        raise ValueError(f"Unterminated object at offset {start}")
+
+    def _release(self, offset: int):
+        """Drops the mapped pages before `offset` from the resident memory.
+
+        The file stays in the page cache, only this process stops holding it.
+        """
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        end = offset - offset % mmap.PAGESIZE
+        if end - self._released >= self._window:
+            length = end - self._released
+            self._buffer.madvise(mmap.MADV_DONTNEED, self._released, length)
+            self._released = end
+
+
+################################################################
+#                           DECODING                           #
+################################################################
+def fund_me_storage_slots() -> dict[str, int]:
+    """Reads the storage slots of FundMe's variables from its compiled layout.
+
+    Variables of initialized modules are prefixed by the module, e.g.
+    `ownable.owner`.
+    """
+    layout = load_contract("src/fund_me.vy").compiler_data.storage_layout
+    slots: dict[str, int] = {}
+
+    def flatten(entries: dict, prefix: str):
+        for name, entry in entries.items():
+            if not isinstance(entry, dict):
+                continue
+            if "slot" in entry:
+                slots[prefix + name] = entry["slot"]
+            else:
+                flatten(entry, f"{prefix}{name}.")
+
+    flatten(layout.get("storage_layout", layout), "")
+    return slots
+
+
+def hashmap_slot(slot: int, key: int) -> int:
+    """Returns the storage slot of `key` in the `HashMap` at `slot`, as Vyper does."""
+    digest = keccak(slot.to_bytes(32, "big") + key.to_bytes(32, "big"))
+    return int.from_bytes(digest, "big")
+
+
+def decode_fund_me_storage(
+    storage: dict[str, str], slots: dict[str, int]
+) -> FundMeState:
+    """Decodes the funders, balances and owner of a FundMe account's storage.
+
+    :param storage: The `storage` of the account in the dump, zero slots may be
+        left out.
+    :param slots: The slots of FundMe's variables, see `fund_me_storage_slots`.
+    """
+    values = {int(slot, 16): int(value, 16) for slot, value in storage.items()}
+
+    def read(slot: int) -> int:
+        return values.get(slot, 0)
+
+    def read_address(slot: int) -> str:
+        return str(Address(read(slot).to_bytes(20, "big")))
+
+    funder_count = read(slots["funder_count"])
+    funders = []
+    for i in range(funder_count):
+        funder = read_address(hashmap_slot(slots["funder_at_index"], i))
+        record = read(hashmap_slot(slots["funder_to_funded"], int(funder, 16)))
+        funders.append(
+            FunderAmounts(
+                funder,
+                record >> FUNDED_ETH_SHIFT,
+                record & ((1 << FUNDED_ETH_SHIFT) - 1),
+            )
+        )
+    return FundMeState(
+        owner=read_address(slots["ownable.owner"]),
+        zk_token_address=read_address(slots["zk_token_address"]),
+        balance_of_eth=read(slots["balance_of_eth"]),
+        funder_count=funder_count,
+        funders=funders,
+    )
+
+
+def read_fund_me_state(path: str, fund_me_address: str) -> Optional[FundMeState]:
+    """Decodes the FundMe state of a dump, only parsing the FundMe account.
+
+    :returns: Optional[FundMeState]: The state, `None` if FundMe is not in the dump.
+    """
+    with StateDumpReader(path) as reader:
+        account = reader.read_account(fund_me_address)
+    if account is None:
+        return None
+    return decode_fund_me_storage(account["storage"], fund_me_storage_slots())
@@ -0,0 +1,248 @@
+import asyncio
+import boa
+import time
+
+from boa.rpc import RPCError, to_hex, to_int
+from moccasin.config import get_active_network
+from moccasin.moccasin_account import MoccasinAccount
+from typing import NamedTuple, Sequence
+from utils.async_rpc import AsyncRpcReader, RpcCall, rpc_call
+from utils.constants import (
+    RPC_BATCH_SIZE,
+    RPC_MAX_CONNECTIONS,
+    TX_PIPELINE_GAS_LIMIT,
+    TX_PIPELINE_MAX_ATTEMPTS,
+    TX_PIPELINE_POLL_SECONDS,
+    TX_PIPELINE_PRICE_BUMP_PERCENT,
+    TX_PIPELINE_RESUBMIT_SECONDS,
+)
+
+
+class SentTransaction(NamedTuple):
+    """A transaction confirmed by the pipeline."""
+
+    sender: str
+    nonce: int
+    tx_hash: str  # of the version mined, replacements included
+    receipt: dict
+    attempts: int  # submissions, replacements included
+    latency: float  # from the first submission to the confirmation, in seconds
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the transaction was mined without reverting."""
+        return self.receipt["status"] == "0x1"
+
+
+def assign_nonces(
+    transactions: Sequence[dict], next_nonces: dict[str, int]
+) -> list[dict]:
+    """Pre-assigns consecutive nonces to the transactions of each sender.
+
+    Transactions of a sender keep their order, so a transaction may depend on an
+    earlier one of the same sender, e.g. `fund_zk_token` on `approve`.
+
+    :param next_nonces: The next nonce of each lowercase sender, advanced past
+        the assigned ones.
+    :returns: list[dict]: Copies of the transactions with their `nonce` set.
+    """
+    assigned = []
+    for transaction in transactions:
+        sender = transaction["from"].lower()
+        assigned.append({**transaction, "nonce": hex(next_nonces[sender])})
+        next_nonces[sender] += 1
+    return assigned
+
+
+def bump_gas_price(gas_price: int) -> int:
+    """Returns the gas price of a transaction replacing one paying `gas_price`.
+
+    Nodes only accept a replacement of a pending transaction paying at least 10%
+    more, hence `TX_PIPELINE_PRICE_BUMP_PERCENT`.
+    """
+    return gas_price + max(gas_price * TX_PIPELINE_PRICE_BUMP_PERCENT // 100, 1)
+
+
+class TransactionPipeline:
+    """Sends transactions with pre-assigned nonces, many of them in flight.
+
+    The nonce of each sender is read once per `send`, from its pending
+    transaction count, and then assigned locally, so the transactions of a
+    sender are all submitted without waiting for the previous one to be mined.
+    Submissions are packed into JSON-RPC batches while receipts are polled
+    concurrently. Transactions of `accounts` are signed locally and sent with
+    `eth_sendRawTransaction`, the others with `eth_sendTransaction`, so their
+    sender must be unlocked or impersonated on the node. The batches are in
+    flight at once, so only the order of each sender's transactions is kept: a
+    transaction depending on another sender's must go in a later `send`.
+
+    A transaction without a receipt after `TX_PIPELINE_RESUBMIT_SECONDS` is
+    submitted again with the same nonce and a bumped gas price, which replaces
+    it when stuck in the mempool and resends it when the node dropped it. Every
+    submitted version is watched, since any of them may be the one mined.
+    """
+
+    def __init__(self, url: str, accounts: Sequence[MoccasinAccount] = ()):
+        self._reader = AsyncRpcReader(url)
+        self._accounts = {account.address.lower(): account for account in accounts}
+        self._next_nonces: dict[str, int] = {}
+
+    async def send(self, calls: Sequence[RpcCall]) -> list[SentTransaction]:
+        """Sends the transactions and waits for all of them to be mined.
+
+        :param calls: Transactions built by `transaction_call` or `deploy_call`.
+        :returns: list[SentTransaction]: The mined transactions, in the order of
+            `calls`, reverted ones included.
+        :raises RPCError: If the node rejects a submission, e.g. for lack of
+            funds. The nonces of the senders are then read again by the next
+            `send`, so the rejected ones are not skipped.
+        :raises RuntimeError: If a transaction is still not mined after
+            `TX_PIPELINE_MAX_ATTEMPTS` submissions.
+        """
+        transactions = assign_nonces(
+            await self._prepare([call.params[0] for call in calls]),
+            self._next_nonces,
+        )
+        hashes: list[list[str]] = [[] for _ in transactions]
+        attempts = [0] * len(transactions)
+        first_sent = [0.0] * len(transactions)
+        last_sent = [0.0] * len(transactions)
+        mined: dict[int, SentTransaction] = {}
+        sending = True
+
+        async def submit():
+            nonlocal sending
+            round_size = RPC_BATCH_SIZE * RPC_MAX_CONNECTIONS
+            for start in range(0, len(transactions), round_size):
+                indexes = range(start, min(start + round_size, len(transactions)))
+                sent = time.perf_counter()
+                try:
+                    tx_hashes = await self._reader.read(
+                        [self._submission(transactions[i]) for i in indexes]
+                    )
+                except RPCError:
+                    # @dev a rejected transaction leaves its nonce, and the later
+                    #   ones of its sender, unused: read them again next time
+                    for transaction in transactions:
+                        self._next_nonces.pop(transaction["from"].lower(), None)
+                    raise
+                for i, tx_hash in zip(indexes, tx_hashes):
+                    hashes[i].append(tx_hash)
+                    attempts[i] = 1
+                    first_sent[i] = last_sent[i] = sent
+            sending = False
+
+        async def resubmit(i: int):
+            if attempts[i] >= TX_PIPELINE_MAX_ATTEMPTS:
+                raise RuntimeError(
+                    f"Transaction {transactions[i]['nonce']} of "
+                    f"{transactions[i]['from']} not mined after {attempts[i]} attempts"
+                )
+            gas_price = bump_gas_price(to_int(transactions[i]["gasPrice"]))
+            transactions[i] = {**transactions[i], "gasPrice": hex(gas_price)}
+            attempts[i] += 1
+            last_sent[i] = time.perf_counter()
+            try:
+                (tx_hash,) = await self._reader.read(
+                    [self._submission(transactions[i])]
+                )
+            except RPCError:
+                # @dev e.g. "nonce too low" when an earlier version was just mined,
+                #   its receipt is then found by the next poll
+                return
+            hashes[i].append(tx_hash)
+
+        async def confirm():
+            while sending or len(mined) < len(transactions):
+                watched = [
+                    (i, tx_hash)
+                    for i, versions in enumerate(hashes)
+                    if i not in mined
+                    for tx_hash in versions
+                ]
+                receipts = await self._reader.read(
+                    [rpc_call("eth_getTransactionReceipt", h) for _, h in watched]
+                )
+                now = time.perf_counter()
+                for (i, tx_hash), receipt in zip(watched, receipts):
+                    if receipt is not None and i not in mined:
+                        mined[i] = SentTransaction(
+                            transactions[i]["from"],
+                            to_int(transactions[i]["nonce"]),
+                            tx_hash,
+                            receipt,
+                            attempts[i],
+                            now - first_sent[i],
+                        )
+                for i in {i for i, _ in watched} - mined.keys():
+                    if now - last_sent[i] > TX_PIPELINE_RESUBMIT_SECONDS:
+                        await resubmit(i)
+                await asyncio.sleep(TX_PIPELINE_POLL_SECONDS)
+
+        await asyncio.gather(submit(), confirm())
+        return [mined[i] for i in range(len(transactions))]
+
+    def send_all(self, calls: Sequence[RpcCall]) -> list[SentTransaction]:
+        """Blocking version of `send` for synchronous callers such as scripts."""
+        return asyncio.run(self.send(calls))
+
+    def close(self) -> None:
+        """Closes the pooled HTTP connections."""
+        self._reader.close()
+
+    async def _prepare(self, transactions: Sequence[dict]) -> list[dict]:
+        """Reads the chain id, gas price and sender nonces, in a single batch.
+
+        The nonces of the senders are read from their pending transaction count
+        and only moved back after a rejected submission, so transactions sent
+        outside the pipeline are accounted for. Deployments get their gas estimated, calls get
+        `TX_PIPELINE_GAS_LIMIT` unless they set their own, since a call may only
+        succeed once an earlier transaction of the batch is mined.
+
+        :returns: list[dict]: The transactions with their gas, gas price and
+            chain id set.
+        """
+        senders = sorted({transaction["from"].lower() for transaction in transactions})
+        deployments = [i for i, t in enumerate(transactions) if "to" not in t]
+        results = await self._reader.read(
+            [rpc_call("eth_chainId"), rpc_call("eth_gasPrice")]
+            + [rpc_call("eth_getTransactionCount", s, "pending") for s in senders]
+            + [rpc_call("eth_estimateGas", transactions[i]) for i in deployments]
+        )
+        chain_id, gas_price = results[:2]
+        for sender, nonce in zip(senders, results[2 : 2 + len(senders)]):
+            self._next_nonces[sender] = max(
+                self._next_nonces.get(sender, 0), to_int(nonce)
+            )
+        gas = dict(zip(deployments, results[2 + len(senders) :]))
+        return [
+            {
+                **transaction,
+                "gas": transaction.get("gas", gas.get(i, hex(TX_PIPELINE_GAS_LIMIT))),
+                "gasPrice": gas_price,
+                "chainId": chain_id,
+            }
+            for i, transaction in enumerate(transactions)
+        ]
+
+    def _submission(self, transaction: dict) -> RpcCall:
+        """Builds the RPC call submitting a transaction, signed if we can."""
+        account = self._accounts.get(transaction["from"].lower())
+        if account is None:
+            return RpcCall("eth_sendTransaction", [transaction], str)
+        unsigned = {key: value for key, value in transaction.items() if key != "from"}
+        signed = account.sign_transaction(unsigned)
+        return RpcCall("eth_sendRawTransaction", [to_hex(signed.raw_transaction)], str)
+
+
+def network_pipeline(
+    accounts: Sequence[MoccasinAccount] = (),
+) -> TransactionPipeline:
+    """Builds a pipeline to the active network.
+
+    It signs with `accounts` and with the accounts added to boa's network env,
+    the active account included.
+    """
+    return TransactionPipeline(
+        get_active_network().url, [*boa.env._accounts.values(), *accounts]
+    )
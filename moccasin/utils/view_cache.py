@@ -0,0 +1,190 @@
+import boa
+
+from boa.contracts.vyper.vyper_contract import VyperFunction
+from moccasin.boa_tools import VyperContract
+from typing import Any
+from utils.rpc import count_round_trips
+from vyper import ast as vy_ast
+from vyper.semantics.analysis.base import StateMutability
+
+
+class ViewCacheStats:
+    """Counts, per function, the view calls served by a cache and forwarded.
+
+    A forwarded call is a miss, its RPC round trips being counted with
+    `count_round_trips`: one per call on the in-memory pyevm environment,
+    the requests actually sent to the node on a network environment.
+    """
+
+    def __init__(self):
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+        self.round_trips: dict[str, int] = {}
+        self.invalidations: int = 0
+
+    def record_hit(self, function_name: str):
+        self.hits[function_name] = self.hits.get(function_name, 0) + 1
+
+    def record_miss(self, function_name: str, round_trips: int):
+        self.misses[function_name] = self.misses.get(function_name, 0) + 1
+        self.round_trips[function_name] = (
+            self.round_trips.get(function_name, 0) + round_trips
+        )
+
+    def summary(self) -> dict[str, dict]:
+        """Breaks the calls down per function, the busiest first.
+
+        :returns: dict[str, dict]: The hits, misses, hit rate and RPC round
+            trips of each function, and their totals under `total`.
+        """
+        names = sorted(
+            self.hits.keys() | self.misses.keys(),
+            key=lambda name: -(self.hits.get(name, 0) + self.misses.get(name, 0)),
+        )
+        rows = {name: self._row(name) for name in names}
+        hits = sum(self.hits.values())
+        calls = hits + sum(self.misses.values())
+        rows["total"] = {
+            "hits": hits,
+            "misses": calls - hits,
+            "hit_rate": hits / calls if calls else 0.0,
+            "round_trips": sum(self.round_trips.values()),
+        }
+        return rows
+
+    def _row(self, function_name: str) -> dict:
+        hits = self.hits.get(function_name, 0)
+        misses = self.misses.get(function_name, 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses),
+            "round_trips": self.round_trips.get(function_name, 0),
+        }
+
+
+def permanent_getters(contract: VyperContract) -> frozenset[str]:
+    """Lists the external functions of a contract whose result never changes.
+
+    Those are `pure` functions, and views returning a literal or a `constant`
+    or `immutable` variable, e.g. the getters of public constants, which the
+    compiler folds into literals.
+    """
+    vyper_module = contract.compiler_data.annotated_vyper_module
+    fixed_names = {
+        declaration.target.id
+        for declaration in vyper_module.get_children(vy_ast.VariableDecl)
+        if declaration.is_constant or declaration.is_immutable
+    }
+    permanent = set()
+    for name, function in vars(contract).items():
+        if not isinstance(function, VyperFunction):
+            continue
+        if function.func_t.mutability == StateMutability.PURE:
+            permanent.add(name)
+            continue
+        body = function.fn_ast.body
+        if len(body) != 1 or not isinstance(body[0], vy_ast.Return):
+            continue
+        value = body[0].value
+        if isinstance(value, vy_ast.Constant) or (
+            isinstance(value, vy_ast.Name) and value.id in fixed_names
+        ):
+            permanent.add(name)
+    return frozenset(permanent)
+
+
+def freeze(value: Any) -> Any:
+    """Turns call arguments into a hashable cache key, lists becoming tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    return value
+
+
+class CachedFunction:
+    """A function of a `CachedContract`, any other attribute being the wrapped
+    `VyperFunction`'s, e.g. `prepare_calldata`."""
+
+    def __init__(self, cached_contract: "CachedContract", function, is_view: bool):
+        self._cached_contract = cached_contract
+        self._function = function
+        self._is_view = is_view
+
+    def __call__(self, *args, **kwargs):
+        if self._is_view:
+            return self._cached_contract._read(self._function, args, kwargs)
+        self._cached_contract.invalidate()
+        return self._function(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._function, name)
+
+
+class CachedContract:
+    """Read-through cache of the view functions of a contract.
+
+    Views are cached per block number, function and arguments. Calling a
+    state-changing function through the wrapper drops the cached views of the
+    contract, and so does a new block, the block boa executes views at on a
+    network environment. Getters of constants and immutables, see
+    `permanent_getters`, are memoized for the life of the wrapper.
+
+    State written around the wrapper within the same block, e.g. by a call to
+    the unwrapped contract or by reverting to a snapshot, is not seen: call
+    `invalidate` then. Any attribute that is not a function is the wrapped
+    contract's, e.g. `address`.
+    """
+
+    def __init__(self, contract: VyperContract, stats: ViewCacheStats | None = None):
+        self._contract = contract
+        self._permanent_getters = permanent_getters(contract)
+        self._permanent: dict[tuple, Any] = {}
+        self._views: dict[tuple, Any] = {}
+        self._views_block: int | None = None
+        self.stats = stats if stats is not None else ViewCacheStats()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._contract, name)
+        if not isinstance(attribute, VyperFunction):
+            return attribute
+        is_view = attribute.func_t.mutability in (
+            StateMutability.VIEW,
+            StateMutability.PURE,
+        )
+        function = CachedFunction(self, attribute, is_view)
+        # @dev set on the instance, so later lookups skip `__getattr__`
+        setattr(self, name, function)
+        return function
+
+    @property
+    def contract(self) -> VyperContract:
+        """The wrapped contract, to call it around the cache."""
+        return self._contract
+
+    def invalidate(self):
+        """Drops the cached views, permanent getters being kept."""
+        self._views.clear()
+        self.stats.invalidations += 1
+
+    def _read(self, function, args: tuple, kwargs: dict) -> Any:
+        name = function.fn_ast.name
+        key = (name, freeze(args), freeze(kwargs))
+        if name in self._permanent_getters:
+            cache = self._permanent
+        else:
+            block_number = boa.env.evm.patch.block_number
+            if block_number != self._views_block:
+                self._views.clear()
+                self._views_block = block_number
+            cache = self._views
+
+        if key in cache:
+            self.stats.record_hit(name)
+            return cache[key]
+        with count_round_trips() as counter:
+            result = function(*args, **kwargs)
+        self.stats.record_miss(name, counter.round_trips)
+        cache[key] = result
+        return result